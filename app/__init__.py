@@ -1,44 +1,189 @@
-from pathlib import Path
+import threading
+from os import getenv
+from typing import TYPE_CHECKING, Any
 
-from flasgger import Swagger
-from flask import Flask, send_from_directory
+from app.core.warmup import Warmup, WarmupSettings
 
-from app.interface.api.health import health_bp
-from app.interface.api.v1.routes import v1_bp
+if TYPE_CHECKING:
+    from flask import Flask
 
+    from app.infrastructure.health.readiness import ReadinessProbe
 
-def create_app() -> Flask:
-    app = Flask(__name__, static_folder=None)
 
-    # Static files for the demo client
-    public_dir = str(Path(__file__).parent.parent / "public")
+def create_app() -> "Flask":
+    # Flask and the blueprints are imported here rather than at module
+    # level, so ``import app.<module>`` (CLIs, workers, tests) stays cheap
+    from flask import Flask
+
+    from app.infrastructure.metrics.registry import MetricsSettings
+    from app.interface.api.admin import (
+        AdminSettings,
+        admin_bp,
+        install_request_profiler,
+    )
+    from app.interface.api.compression import (
+        CompressionSettings,
+        install_compression,
+    )
+    from app.interface.api.docs import install_docs
+    from app.interface.api.health import health_bp
+    from app.interface.api.json_provider import FastJSONProvider
+    from app.interface.api.static_files import static_bp
+    from app.interface.api.v1.routes import list_customers_async, v1_bp
+    from app.interface.api.well_known import well_known_bp
+    from app.user_routes import blueprint as users_bp
+
+    app = Flask(__name__, static_folder=None)
+    app.json = FastJSONProvider(app)
+    if MetricsSettings().enabled:
+        from app.interface.api.metrics import (
+            install_request_metrics,
+            metrics_bp,
+        )
 
-    @app.route("/static/<path:path>")
-    def send_static(path):
-        return send_from_directory(public_dir, path)
+        install_request_metrics(app)
+        app.register_blueprint(metrics_bp)
+    # Registered after the metrics hook so sizes are measured compressed
+    if CompressionSettings().enabled:
+        install_compression(app)
 
+    # Static files for the demo client
+    app.register_blueprint(static_bp)
     app.register_blueprint(health_bp)
+    if AdminSettings().enabled:
+        install_request_profiler(app)
+        app.register_blueprint(admin_bp, url_prefix="/admin")
+    app.register_blueprint(well_known_bp)
     app.register_blueprint(v1_bp, url_prefix="/v1")
+    app.register_blueprint(users_bp, url_prefix="/users")
 
-    Swagger(
-        app,
-        config={
-            "headers": [],
-            "specs": [
-                {
-                    "endpoint": "swagger",
-                    "route": "/swagger.json",
-                    "rule_filter": lambda rule: True,
-                    "model_filter": lambda tag: True,
-                }
-            ],
-            "static_url_path": "/flasgger_static",
-            "swagger_ui": True,
-            "specs_route": "/docs",
-        },
-    )
+    async_views = getenv("ASYNC_VIEWS", "false").lower() == "true"
+    if async_views:
+        # Same URL rule, served by the executor-backed async counterpart
+        app.view_functions["v1.list_customers"] = list_customers_async
+
+    spec = install_docs(app)
+
+    warmup = Warmup()
+    settings = WarmupSettings()
+    if settings.mode != "off":
+        _add_warmup_steps(warmup, async_views)
+        # Rendering the spec is what the lazy /apispec_1.json avoids; only
+        # worth it off the critical path
+        if spec is not None and settings.mode == "background":
+            warmup.add("docs_spec", spec.body)
+    install_warmup(app, warmup, settings)
+    app.extensions["readiness"] = _readiness_probe(async_views)
 
     return app
 
 
-app = create_app()
+def _add_warmup_steps(warmup: Warmup, async_views: bool) -> None:
+    from app.core.dependencies import (
+        get_async_customer_repository,
+        get_auth_service,
+        get_list_customers_use_case,
+    )
+    from app.domain.pagination import PageRequest
+    from app.interface.api.pagination import DEFAULT_LIMIT
+    from app.user_routes import get_database
+
+    # Each store step opens the pool (creating the schema) and fills the
+    # cache entries behind the default first page and its count
+    def users() -> None:
+        database = get_database()
+        version = database.version()
+        database.count(version)
+        database.get_page(PageRequest(limit=DEFAULT_LIMIT), version)
+
+    def customers() -> None:
+        use_case = get_list_customers_use_case()
+        version = use_case.version()
+        use_case.count(version)
+        use_case.execute_page(PageRequest(limit=DEFAULT_LIMIT), version)
+
+    warmup.add("users_db", users)
+    warmup.add("customers_db", customers)
+    if async_views:
+        warmup.add("customers_executor", get_async_customer_repository)
+    # Loads the keys and the revocation filter, and imports PyJWT
+    warmup.add("auth", get_auth_service)
+
+
+def _readiness_probe(async_views: bool) -> "ReadinessProbe":
+    from app.core.dependencies import (
+        get_async_customer_repository,
+        get_customer_repository,
+        get_revocation_store,
+    )
+    from app.infrastructure.health.readiness import (
+        HealthSettings,
+        ReadinessProbe,
+        executor_lag_check,
+        pool_check,
+    )
+    from app.user_routes import get_connection_pool
+
+    settings = HealthSettings()
+    probe = ReadinessProbe(settings.cache_seconds)
+    probe.add("users_db", pool_check(get_connection_pool, settings))
+    probe.add(
+        "customers_db",
+        pool_check(lambda: get_customer_repository().pool, settings),
+    )
+    probe.add(
+        "revocations_db",
+        pool_check(lambda: get_revocation_store().pool, settings),
+    )
+    if async_views:
+        probe.add(
+            "customers_executor",
+            executor_lag_check(
+                lambda: get_async_customer_repository().executor,
+                settings,
+            ),
+        )
+    return probe
+
+
+def install_warmup(
+    app: "Flask",
+    warmup: Warmup,
+    settings: WarmupSettings | None = None,
+) -> None:
+    """Run ``warmup`` as configured by ``WARMUP_MODE``.
+
+    In background mode requests other than the health checks wait for it
+    (up to ``WARMUP_TIMEOUT_SECONDS``), so no two threads race to open the
+    same store.
+    """
+    from flask import request
+
+    settings = settings or WarmupSettings()
+    app.extensions["warmup"] = warmup
+    if settings.mode != "background":
+        warmup.run()
+        return
+
+    def wait_for_warmup() -> None:
+        if warmup.done or request.blueprint == "health":
+            return
+        warmup.wait(settings.timeout_seconds)
+
+    app.before_request(wait_for_warmup)
+    warmup.start()
+
+
+_app: "Flask | None" = None
+_app_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    # ``from app import app`` builds the application on first access
+    global _app
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _app_lock:
+        if _app is None:
+            _app = create_app()
+    return _app
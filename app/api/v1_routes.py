@@ -1,6 +1,7 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify
 
 from app.dependencies import get_auth_service, get_customer_service
+from app.interface.api.auth import require_auth
 
 blueprint = Blueprint("v1_routes", __name__, url_prefix="/v1")
 
@@ -26,20 +27,8 @@ def public():
 
 
 @blueprint.get("/private")
+@require_auth
 def private():
-    authorization = request.headers.get("Authorization", "")
-    if not authorization.startswith("Bearer "):
-        return jsonify({"detail": "Missing bearer token"}), 401
-
-    token = authorization.removeprefix("Bearer ").strip()
-    if not token:
-        return jsonify({"detail": "Missing bearer token"}), 401
-
-    try:
-        payload = get_auth_service().decode_token(token)
-    except Exception:  # noqa: BLE001
-        return jsonify({"detail": "Invalid or expired token"}), 401
-
     return jsonify(
-        {"message": "private endpoint", "subject": payload.get("sub")},
+        {"message": "private endpoint", "subject": g.claims.get("sub")},
     )
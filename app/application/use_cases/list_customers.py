@@ -1,9 +1,152 @@
-from app.domain.customer import Customer, CustomerRepository
+from collections.abc import Iterator
+from typing import Any
+
+from app.domain.cache import ReadCache
+from app.domain.customer import (
+    AsyncCustomerRepository,
+    Customer,
+    CustomerRepository,
+)
+from app.domain.pagination import Page, PageRequest
+from app.domain.versioning import TableVersion
 
 
 class ListCustomersUseCase:
-    def __init__(self, repository: CustomerRepository) -> None:
+    def __init__(
+        self,
+        repository: CustomerRepository,
+        cache: ReadCache | None = None,
+    ) -> None:
         self._repository = repository
+        self._cache = cache
+
+    def version(self) -> TableVersion:
+        # Never cached, so writes from other processes are seen at once
+        return self._repository.version()
+
+    def _list_key(self, key: str, version: TableVersion | None) -> str:
+        # Routes pass the version they already read for the ETag
+        if version is None:
+            version = self._repository.version()
+        return f"list:{version.version}:{key}"
+
+    def count(self, version: TableVersion | None = None) -> int:
+        if self._cache is None:
+            return self._repository.count()
+        return self._cache.get_or_load(
+            self._list_key("count", version),
+            self._repository.count,
+        )
 
     def execute(self) -> list[Customer]:
-        return self._repository.list_customers()
+        if self._cache is None:
+            return self._repository.list_customers()
+        return self._cache.get_or_load(
+            self._list_key("all", None),
+            self._repository.list_customers,
+        )
+
+    def execute_page(
+        self,
+        page: PageRequest,
+        version: TableVersion | None = None,
+    ) -> Page:
+        if self._cache is None:
+            return self._repository.list_customers_page(page)
+        return self._cache.get_or_load(
+            self._list_key(_page_key(page), version),
+            lambda: self._repository.list_customers_page(page),
+        )
+
+    def execute_search(
+        self,
+        page: PageRequest,
+        version: TableVersion | None = None,
+    ) -> Page:
+        if self._cache is None:
+            return self._repository.search_customers(page)
+        return self._cache.get_or_load(
+            self._list_key(_search_key(page), version),
+            lambda: self._repository.search_customers(page),
+        )
+
+    def execute_stream(
+        self,
+        page: PageRequest,
+    ) -> Iterator[list[dict[str, Any]]]:
+        return self._repository.iter_customers(page)
+
+
+class AsyncListCustomersUseCase:
+    def __init__(
+        self,
+        repository: AsyncCustomerRepository,
+        cache: ReadCache | None = None,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def version(self) -> TableVersion:
+        return await self._repository.version()
+
+    async def _list_key(
+        self,
+        key: str,
+        version: TableVersion | None,
+    ) -> str:
+        if version is None:
+            version = await self._repository.version()
+        return f"list:{version.version}:{key}"
+
+    async def count(self, version: TableVersion | None = None) -> int:
+        if self._cache is None:
+            return await self._repository.count()
+        return await self._cache.get_or_load_async(
+            await self._list_key("count", version),
+            self._repository.count,
+        )
+
+    async def execute(self) -> list[Customer]:
+        if self._cache is None:
+            return await self._repository.list_customers()
+        return await self._cache.get_or_load_async(
+            await self._list_key("all", None),
+            self._repository.list_customers,
+        )
+
+    async def execute_page(
+        self,
+        page: PageRequest,
+        version: TableVersion | None = None,
+    ) -> Page:
+        if self._cache is None:
+            return await self._repository.list_customers_page(page)
+        return await self._cache.get_or_load_async(
+            await self._list_key(_page_key(page), version),
+            lambda: self._repository.list_customers_page(page),
+        )
+
+    async def execute_search(
+        self,
+        page: PageRequest,
+        version: TableVersion | None = None,
+    ) -> Page:
+        if self._cache is None:
+            return await self._repository.search_customers(page)
+        return await self._cache.get_or_load_async(
+            await self._list_key(_search_key(page), version),
+            lambda: self._repository.search_customers(page),
+        )
+
+
+def _page_key(page: PageRequest) -> str:
+    fields = ",".join(page.fields) if page.fields else "*"
+    return f"{page.limit}:{page.after}:{fields}"
+
+
+def _search_key(page: PageRequest) -> str:
+    fields = ",".join(page.fields) if page.fields else "*"
+    return (
+        f"search:{page.query}:{page.limit}:{page.after_rank}:"
+        f"{page.after}:{fields}"
+    )
@@ -1,15 +1,61 @@
 from functools import lru_cache
+from os import getenv
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from app.application.use_cases.list_customers import ListCustomersUseCase
+from app.application.use_cases.list_customers import (
+    AsyncListCustomersUseCase,
+    ListCustomersUseCase,
+)
+from app.infrastructure.cache.backend import CacheSettings, LRUCache
+from app.infrastructure.cache.read_through import ReadThroughCache
+from app.infrastructure.metrics.sqlite import connection_factory
+from app.infrastructure.repositories.async_sqlite_customer_repository import (
+    AsyncSQLiteCustomerRepository,
+)
 from app.infrastructure.repositories.sqlite_customer_repository import (
     SQLiteCustomerRepository,
 )
-from app.services.auth_service import AuthService
+from app.infrastructure.sqlite.executor import SQLiteExecutor
+from app.infrastructure.static_assets import StaticAssets
+
+if TYPE_CHECKING:
+    # PyJWT and cryptography are imported on first use, not at start-up
+    from app.infrastructure.repositories.sqlite_revocation_store import (
+        SQLiteRevocationStore,
+    )
+    from app.services.auth_service import AuthService
+
+
+@lru_cache
+def get_revocation_store() -> "SQLiteRevocationStore":
+    from app.infrastructure.repositories.sqlite_revocation_store import (
+        SQLiteRevocationStore,
+    )
+
+    default_path = Path(__file__).parent.parent.parent / "revocations.db"
+    return SQLiteRevocationStore(
+        getenv("JWT_REVOCATION_DB", str(default_path)),
+        capacity=int(getenv("JWT_REVOCATION_CAPACITY", "100000")),
+        sync_seconds=float(getenv("JWT_REVOCATION_SYNC_SECONDS", "5")),
+        prune_seconds=float(getenv("JWT_REVOCATION_PRUNE_SECONDS", "60")),
+    )
 
 
 @lru_cache
-def get_auth_service() -> AuthService:
-    return AuthService()
+def get_static_assets() -> StaticAssets:
+    root = Path(__file__).parent.parent.parent
+    return StaticAssets(
+        Path(getenv("STATIC_SOURCE_DIR", str(root / "public"))),
+        Path(getenv("STATIC_BUILD_DIR", str(root / "build" / "static"))),
+    )
+
+
+@lru_cache
+def get_auth_service() -> "AuthService":
+    from app.services.auth_service import AuthService
+
+    return AuthService(revocations=get_revocation_store())
 
 
 @lru_cache
@@ -17,5 +63,52 @@ def get_customer_repository() -> SQLiteCustomerRepository:
     return SQLiteCustomerRepository()
 
 
+@lru_cache
+def get_cache_settings() -> CacheSettings:
+    return CacheSettings()
+
+
+@lru_cache
+def get_cache_backend() -> LRUCache:
+    settings = get_cache_settings()
+    return LRUCache(
+        max_entries=settings.max_entries,
+        ttl=settings.ttl_seconds,
+    )
+
+
+def get_cache(namespace: str) -> ReadThroughCache | None:
+    if not get_cache_settings().enabled:
+        return None
+    return _get_cache(namespace)
+
+
+@lru_cache
+def _get_cache(namespace: str) -> ReadThroughCache:
+    return ReadThroughCache(get_cache_backend(), namespace)
+
+
 def get_list_customers_use_case() -> ListCustomersUseCase:
-    return ListCustomersUseCase(repository=get_customer_repository())
+    return ListCustomersUseCase(
+        repository=get_customer_repository(),
+        cache=get_cache("customers"),
+    )
+
+
+@lru_cache
+def get_async_customer_repository() -> AsyncSQLiteCustomerRepository:
+    # The sync repository creates the schema and seed rows
+    db_path = get_customer_repository().db_path
+    executor = SQLiteExecutor(
+        db_path,
+        max_workers=int(getenv("ASYNC_DB_THREADS", "4")),
+        factory=connection_factory(),
+    )
+    return AsyncSQLiteCustomerRepository(executor)
+
+
+def get_async_list_customers_use_case() -> AsyncListCustomersUseCase:
+    return AsyncListCustomersUseCase(
+        repository=get_async_customer_repository(),
+        cache=get_cache("customers"),
+    )
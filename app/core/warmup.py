@@ -0,0 +1,60 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from os import getenv
+from time import perf_counter
+
+# sync:       run the steps inside create_app(), before anything is served
+# background: serve liveness at once; readiness waits for the steps
+# off:        everything is opened on first use
+WARMUP_MODES = ("sync", "background", "off")
+
+
+@dataclass(frozen=True)
+class WarmupSettings:
+    mode: str = getenv("WARMUP_MODE", "sync").lower()
+    # Longest a request arriving mid-warmup waits before being served cold
+    timeout_seconds: float = float(getenv("WARMUP_TIMEOUT_SECONDS", "30"))
+
+    def __post_init__(self) -> None:
+        if self.mode not in WARMUP_MODES:
+            raise ValueError(f"WARMUP_MODE must be one of {WARMUP_MODES}")
+
+
+class Warmup:
+    """Named start-up steps that prime imports, connections and caches.
+
+    A failing step is recorded in ``errors`` and does not stop the others;
+    ``done`` is set once every step has run either way.
+    """
+
+    def __init__(self) -> None:
+        self._steps: list[tuple[str, Callable[[], object]]] = []
+        self._done = threading.Event()
+        self.durations: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+
+    def add(self, name: str, step: Callable[[], object]) -> None:
+        self._steps.append((name, step))
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def run(self) -> None:
+        for name, step in self._steps:
+            started = perf_counter()
+            try:
+                step()
+            except Exception as exc:  # noqa: BLE001
+                self.errors[name] = f"{type(exc).__name__}: {exc}"
+            self.durations[name] = perf_counter() - started
+        self._done.set()
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.run, name="warmup", daemon=True)
+        thread.start()
+        return thread
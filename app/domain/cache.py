@@ -0,0 +1,18 @@
+from collections.abc import Awaitable, Callable
+from typing import Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class ReadCache(Protocol):
+    def get_or_load(self, key: str, loader: Callable[[], T]) -> T: ...
+
+    async def get_or_load_async(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T: ...
+
+    def invalidate(self, *keys: str) -> None: ...
+
+    def invalidate_prefix(self, prefix: str = "") -> None: ...
@@ -1,7 +1,14 @@
-from typing import Protocol
+from collections.abc import Iterator
+from typing import Any, Protocol
 
 from pydantic import BaseModel
 
+from app.domain.pagination import Page, PageRequest
+from app.domain.versioning import TableVersion
+
+CUSTOMER_FIELDS = ("id", "name", "email")
+CUSTOMER_SEARCH_FIELDS = ("name", "email")
+
 
 class Customer(BaseModel):
     id: int
@@ -11,3 +18,28 @@ class Customer(BaseModel):
 
 class CustomerRepository(Protocol):
     def list_customers(self) -> list[Customer]: ...
+
+    def version(self) -> TableVersion: ...
+
+    def count(self) -> int: ...
+
+    def list_customers_page(self, page: PageRequest) -> Page: ...
+
+    def search_customers(self, page: PageRequest) -> Page: ...
+
+    def iter_customers(
+        self,
+        page: PageRequest,
+    ) -> Iterator[list[dict[str, Any]]]: ...
+
+
+class AsyncCustomerRepository(Protocol):
+    async def list_customers(self) -> list[Customer]: ...
+
+    async def version(self) -> TableVersion: ...
+
+    async def count(self) -> int: ...
+
+    async def list_customers_page(self, page: PageRequest) -> Page: ...
+
+    async def search_customers(self, page: PageRequest) -> Page: ...
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    # ``None`` means unbounded and is only accepted by streaming reads
+    limit: int | None
+    after: int | None = None
+    fields: tuple[str, ...] | None = None
+    # Full-text search: results are ordered by relevance and paged by
+    # ``(after_rank, after)`` instead of ``after`` alone
+    query: str | None = None
+    after_rank: float | None = None
+
+
+@dataclass(frozen=True)
+class Page:
+    items: list[dict[str, Any]] = field(default_factory=list)
+    next_after: int | None = None
+    next_rank: float | None = None
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+
+class RevocationStore(Protocol):
+    def revoke(self, jti: str, expires_at: float) -> None: ...
+
+    def is_revoked(self, jti: str) -> bool: ...
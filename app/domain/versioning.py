@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TableVersion:
+    version: int
+    # Unix timestamp of the last write, in seconds
+    modified_at: float
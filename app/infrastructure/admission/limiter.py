@@ -0,0 +1,232 @@
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from os import getenv
+
+ADMITTED = "admitted"
+QUEUED = "queued"
+REJECTED = "rejected"
+
+
+def _split(raw: str) -> tuple[str, ...]:
+    return tuple(part.strip() for part in raw.split(",") if part.strip())
+
+
+def _parse_groups(raw: str) -> tuple[tuple[str, tuple[str, ...], int], ...]:
+    # "api=/v1:32,users=/users|/admin:16" -> name, path prefixes, limit
+    groups = []
+    for item in _split(raw):
+        name, _, rest = item.partition("=")
+        prefixes, _, limit = rest.rpartition(":")
+        if not name or not prefixes or not limit.isdigit():
+            raise ValueError(f"Invalid ADMISSION_GROUPS entry {item!r}")
+        groups.append((name, tuple(prefixes.split("|")), int(limit)))
+    return tuple(groups)
+
+
+@dataclass(frozen=True)
+class AdmissionSettings:
+    enabled: bool = getenv("ADMISSION_ENABLED", "false").lower() == "true"
+    # Route groups get separate limits; other paths share "default"
+    groups: tuple[tuple[str, tuple[str, ...], int], ...] = field(
+        default_factory=lambda: _parse_groups(
+            getenv("ADMISSION_GROUPS", "api=/v1:32,users=/users:32"),
+        ),
+    )
+    default_limit: int = int(getenv("ADMISSION_DEFAULT_LIMIT", "64"))
+    # Probes and scrapes are never queued or shed
+    exempt: tuple[str, ...] = field(
+        default_factory=lambda: _split(
+            getenv("ADMISSION_EXEMPT", "/health,/metrics"),
+        ),
+    )
+    min_limit: int = int(getenv("ADMISSION_MIN_LIMIT", "2"))
+    max_limit: int = int(getenv("ADMISSION_MAX_LIMIT", "512"))
+    queue_size: int = int(getenv("ADMISSION_QUEUE_SIZE", "64"))
+    queue_timeout_seconds: float = (
+        float(getenv("ADMISSION_QUEUE_TIMEOUT_MS", "250")) / 1000
+    )
+    retry_after_seconds: int = int(getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+    # Fixed limits when false; otherwise tuned by AIMDLimit
+    adaptive: bool = getenv("ADMISSION_ADAPTIVE", "true").lower() == "true"
+    # Latency above baseline * tolerance counts as congestion
+    latency_tolerance: float = float(
+        getenv("ADMISSION_LATENCY_TOLERANCE", "2.0"),
+    )
+    backoff: float = float(getenv("ADMISSION_BACKOFF", "0.9"))
+
+
+class AIMDLimit:
+    """Concurrency limit tuned from observed latency.
+
+    Two moving averages of the same latency samples are compared: a slow
+    ``baseline`` (the long-run normal, whatever mix of fast and slow
+    routes the group serves) and a fast ``recent``. While ``recent`` stays
+    within ``tolerance`` times the baseline and the limit is actually
+    reached, the limit grows by about one per limit's worth of
+    completions. Once ``recent`` exceeds it the limit is multiplied by
+    ``backoff``, at most once per limit's worth of completions, so one
+    slow burst does not collapse it.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        baseline_smoothing: float = 0.01,
+        recent_smoothing: float = 0.2,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self._tolerance = tolerance
+        self._backoff = backoff
+        self._baseline_smoothing = baseline_smoothing
+        self._recent_smoothing = recent_smoothing
+        self.baseline: float | None = None
+        self.recent: float | None = None
+        self._since_decrease = 0
+
+    def update(self, latency: float, in_flight: int) -> int:
+        if self.baseline is None or self.recent is None:
+            self.baseline = self.recent = latency
+            return int(self.limit)
+        self.baseline += self._baseline_smoothing * (latency - self.baseline)
+        self.recent += self._recent_smoothing * (latency - self.recent)
+        self._since_decrease += 1
+        if self.recent > self.baseline * self._tolerance:
+            if self._since_decrease >= self.limit:
+                self.limit = max(self.min_limit, self.limit * self._backoff)
+                self._since_decrease = 0
+        elif in_flight + 1 >= int(self.limit):
+            # Only grow a limit that is being reached
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        return int(self.limit)
+
+
+class Ticket:
+    """A queued request; ``grant`` is called when a slot frees up."""
+
+    def __init__(self, wake: Callable[[], None]) -> None:
+        self.admitted = False
+        self._wake = wake
+
+    def grant(self) -> None:
+        self.admitted = True
+        self._wake()
+
+
+class RouteGroup:
+    """Concurrency limit and bounded FIFO queue for one group of routes.
+
+    Waiting is left to the caller (a thread or a coroutine), so the same
+    group serves the WSGI and the ASGI middleware.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        prefixes: tuple[str, ...],
+        limit: AIMDLimit,
+        queue_size: int,
+        adaptive: bool = True,
+    ) -> None:
+        self.name = name
+        self.prefixes = prefixes
+        self.limit = limit
+        self.queue_size = queue_size
+        self.adaptive = adaptive
+        self.in_flight = 0
+        self._queue: deque[Ticket] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def try_admit(self, wake: Callable[[], None]) -> tuple[str, Ticket | None]:
+        with self._lock:
+            if not self._queue and self.in_flight < int(self.limit.limit):
+                self.in_flight += 1
+                return ADMITTED, None
+            if len(self._queue) >= self.queue_size:
+                return REJECTED, None
+            ticket = Ticket(wake)
+            self._queue.append(ticket)
+            return QUEUED, ticket
+
+    def abandon(self, ticket: Ticket) -> bool:
+        """Leave the queue after the deadline; False if admitted already."""
+        with self._lock:
+            if ticket.admitted:
+                return False
+            self._queue.remove(ticket)
+            return True
+
+    def release(self, latency: float | None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if latency is not None and self.adaptive:
+                self.limit.update(latency, self.in_flight)
+            while self._queue and self.in_flight < int(self.limit.limit):
+                self.in_flight += 1
+                self._queue.popleft().grant()
+
+
+class AdmissionController:
+    """Route groups built from ``AdmissionSettings``, looked up by path."""
+
+    def __init__(self, settings: AdmissionSettings | None = None) -> None:
+        self.settings = settings or AdmissionSettings()
+        self.groups = [
+            self._group(name, prefixes, limit)
+            for name, prefixes, limit in self.settings.groups
+        ]
+        self.default = self._group(
+            "default", ("/",), self.settings.default_limit
+        )
+
+    def _group(
+        self,
+        name: str,
+        prefixes: tuple[str, ...],
+        initial: int,
+    ) -> RouteGroup:
+        settings = self.settings
+        return RouteGroup(
+            name,
+            prefixes,
+            AIMDLimit(
+                initial,
+                min_limit=settings.min_limit,
+                max_limit=settings.max_limit,
+                tolerance=settings.latency_tolerance,
+                backoff=settings.backoff,
+            ),
+            queue_size=settings.queue_size,
+            adaptive=settings.adaptive,
+        )
+
+    def group_for(self, path: str) -> RouteGroup | None:
+        """The group limiting ``path``, or ``None`` when it is exempt."""
+        if path.startswith(self.settings.exempt):
+            return None
+        for group in self.groups:
+            if path.startswith(group.prefixes):
+                return group
+        return self.default
+
+    def admit(self, group: RouteGroup) -> bool:
+        """Block the calling thread until admitted or the deadline passes."""
+        event = threading.Event()
+        outcome, ticket = group.try_admit(event.set)
+        if outcome != QUEUED:
+            return outcome == ADMITTED
+        assert ticket is not None
+        if event.wait(self.settings.queue_timeout_seconds):
+            return True
+        return not group.abandon(ticket)
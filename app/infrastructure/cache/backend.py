@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import getenv
+from typing import Any, Protocol
+
+MISSING: Any = object()
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    enabled: bool = getenv("CACHE_ENABLED", "true").lower() == "true"
+    max_entries: int = int(getenv("CACHE_MAX_ENTRIES", "1024"))
+    ttl_seconds: float = float(getenv("CACHE_TTL_SECONDS", "30"))
+
+
+class CacheBackend(Protocol):
+    """Storage behind ``ReadThroughCache``.
+
+    ``LRUCache`` is the in-process default; a shared store (Redis,
+    memcached) can be plugged in by implementing the same methods.
+    """
+
+    def get(self, key: str) -> Any: ...
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def delete_prefix(self, prefix: str) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class LRUCache:
+    """Thread-safe LRU with per-entry TTL and a size bound.
+
+    ``get`` returns ``MISSING`` for absent or expired keys.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
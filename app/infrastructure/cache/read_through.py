@@ -0,0 +1,67 @@
+import threading
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from app.infrastructure.cache.backend import MISSING, CacheBackend
+
+T = TypeVar("T")
+
+
+class ReadThroughCache:
+    """Namespaced read-through cache with explicit invalidation.
+
+    A load that races with an invalidation is returned to its caller but
+    not stored, so a write can never be shadowed by the value it replaced.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        ttl: float | None = None,
+    ) -> None:
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get_or_load(self, key: str, loader: Callable[[], T]) -> T:
+        value = self.backend.get(self._key(key))
+        if value is not MISSING:
+            return value
+        generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self.backend.set(self._key(key), value, self.ttl)
+        return value
+
+    async def get_or_load_async(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        value = self.backend.get(self._key(key))
+        if value is not MISSING:
+            return value
+        generation = self._generation
+        value = await loader()
+        with self._lock:
+            if generation == self._generation:
+                self.backend.set(self._key(key), value, self.ttl)
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self.backend.delete(self._key(key))
+
+    def invalidate_prefix(self, prefix: str = "") -> None:
+        with self._lock:
+            self._generation += 1
+            self.backend.delete_prefix(self._key(prefix))
@@ -0,0 +1,51 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised without brotli installed
+    brotli = None  # type: ignore[assignment]
+
+# Preferred first; brotli compresses text noticeably better than gzip
+ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# File suffixes of precompressed variants, by content coding
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+_COMPRESSIBLE_PREFIXES = ("text/",)
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def compressible(mimetype: str | None) -> bool:
+    """Whether a body of ``mimetype`` is worth compressing.
+
+    Images, fonts and archives are already compressed and only grow.
+    """
+    if not mimetype:
+        return False
+    return (
+        mimetype.startswith(_COMPRESSIBLE_PREFIXES)
+        or mimetype in _COMPRESSIBLE_TYPES
+        or mimetype.endswith(("+json", "+xml"))
+    )
+
+
+def compress(data: bytes, encoding: str, level: int | None = None) -> bytes:
+    """Encode ``data`` with ``encoding`` ("br" or "gzip").
+
+    ``level`` is the gzip level or brotli quality; ``None`` uses the
+    strongest setting, which suits build-time compression.
+    """
+    if encoding == "gzip":
+        # mtime=0 keeps the output byte-identical across runs
+        return gzip.compress(data, compresslevel=level or 9, mtime=0)
+    if encoding == "br":
+        if brotli is None:
+            raise RuntimeError("brotli is not installed: pip install brotli")
+        return brotli.compress(data, quality=11 if level is None else level)
+    raise ValueError(f"Unsupported encoding {encoding!r}")
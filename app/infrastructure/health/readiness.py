@@ -0,0 +1,117 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from os import getenv
+from time import monotonic, perf_counter
+from typing import Any
+
+from app.infrastructure.sqlite.executor import SQLiteExecutor
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+
+# A check returns details for the report and raises when unhealthy
+Check = Callable[[], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class HealthSettings:
+    # Probes within this window share one run, so probe frequency never
+    # turns into database load
+    cache_seconds: float = float(getenv("HEALTH_CACHE_SECONDS", "2"))
+    check_timeout_seconds: float = float(
+        getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "1"),
+    )
+    # Share of a pool's connections in use at which the pod stops
+    # advertising itself; 1.0 means only a fully checked-out pool
+    max_pool_saturation: float = float(
+        getenv("HEALTH_MAX_POOL_SATURATION", "1.0"),
+    )
+    max_lag_seconds: float = float(getenv("HEALTH_MAX_LAG_SECONDS", "0.5"))
+
+
+class UnhealthyError(Exception):
+    def __init__(self, detail: str, **details: Any) -> None:
+        super().__init__(detail)
+        self.details = details
+
+
+class ReadinessProbe:
+    """Runs named checks and caches the combined result briefly.
+
+    Concurrent callers share a single run instead of each running the
+    checks; a check that raises marks the probe not ready.
+    """
+
+    def __init__(self, cache_seconds: float = 2.0) -> None:
+        self._cache_seconds = cache_seconds
+        self._checks: list[tuple[str, Check]] = []
+        self._lock = threading.Lock()
+        self._result: tuple[bool, dict[str, Any]] | None = None
+        self._checked_at = 0.0
+
+    def add(self, name: str, check: Check) -> None:
+        self._checks.append((name, check))
+
+    def _fresh(self) -> bool:
+        return (
+            self._result is not None
+            and monotonic() - self._checked_at < self._cache_seconds
+        )
+
+    def run(self) -> tuple[bool, dict[str, Any]]:
+        """Return ``(ready, report)``, from the cache when fresh."""
+        if self._fresh():
+            return self._result  # type: ignore[return-value]
+        with self._lock:
+            if not self._fresh():
+                self._result = self._run_checks()
+                self._checked_at = monotonic()
+            return self._result  # type: ignore[return-value]
+
+    def _run_checks(self) -> tuple[bool, dict[str, Any]]:
+        ready = True
+        report: dict[str, Any] = {}
+        for name, check in self._checks:
+            started = perf_counter()
+            try:
+                entry = {"ok": True, **check()}
+            except UnhealthyError as exc:
+                entry = {"ok": False, "error": str(exc), **exc.details}
+            except Exception as exc:  # noqa: BLE001
+                entry = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            entry["seconds"] = round(perf_counter() - started, 6)
+            ready = ready and entry["ok"]
+            report[name] = entry
+        return ready, report
+
+
+def pool_check(
+    pool: Callable[[], SQLiteConnectionPool],
+    settings: HealthSettings,
+) -> Check:
+    """Saturation of a connection pool, then a read through it."""
+
+    def check() -> dict[str, Any]:
+        target = pool()
+        saturation = round(target.saturation, 3)
+        if saturation >= settings.max_pool_saturation:
+            # Not queried: that would wait for one of the busy connections
+            raise UnhealthyError("Pool saturated", saturation=saturation)
+        target.ping(settings.check_timeout_seconds)
+        return {"saturation": saturation}
+
+    return check
+
+
+def executor_lag_check(
+    executor: Callable[[], SQLiteExecutor],
+    settings: HealthSettings,
+) -> Check:
+    """Time a no-op spends queued behind the executor's workers."""
+
+    def check() -> dict[str, Any]:
+        lag = round(executor().lag(settings.check_timeout_seconds), 6)
+        if lag > settings.max_lag_seconds:
+            raise UnhealthyError("Executor lagging", lag_seconds=lag)
+        return {"lag_seconds": lag}
+
+    return check
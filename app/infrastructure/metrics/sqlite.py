@@ -0,0 +1,111 @@
+import re
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from app.infrastructure.metrics.registry import (
+    REGISTRY,
+    MetricsRegistry,
+    MetricsSettings,
+)
+
+_OPERATION = re.compile(r"^\s*(\w+)")
+_TABLE = re.compile(
+    r"\b(?:FROM|INTO|UPDATE|TABLE|ON)\s+"
+    r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?[\"`]?(?!ON\b)(\w+)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1024)
+def statement_labels(sql: str) -> tuple[str, str]:
+    """``(operation, table)`` for a statement; bounded label cardinality.
+
+    Statements are labelled by verb and first table instead of their text
+    so that variable-length ``IN (?, ?, ...)`` lists share one series.
+    """
+    operation = _OPERATION.match(sql)
+    table = _TABLE.search(sql)
+    return (
+        operation.group(1).upper() if operation else "",
+        table.group(1) if table else "",
+    )
+
+
+class SQLMetrics:
+    def __init__(self, registry: MetricsRegistry = REGISTRY) -> None:
+        labels = ("db", "operation", "table")
+        self.statements = registry.counter(
+            "sqlite_statements_total",
+            "SQL statements executed",
+            labels,
+        )
+        self.errors = registry.counter(
+            "sqlite_statement_errors_total",
+            "SQL statements that raised",
+            labels,
+        )
+        self.duration = registry.histogram(
+            "sqlite_statement_duration_seconds",
+            "Time spent executing SQL statements",
+            labels,
+        )
+
+    def record(self, db: str, sql: str, elapsed: float, failed: bool) -> None:
+        labels = (db, *statement_labels(sql))
+        self.statements.inc(*labels)
+        self.duration.observe(elapsed, *labels)
+        if failed:
+            self.errors.inc(*labels)
+
+
+SQL_METRICS = SQLMetrics()
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """``sqlite3.Connection`` that times ``execute*`` calls.
+
+    Only statement execution is measured; rows fetched lazily from the
+    returned cursor afterwards are not.
+    """
+
+    def __init__(self, database: Any, *args: Any, **kwargs: Any) -> None:
+        super().__init__(database, *args, **kwargs)
+        self.metrics_db = Path(str(database)).stem or str(database)
+
+    def _timed(self, method: Any, sql: str, *args: Any) -> Any:
+        start = perf_counter()
+        failed = True
+        try:
+            result = method(sql, *args)
+            failed = False
+            return result
+        finally:
+            SQL_METRICS.record(
+                self.metrics_db,
+                sql,
+                perf_counter() - start,
+                failed,
+            )
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        return self._timed(super().execute, sql, parameters)
+
+    def executemany(
+        self,
+        sql: str,
+        parameters: Any,
+        /,
+    ) -> sqlite3.Cursor:
+        return self._timed(super().executemany, sql, parameters)
+
+    def executescript(self, sql_script: str, /) -> sqlite3.Cursor:
+        return self._timed(super().executescript, sql_script)
+
+
+def connection_factory() -> type[sqlite3.Connection]:
+    if MetricsSettings().enabled:
+        return InstrumentedConnection
+    return sqlite3.Connection
@@ -0,0 +1,127 @@
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+import time
+from typing import Any
+
+# pstats keys: (filename, line, function name)
+FunctionKey = tuple[str, int, str]
+
+
+class ProfilingSession:
+    """cProfile the next ``max_requests`` requests or those in a window.
+
+    Each request thread runs its own profiler and the results are merged
+    here. Since Python 3.12 only one cProfile can be active at a time, so
+    requests that overlap a profiled one are counted as skipped.
+    """
+
+    def __init__(
+        self,
+        max_requests: int | None = None,
+        seconds: float | None = None,
+    ) -> None:
+        if max_requests is None and seconds is None:
+            raise ValueError("Give a request count or a time window")
+        self.max_requests = max_requests
+        self.deadline = (
+            time.monotonic() + seconds if seconds is not None else None
+        )
+        self.started_at = time.time()
+        self.profiled = 0
+        self.skipped = 0
+        self._claimed = 0
+        self._active = 0
+        self._stats = pstats.Stats()
+        self._lock = threading.Lock()
+
+    def _accepting(self) -> bool:
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return False
+        return self.max_requests is None or self._claimed < self.max_requests
+
+    @property
+    def done(self) -> bool:
+        with self._lock:
+            return not self._accepting() and self._active == 0
+
+    def start(self) -> cProfile.Profile | None:
+        with self._lock:
+            if not self._accepting():
+                return None
+            self._claimed += 1
+            self._active += 1
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            with self._lock:
+                self._claimed -= 1
+                self._active -= 1
+                self.skipped += 1
+            return None
+        return profile
+
+    def finish(self, profile: cProfile.Profile) -> None:
+        profile.disable()
+        with self._lock:
+            self._stats.add(profile)
+            self.profiled += 1
+            self._active -= 1
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "status": "done" if self.done else "running",
+            "started_at": self.started_at,
+            "profiled": self.profiled,
+            "skipped": self.skipped,
+            "max_requests": self.max_requests,
+        }
+
+    def pstats_bytes(self) -> bytes:
+        """The merged profile in ``pstats`` dump format (snakeviz etc.)."""
+        with self._lock:
+            return marshal.dumps(self._stats.stats)
+
+    def text(self, limit: int = 50) -> str:
+        stream = io.StringIO()
+        with self._lock:
+            self._stats.stream = stream
+            self._stats.sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+    def collapsed(self) -> str:
+        """Approximate collapsed stacks from the call graph.
+
+        cProfile keeps caller/callee edges, not full stacks, so each
+        function's own time is attributed to the path through its
+        heaviest callers. Weights are microseconds.
+        """
+        with self._lock:
+            stats: dict[FunctionKey, Any] = dict(self._stats.stats)
+        lines = []
+        for key, (_, _, tottime, _, callers) in stats.items():
+            weight = int(tottime * 1_000_000)
+            if weight <= 0:
+                continue
+            stack = [key]
+            seen = {key}
+            while callers:
+                caller = max(callers, key=lambda c: callers[c][3])
+                if caller in seen or caller not in stats:
+                    break
+                stack.append(caller)
+                seen.add(caller)
+                callers = stats[caller][4]
+            labels = ";".join(_label(frame) for frame in reversed(stack))
+            lines.append(f"{labels} {weight}\n")
+        return "".join(lines)
+
+
+def _label(key: FunctionKey) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name
+    return f"{name} ({filename}:{line})"
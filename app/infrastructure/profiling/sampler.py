@@ -0,0 +1,65 @@
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from types import FrameType
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _thread_names() -> dict[int, str]:
+    return {
+        thread.ident: thread.name
+        for thread in threading.enumerate()
+        if thread.ident is not None
+    }
+
+
+def sample_stacks(seconds: float, interval: float = 0.005) -> Counter[str]:
+    """Sample every thread's stack for ``seconds``; collapsed-stack counts.
+
+    Keys are ``thread;outer;...;inner`` frame paths, ready for
+    flamegraph.pl or speedscope. Runs on the calling thread, which is
+    left out of the samples; the other threads only pay for the GIL
+    handoffs while their frames are read.
+    """
+    own = threading.get_ident()
+    samples: Counter[str] = Counter()
+    names = _thread_names()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            current: FrameType | None = frame
+            while current is not None:
+                stack.append(_frame_label(current))
+                current = current.f_back
+            if ident not in names:
+                names = _thread_names()
+            stack.append(names.get(ident, f"thread-{ident}"))
+            samples[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return samples
+
+
+def format_collapsed(samples: Counter[str]) -> str:
+    return "".join(
+        f"{stack} {count}\n" for stack, count in samples.most_common()
+    )
+
+
+def dump_thread_stacks() -> str:
+    """Current stack of every thread, in ``traceback`` format."""
+    names = _thread_names()
+    sections = []
+    for ident, frame in sys._current_frames().items():
+        name = names.get(ident, "?")
+        stack = "".join(traceback.format_stack(frame))
+        sections.append(f'Thread "{name}" ({ident}):\n{stack}')
+    return "\n".join(sections)
@@ -0,0 +1,140 @@
+import json
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Marks the child's timing line among whatever else it prints
+_RESULT_PREFIX = "startup-report:"
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass
+class StartupReport:
+    interpreter_seconds: float
+    app_seconds: float
+    first_request_seconds: float
+    total_seconds: float
+    status: int
+    path: str
+    warmup: dict[str, float] = field(default_factory=dict)
+    warmup_errors: dict[str, str] = field(default_factory=dict)
+    imports: list[ImportRecord] = field(default_factory=list)
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``python -X importtime`` output (microseconds) into records."""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the column header
+        records.append(
+            ImportRecord(
+                module=parts[2].strip(),
+                self_seconds=int(parts[0]) / 1e6,
+                cumulative_seconds=int(parts[1]) / 1e6,
+            ),
+        )
+    return records
+
+
+def package_totals(records: list[ImportRecord]) -> Counter[str]:
+    """Self import time summed per top-level package."""
+    totals: Counter[str] = Counter()
+    for record in records:
+        totals[record.module.split(".")[0]] += record.self_seconds
+    return totals
+
+
+def first_request(path: str) -> None:
+    """Child side: build the app, serve one request, print the timings."""
+    started = time.time()
+    from app import app
+
+    built = time.time()
+    status = app.test_client().get(path).status_code
+    served = time.time()
+    warmup = app.extensions["warmup"]
+    result = {
+        "started": started,
+        "built": built,
+        "served": served,
+        "status": status,
+        "warmup": warmup.durations,
+        "warmup_errors": warmup.errors,
+    }
+    print(_RESULT_PREFIX + json.dumps(result))
+
+
+def measure_startup(path: str = "/health") -> StartupReport:
+    """Time a cold process from spawn until ``path`` has been served."""
+    root = Path(__file__).parent.parent.parent.parent
+    code = (
+        "from app.infrastructure.profiling.startup import first_request; "
+        f"first_request({path!r})"
+    )
+    spawned = time.time()
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    line = next(
+        line
+        for line in child.stdout.splitlines()
+        if line.startswith(_RESULT_PREFIX)
+    )
+    result = json.loads(line.removeprefix(_RESULT_PREFIX))
+    return StartupReport(
+        interpreter_seconds=result["started"] - spawned,
+        app_seconds=result["built"] - result["started"],
+        first_request_seconds=result["served"] - result["built"],
+        total_seconds=result["served"] - spawned,
+        status=result["status"],
+        path=path,
+        warmup=result["warmup"],
+        warmup_errors=result["warmup_errors"],
+        imports=parse_importtime(child.stderr),
+    )
+
+
+def format_report(report: StartupReport, top: int = 15) -> str:
+    def ms(seconds: float) -> str:
+        return f"{seconds * 1000:9.1f} ms"
+
+    lines = [
+        "Startup (one cold process, -X importtime adds some overhead)",
+        f"  {ms(report.interpreter_seconds)}  interpreter start",
+        f"  {ms(report.app_seconds)}  import app and create_app()",
+    ]
+    for name, seconds in report.warmup.items():
+        error = report.warmup_errors.get(name)
+        suffix = f"  FAILED {error}" if error else ""
+        lines.append(f"  {ms(seconds)}    warmup {name}{suffix}")
+    lines += [
+        f"  {ms(report.first_request_seconds)}  first request GET "
+        f"{report.path} -> {report.status}",
+        f"  {ms(report.total_seconds)}  spawn to first served request",
+        "",
+        f"Slowest imports (self time, top {top})",
+    ]
+    slowest = sorted(report.imports, key=lambda r: r.self_seconds)[::-1]
+    for record in slowest[:top]:
+        lines.append(f"  {ms(record.self_seconds)}  {record.module}")
+    lines += ["", f"Import time by package (self time, top {top})"]
+    for package, seconds in package_totals(report.imports).most_common(top):
+        lines.append(f"  {ms(seconds)}  {package}")
+    return "\n".join(lines)
@@ -0,0 +1,60 @@
+from app.domain.customer import (
+    CUSTOMER_FIELDS,
+    AsyncCustomerRepository,
+    Customer,
+)
+from app.domain.pagination import Page, PageRequest
+from app.domain.versioning import TableVersion
+from app.infrastructure.sqlite.counts import read_row_count
+from app.infrastructure.sqlite.executor import SQLiteExecutor
+from app.infrastructure.sqlite.keyset import fetch_page
+from app.infrastructure.sqlite.search import fetch_search_page
+from app.infrastructure.sqlite.versions import read_version
+
+
+class AsyncSQLiteCustomerRepository(AsyncCustomerRepository):
+    """Async view of the customers table; the schema is owned by
+    ``SQLiteCustomerRepository`` and must exist before use."""
+
+    def __init__(self, executor: SQLiteExecutor) -> None:
+        self._executor = executor
+
+    @property
+    def executor(self) -> SQLiteExecutor:
+        return self._executor
+
+    async def version(self) -> TableVersion:
+        return await self._executor.run(
+            lambda conn: read_version(conn, "customers"),
+        )
+
+    async def count(self) -> int:
+        return await self._executor.run(
+            lambda conn: read_row_count(conn, "customers"),
+        )
+
+    async def list_customers(self) -> list[Customer]:
+        rows = await self._executor.run(
+            lambda conn: conn.execute(
+                "SELECT id, name, email FROM customers",
+            ).fetchall(),
+        )
+        return [Customer(id=row[0], name=row[1], email=row[2]) for row in rows]
+
+    async def list_customers_page(self, page: PageRequest) -> Page:
+        return await self._executor.run(
+            lambda conn: fetch_page(conn, "customers", CUSTOMER_FIELDS, page),
+        )
+
+    async def search_customers(self, page: PageRequest) -> Page:
+        return await self._executor.run(
+            lambda conn: fetch_search_page(
+                conn,
+                "customers",
+                CUSTOMER_FIELDS,
+                page,
+            ),
+        )
+
+    def close(self) -> None:
+        self._executor.close()
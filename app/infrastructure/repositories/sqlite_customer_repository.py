@@ -1,21 +1,55 @@
-import sqlite3
+from collections.abc import Iterator
+from os import getenv
 from pathlib import Path
+from typing import Any
 
-from app.domain.customer import Customer, CustomerRepository
+from app.domain.customer import (
+    CUSTOMER_FIELDS,
+    CUSTOMER_SEARCH_FIELDS,
+    Customer,
+    CustomerRepository,
+)
+from app.domain.pagination import Page, PageRequest
+from app.domain.versioning import TableVersion
+from app.infrastructure.metrics.sqlite import connection_factory
+from app.infrastructure.sqlite.counts import install_row_count, read_row_count
+from app.infrastructure.sqlite.keyset import fetch_page, iter_rows
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.infrastructure.sqlite.profile import StorageProfile
+from app.infrastructure.sqlite.search import (
+    fetch_search_page,
+    install_search_index,
+)
+from app.infrastructure.sqlite.versions import (
+    install_version_tracking,
+    read_version,
+)
+
+# Absolute so the database is found from any working directory
+DEFAULT_DB_PATH = str(
+    Path(__file__).parent.parent.parent.parent / "customers.db"
+)
 
 
 class SQLiteCustomerRepository(CustomerRepository):
-    def __init__(self, db_path: str = None) -> None:
+    def __init__(
+        self,
+        db_path: str = None,
+        profile: StorageProfile | None = None,
+    ) -> None:
         if db_path is None:
-            # Use absolute path so database is accessible from any working dir
-            db_path = str(
-                Path(__file__).parent.parent.parent.parent / "customers.db"
-            )
+            db_path = DEFAULT_DB_PATH
         self.db_path = db_path
+        self._pool = SQLiteConnectionPool(
+            db_path,
+            size=int(getenv("CUSTOMER_DB_POOL_SIZE", "5")),
+            profile=profile,
+            factory=connection_factory(),
+        )
         self._init_db()
 
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        def init(conn):
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS customers (
                     id INTEGER PRIMARY KEY,
@@ -23,8 +57,10 @@ class SQLiteCustomerRepository(CustomerRepository):
                     email TEXT NOT NULL
                 )
             """)
-            cursor = conn.execute("SELECT COUNT(*) FROM customers")
-            if cursor.fetchone()[0] == 0:
+            install_version_tracking(conn, "customers")
+            install_search_index(conn, "customers", CUSTOMER_SEARCH_FIELDS)
+            install_row_count(conn, "customers")
+            if read_row_count(conn, "customers") == 0:
                 conn.execute(
                     "INSERT INTO customers (name, email) VALUES (?, ?)",
                     ("Ana Flask", "ana@flask.com"),
@@ -34,10 +70,44 @@ class SQLiteCustomerRepository(CustomerRepository):
                     ("Bruno Flask", "bruno@flask.com"),
                 )
 
+        self._pool.write(init)
+
+    @property
+    def pool(self) -> SQLiteConnectionPool:
+        return self._pool
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def version(self) -> TableVersion:
+        with self._pool.connection() as conn:
+            return read_version(conn, "customers")
+
+    def count(self) -> int:
+        with self._pool.connection() as conn:
+            return read_row_count(conn, "customers")
+
     def list_customers(self) -> list[Customer]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.connection() as conn:
             cursor = conn.execute("SELECT id, name, email FROM customers")
             return [
                 Customer(id=row[0], name=row[1], email=row[2])
                 for row in cursor.fetchall()
             ]
+
+    def list_customers_page(self, page: PageRequest) -> Page:
+        with self._pool.connection() as conn:
+            return fetch_page(conn, "customers", CUSTOMER_FIELDS, page)
+
+    def search_customers(self, page: PageRequest) -> Page:
+        with self._pool.connection() as conn:
+            return fetch_search_page(conn, "customers", CUSTOMER_FIELDS, page)
+
+    def iter_customers(
+        self,
+        page: PageRequest,
+    ) -> Iterator[list[dict[str, Any]]]:
+        # Held until the client has read the whole stream, so it is not
+        # taken from the pool
+        with self._pool.dedicated() as conn:
+            yield from iter_rows(conn, "customers", CUSTOMER_FIELDS, page)
@@ -0,0 +1,148 @@
+import sqlite3
+import threading
+import time
+
+from app.domain.revocation import RevocationStore
+from app.infrastructure.cache.bloom import BloomFilter
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS revoked_tokens (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        jti TEXT NOT NULL UNIQUE,
+        expires_at REAL NOT NULL
+    )
+"""
+
+
+class SQLiteRevocationStore(RevocationStore):
+    """Revoked token ids in SQLite, fronted by an in-memory Bloom filter.
+
+    A negative filter answer (the common case) costs a few hash probes;
+    only possible hits are confirmed with a primary-key lookup. Rows
+    written by other processes are folded in incrementally by ``seq``
+    every ``sync_seconds``; expired rows are pruned every
+    ``prune_seconds`` and the filter is rebuilt once most of what it
+    holds has been pruned or it outgrows its capacity.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        sync_seconds: float = 5.0,
+        prune_seconds: float = 60.0,
+    ) -> None:
+        self._pool = SQLiteConnectionPool(db_path, size=2)
+        self._pool.write(self._init_db)
+        self._min_capacity = capacity
+        self._error_rate = error_rate
+        self._sync_seconds = sync_seconds
+        self._prune_seconds = prune_seconds
+        # Reentrant: maintenance holds it around _sync/_rebuild, which also
+        # take it themselves
+        self._lock = threading.RLock()
+        self._filter = BloomFilter(capacity, error_rate)
+        self._last_seq = 0
+        self._synced_at = 0.0
+        self._pruned_at = time.monotonic()
+        self._rebuild()
+
+    @staticmethod
+    def _init_db(conn: sqlite3.Connection) -> None:
+        conn.execute(SCHEMA)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS revoked_tokens_expires_at "
+            "ON revoked_tokens (expires_at)",
+        )
+
+    @property
+    def pool(self) -> SQLiteConnectionPool:
+        return self._pool
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        self._pool.write(
+            lambda conn: conn.execute(
+                "INSERT OR IGNORE INTO revoked_tokens (jti, expires_at) "
+                "VALUES (?, ?)",
+                (jti, expires_at),
+            ),
+        )
+        with self._lock:
+            self._filter.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        self._maintain()
+        if jti not in self._filter:
+            return False
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM revoked_tokens WHERE jti = ?",
+                (jti,),
+            ).fetchone()
+        return row is not None
+
+    def _maintain(self) -> None:
+        now = time.monotonic()
+        if now - self._synced_at < self._sync_seconds:
+            return
+        with self._lock:
+            if now - self._synced_at < self._sync_seconds:
+                return
+            self._synced_at = now
+            if now - self._pruned_at >= self._prune_seconds:
+                self._pruned_at = now
+                if self._prune():
+                    self._rebuild()
+                    return
+            self._sync()
+
+    def _sync(self) -> None:
+        with self._lock:
+            with self._pool.connection() as conn:
+                rows = conn.execute(
+                    "SELECT seq, jti FROM revoked_tokens WHERE seq > ? "
+                    "ORDER BY seq",
+                    (self._last_seq,),
+                ).fetchall()
+            for seq, jti in rows:
+                self._filter.add(jti)
+                self._last_seq = seq
+            if self._filter.count > self._filter.capacity:
+                self._rebuild()
+
+    def _prune(self) -> bool:
+        """Delete expired rows; True when the filter should be rebuilt."""
+        cursor = self._pool.write(
+            lambda conn: conn.execute(
+                "DELETE FROM revoked_tokens WHERE expires_at < ?",
+                (time.time(),),
+            ),
+        )
+        return cursor.rowcount * 2 > self._filter.count
+
+    def _rebuild(self) -> None:
+        # Held from snapshot to swap: a concurrent revoke() either committed
+        # before the snapshot or adds its jti to the new filter afterwards,
+        # never to the one being discarded
+        with self._lock, self._pool.connection() as conn:
+            live, last_seq = conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(seq), 0) FROM revoked_tokens",
+            ).fetchone()
+            bloom = BloomFilter(
+                max(self._min_capacity, live * 2),
+                self._error_rate,
+            )
+            cursor = conn.execute(
+                "SELECT jti FROM revoked_tokens WHERE seq <= ?",
+                (last_seq,),
+            )
+            while rows := cursor.fetchmany(10_000):
+                for (jti,) in rows:
+                    bloom.add(jti)
+            self._filter = bloom
+            self._last_seq = last_seq
@@ -0,0 +1,67 @@
+import sqlite3
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from app.infrastructure.sqlite.counts import adjust_row_count, has_row_count
+from app.infrastructure.sqlite.search import (
+    has_search_index,
+    rebuild_search_index,
+)
+from app.infrastructure.sqlite.versions import bump_version
+
+
+def bulk_load(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> int:
+    """Append ``rows`` to ``table`` in one transaction; returns the count.
+
+    Explicit indexes and triggers on the table are dropped first and
+    recreated from their original SQL afterwards, so secondary indexes
+    are built once in bulk and per-row triggers (version tracking) do not
+    fire; the table version and row count are updated once and a
+    full-text index, if any, is rebuilt once instead. Constraint indexes
+    (PRIMARY KEY, UNIQUE) stay in place. ``rows`` may be a generator,
+    it is streamed into ``executemany``.
+    """
+    objects = conn.execute(
+        "SELECT type, name, sql FROM sqlite_master "
+        "WHERE tbl_name = ? AND type IN ('index', 'trigger') "
+        "AND sql IS NOT NULL",
+        (table,),
+    ).fetchall()
+    names = ", ".join(columns)
+    placeholders = ", ".join("?" for _ in columns)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for kind, name, _ in objects:
+            conn.execute(f'DROP {kind.upper()} "{name}"')
+        before = conn.total_changes
+        conn.executemany(
+            f"INSERT INTO {table} ({names}) VALUES ({placeholders})",
+            rows,
+        )
+        inserted = conn.total_changes - before
+        # Indexes before triggers, in case a trigger relies on one
+        for kind, _, sql in sorted(objects, key=lambda o: o[0] != "index"):
+            conn.execute(sql)
+        if inserted and has_row_count(conn, table):
+            adjust_row_count(conn, table, inserted)
+        if inserted and has_search_index(conn, table):
+            rebuild_search_index(conn, table)
+        if inserted and _tracks_versions(conn):
+            bump_version(conn, table)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return inserted
+
+
+def _tracks_versions(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'table_versions'",
+    ).fetchone()
+    return row is not None
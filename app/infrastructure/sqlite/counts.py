@@ -0,0 +1,62 @@
+import sqlite3
+
+
+def install_row_count(conn: sqlite3.Connection, table: str) -> None:
+    """Maintain ``table``'s row count in ``table_row_counts`` via triggers.
+
+    The table is counted once, when tracking is first installed; after
+    that reading the count is a primary-key lookup.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS table_row_counts (
+            name TEXT PRIMARY KEY,
+            row_count INTEGER NOT NULL
+        )
+        """,
+    )
+    if not has_row_count(conn, table):
+        # Only the first install scans the table
+        conn.execute(
+            "INSERT INTO table_row_counts (name, row_count) "
+            f"SELECT ?, COUNT(*) FROM {table}",
+            (table,),
+        )
+    for event, delta in (("INSERT", "+ 1"), ("DELETE", "- 1")):
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_count_{event.lower()}
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE table_row_counts SET row_count = row_count {delta}
+                WHERE name = '{table}';
+            END
+            """,
+        )
+
+
+def has_row_count(conn: sqlite3.Connection, table: str) -> bool:
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM table_row_counts WHERE name = ?",
+            (table,),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return False
+    return row is not None
+
+
+def adjust_row_count(conn: sqlite3.Connection, table: str, delta: int) -> None:
+    """Account for rows written while the count triggers were dropped."""
+    conn.execute(
+        "UPDATE table_row_counts SET row_count = row_count + ? WHERE name = ?",
+        (delta, table),
+    )
+
+
+def read_row_count(conn: sqlite3.Connection, table: str) -> int:
+    row = conn.execute(
+        "SELECT row_count FROM table_row_counts WHERE name = ?",
+        (table,),
+    ).fetchone()
+    return row[0] if row is not None else 0
@@ -0,0 +1,80 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from app.infrastructure.sqlite.profile import StorageProfile
+
+T = TypeVar("T")
+
+
+class SQLiteExecutor:
+    """Run blocking SQLite work on a dedicated, bounded thread pool.
+
+    Each worker thread lazily opens its own connection with the storage
+    profile applied, so queries never share a connection across threads
+    and slow statements occupy these workers instead of request threads.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_workers: int = 4,
+        profile: StorageProfile | None = None,
+        factory: type[sqlite3.Connection] = sqlite3.Connection,
+    ) -> None:
+        self.db_path = db_path
+        self.profile = profile or StorageProfile()
+        self._factory = factory
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="sqlite",
+        )
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only this worker uses the connection; close() runs after the
+            # workers have stopped, from whichever thread shuts down.
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                factory=self._factory,
+            )
+            conn.row_factory = sqlite3.Row
+            self.profile.apply(conn)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _call(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        conn = self._connection()
+        try:
+            return operation(conn)
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+    async def run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, operation)
+
+    def lag(self, timeout: float = 1.0) -> float:
+        """Seconds a no-op waits for a free worker (queueing delay)."""
+        submitted = time.perf_counter()
+        started = self._executor.submit(time.perf_counter).result(timeout)
+        return started - submitted
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
@@ -0,0 +1,95 @@
+import sqlite3
+from collections.abc import Iterator
+from typing import Any
+
+from app.domain.pagination import Page, PageRequest
+
+STREAM_BATCH_SIZE = 500
+
+
+def select_columns(
+    columns: tuple[str, ...],
+    fields: tuple[str, ...] | None,
+) -> tuple[str, ...]:
+    """Project ``fields`` onto the table's ``columns``, always keeping ``id``.
+
+    Only names present in ``columns`` survive, so the result is safe to
+    interpolate into SQL.
+    """
+    if not fields:
+        return columns
+    return (
+        "id",
+        *(name for name in columns if name in fields and name != "id"),
+    )
+
+
+def _keyset_query(
+    table: str,
+    selected: tuple[str, ...],
+    after: int | None,
+    limit: int | None,
+) -> tuple[str, list[int]]:
+    sql = f"SELECT {', '.join(selected)} FROM {table}"
+    params: list[int] = []
+    if after is not None:
+        sql += " WHERE id > ?"
+        params.append(after)
+    sql += " ORDER BY id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return sql, params
+
+
+def _to_items(
+    rows: list[Any],
+    selected: tuple[str, ...],
+    wanted: tuple[str, ...],
+) -> list[dict[str, Any]]:
+    return [
+        {name: row[i] for i, name in enumerate(selected) if name in wanted}
+        for row in rows
+    ]
+
+
+def fetch_page(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: tuple[str, ...],
+    page: PageRequest,
+) -> Page:
+    selected = select_columns(columns, page.fields)
+    # One extra row tells us whether a next page exists
+    limit = page.limit + 1 if page.limit is not None else None
+    sql, params = _keyset_query(table, selected, page.after, limit)
+    rows = conn.execute(sql, params).fetchall()
+
+    has_more = page.limit is not None and len(rows) > page.limit
+    rows = rows[: page.limit]
+    items = _to_items(rows, selected, page.fields or columns)
+    next_after = rows[-1][0] if has_more else None
+    return Page(items=items, next_after=next_after)
+
+
+def iter_rows(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: tuple[str, ...],
+    page: PageRequest,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield the keyset range in batches read with ``fetchmany``.
+
+    Unlike ``fetch_page`` nothing beyond one batch is held in memory, and
+    ``page.limit`` may be ``None`` to walk the whole table.
+    """
+    selected = select_columns(columns, page.fields)
+    sql, params = _keyset_query(table, selected, page.after, page.limit)
+    cursor = conn.execute(sql, params)
+    wanted = page.fields or columns
+    try:
+        while rows := cursor.fetchmany(batch_size):
+            yield _to_items(rows, selected, wanted)
+    finally:
+        cursor.close()
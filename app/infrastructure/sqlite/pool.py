@@ -0,0 +1,210 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from queue import Empty, Full, LifoQueue
+from typing import TypeVar
+
+from app.infrastructure.sqlite.profile import StorageProfile
+
+T = TypeVar("T")
+
+MEMORY_PATHS = (":memory:", "file::memory:?cache=shared")
+
+
+class SQLiteConnectionPool:
+    """Bounded pool of long-lived SQLite connections.
+
+    Connections are created lazily up to ``size`` and handed out with
+    ``connection()``. Each checkout runs a cheap health check and replaces
+    broken connections; returned connections have any open transaction
+    rolled back. New connections get the ``profile`` PRAGMAs applied, and
+    ``write()`` runs a transaction under the profile's busy-retry policy.
+    In-memory databases are private to a single connection, so they always
+    use a pool of one.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 5,
+        timeout: float = 5.0,
+        profile: StorageProfile | None = None,
+        on_connect: Callable[[sqlite3.Connection], None] | None = None,
+        factory: type[sqlite3.Connection] = sqlite3.Connection,
+    ) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        if db_path not in MEMORY_PATHS:
+            db_dir = os.path.dirname(db_path)
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir, exist_ok=True)
+        else:
+            size = 1
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.profile = profile or StorageProfile()
+        self._on_connect = on_connect
+        self._factory = factory
+        self._idle: LifoQueue[sqlite3.Connection] = LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def in_use(self) -> int:
+        return self._created - self._idle.qsize()
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of the pool's connections currently checked out."""
+        return self.in_use / self.size
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            uri=self.db_path.startswith("file:"),
+            factory=self._factory,
+        )
+        conn.row_factory = sqlite3.Row
+        self.profile.apply(conn)
+        if self._on_connect is not None:
+            self._on_connect(conn)
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def acquire(self, timeout: float | None = None) -> sqlite3.Connection:
+        if timeout is None:
+            timeout = self.timeout
+        if self._closed:
+            raise RuntimeError("Database connection is closed")
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                with self._lock:
+                    if self._created < self.size:
+                        self._created += 1
+                        break
+                try:
+                    conn = self._idle.get(timeout=timeout)
+                except Empty:
+                    raise TimeoutError(
+                        "Timed out waiting for a database connection",
+                    ) from None
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if self._closed:
+            self._discard(conn)
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (sqlite3.Error, Full):
+            self._discard(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def dedicated(self) -> Iterator[sqlite3.Connection]:
+        """A connection of its own, outside the pool, closed afterwards.
+
+        For long-lived readers such as streamed responses, which would
+        otherwise keep a pooled connection for as long as a slow client
+        takes to read. In-memory databases only exist on the pooled
+        connection, so they use that instead.
+        """
+        if self.db_path in MEMORY_PATHS:
+            with self.connection() as conn:
+                yield conn
+            return
+        if self._closed:
+            raise RuntimeError("Database connection is closed")
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def ping(self, timeout: float = 1.0) -> None:
+        """Raise unless the database file can be read within ``timeout``.
+
+        ``SELECT 1`` alone never touches the file, so the schema version
+        is read too: that needs the file to exist and a shared lock.
+        """
+        if self.db_path not in MEMORY_PATHS and not os.path.exists(
+            self.db_path,
+        ):
+            raise FileNotFoundError(f"Database file {self.db_path} is missing")
+        conn = self.acquire(timeout)
+        busy_timeout_ms = int(self.profile.busy_timeout_ms)
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+            try:
+                conn.execute("SELECT 1").fetchone()
+                conn.execute("PRAGMA schema_version").fetchone()
+            finally:
+                conn.execute(f"PRAGMA busy_timeout = {busy_timeout_ms}")
+        finally:
+            self.release(conn)
+
+    def write(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        def attempt() -> T:
+            with self.connection() as conn:
+                try:
+                    result = operation(conn)
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+                return result
+
+        return self.profile.retry_on_busy(attempt)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(conn)
@@ -0,0 +1,75 @@
+import random
+import sqlite3
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from os import getenv
+from typing import TypeVar
+
+T = TypeVar("T")
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+BUSY_CODES = {sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED}
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    journal_mode: str = getenv("SQLITE_JOURNAL_MODE", "WAL")
+    synchronous: str = getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    # Negative values are KiB, positive values are pages (SQLite semantics)
+    cache_size: int = int(getenv("SQLITE_CACHE_SIZE", "-16000"))
+    mmap_size: int = int(getenv("SQLITE_MMAP_SIZE", "134217728"))
+    temp_store: str = getenv("SQLITE_TEMP_STORE", "MEMORY")
+    busy_timeout_ms: int = int(getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    write_retries: int = int(getenv("SQLITE_WRITE_RETRIES", "5"))
+    retry_backoff_ms: int = int(getenv("SQLITE_RETRY_BACKOFF_MS", "10"))
+    retry_max_ms: int = int(getenv("SQLITE_RETRY_MAX_MS", "500"))
+
+    def __post_init__(self) -> None:
+        # PRAGMA values cannot be bound as parameters, so they are validated
+        # against SQLite's keywords before being interpolated.
+        _check("journal_mode", self.journal_mode, JOURNAL_MODES)
+        _check("synchronous", self.synchronous, SYNCHRONOUS_LEVELS)
+        _check("temp_store", self.temp_store, TEMP_STORES)
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode.upper()}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous.upper()}")
+        conn.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store.upper()}")
+
+    def retry_on_busy(self, operation: Callable[[], T]) -> T:
+        attempt = 0
+        while True:
+            try:
+                return operation()
+            except sqlite3.OperationalError as exc:
+                if not is_busy_error(exc) or attempt >= self.write_retries:
+                    raise
+            delay_ms = min(
+                self.retry_max_ms,
+                self.retry_backoff_ms * 2**attempt,
+            )
+            # Full jitter keeps competing writers from retrying in lockstep
+            time.sleep(random.uniform(0, delay_ms) / 1000)
+            attempt += 1
+
+
+def is_busy_error(exc: sqlite3.Error) -> bool:
+    code = getattr(exc, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in BUSY_CODES
+    message = str(exc).lower()
+    return "locked" in message or "busy" in message
+
+
+def _check(name: str, value: str, allowed: set[str]) -> None:
+    if value.upper() not in allowed:
+        raise ValueError(
+            f"Invalid SQLite {name} {value!r}; "
+            f"expected one of {', '.join(sorted(allowed))}",
+        )
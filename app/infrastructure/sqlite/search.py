@@ -0,0 +1,133 @@
+import re
+import sqlite3
+from typing import Any
+
+from app.domain.pagination import Page, PageRequest
+from app.infrastructure.sqlite.keyset import select_columns
+
+_TOKEN = re.compile(r"\w+")
+
+
+def search_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def install_search_index(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: tuple[str, ...],
+) -> None:
+    """Mirror ``columns`` of ``table`` into an FTS5 index kept by triggers.
+
+    The index is external-content (it stores only the token index and
+    reads column values from ``table``). Creating it on a table that
+    already has rows indexes them once.
+    """
+    fts = search_table(table)
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = ?",
+        (fts,),
+    ).fetchone()
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{name}" for name in columns)
+    old_values = ", ".join(f"old.{name}" for name in columns)
+    conn.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{names}, content='{table}', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2')",
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {fts} (rowid, {names}) VALUES (new.id, {new_values});
+        END
+        """,
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {names})
+            VALUES ('delete', old.id, {old_values});
+        END
+        """,
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE ON {table}
+        BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {names})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO {fts} (rowid, {names}) VALUES (new.id, {new_values});
+        END
+        """,
+    )
+    if not exists:
+        rebuild_search_index(conn, table)
+
+
+def has_search_index(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = ?",
+        (search_table(table),),
+    ).fetchone()
+    return row is not None
+
+
+def rebuild_search_index(conn: sqlite3.Connection, table: str) -> None:
+    fts = search_table(table)
+    conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+
+def match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 query: every word, as a prefix.
+
+    Words are quoted, so FTS5 operators in user input have no effect.
+    Returns ``None`` when the text has no searchable words.
+    """
+    words = _TOKEN.findall(query.lower())
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def fetch_search_page(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: tuple[str, ...],
+    page: PageRequest,
+) -> Page:
+    """Best matches first, paged by ``(rank, id)`` keyset.
+
+    ``rank`` is FTS5's bm25 score (lower is better).
+    """
+    expression = match_expression(page.query or "")
+    if expression is None or page.limit is None:
+        return Page()
+    fts = search_table(table)
+    selected = select_columns(columns, page.fields)
+    sql = (
+        f"SELECT {', '.join(f't.{name}' for name in selected)}, f.rank "
+        f"FROM {fts} f JOIN {table} t ON t.id = f.rowid "
+        f"WHERE {fts} MATCH ?"
+    )
+    params: list[Any] = [expression]
+    if page.after is not None and page.after_rank is not None:
+        sql += " AND (f.rank, f.rowid) > (?, ?)"
+        params.extend((page.after_rank, page.after))
+    sql += " ORDER BY f.rank, f.rowid LIMIT ?"
+    params.append(page.limit + 1)
+    rows = conn.execute(sql, params).fetchall()
+
+    has_more = len(rows) > page.limit
+    rows = rows[: page.limit]
+    wanted = page.fields or columns
+    items = [
+        {name: row[i] for i, name in enumerate(selected) if name in wanted}
+        for row in rows
+    ]
+    if not has_more:
+        return Page(items=items)
+    last = rows[-1]
+    return Page(items=items, next_after=last[0], next_rank=last[-1])
@@ -0,0 +1,57 @@
+import sqlite3
+
+from app.domain.versioning import TableVersion
+
+NOW = "(julianday('now') - 2440587.5) * 86400.0"
+
+
+def install_version_tracking(conn: sqlite3.Connection, table: str) -> None:
+    """Keep a per-table write counter in ``table_versions`` via triggers.
+
+    Every INSERT, UPDATE or DELETE on ``table`` bumps its version and
+    modification time, whichever connection or process made the write.
+    """
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            modified_at REAL NOT NULL DEFAULT ({NOW})
+        )
+        """,
+    )
+    conn.execute(
+        "INSERT OR IGNORE INTO table_versions (name) VALUES (?)",
+        (table,),
+    )
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()}
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE table_versions
+                SET version = version + 1, modified_at = {NOW}
+                WHERE name = '{table}';
+            END
+            """,
+        )
+
+
+def bump_version(conn: sqlite3.Connection, table: str) -> None:
+    """Record a write made while the tracking triggers were dropped."""
+    conn.execute(
+        f"UPDATE table_versions SET version = version + 1, modified_at = {NOW} "
+        "WHERE name = ?",
+        (table,),
+    )
+
+
+def read_version(conn: sqlite3.Connection, table: str) -> TableVersion:
+    row = conn.execute(
+        "SELECT version, modified_at FROM table_versions WHERE name = ?",
+        (table,),
+    ).fetchone()
+    if row is None:
+        return TableVersion(version=0, modified_at=0.0)
+    return TableVersion(version=row[0], modified_at=row[1])
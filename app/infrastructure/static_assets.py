@@ -0,0 +1,59 @@
+import json
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+
+# Written by ``app.infrastructure.static_build`` into the build directory
+MANIFEST = "manifest.json"
+
+
+@dataclass(frozen=True)
+class Asset:
+    # Fingerprinted path relative to the build directory
+    path: str
+    digest: str
+    # Precompressed variants, most preferred first
+    encodings: tuple[str, ...] = ()
+
+    @property
+    def mimetype(self) -> str:
+        mimetype, _ = mimetypes.guess_type(self.path)
+        return mimetype or "application/octet-stream"
+
+
+class StaticAssets:
+    """Looks up built assets by logical or fingerprinted path.
+
+    Without a build (no manifest) nothing resolves and callers fall back
+    to the source directory.
+    """
+
+    def __init__(self, source_dir: Path, build_dir: Path) -> None:
+        self.source_dir = source_dir
+        self.build_dir = build_dir
+        self._logical: dict[str, Asset] = {}
+        self._fingerprinted: dict[str, Asset] = {}
+        manifest = build_dir / MANIFEST
+        if manifest.is_file():
+            for logical, entry in json.loads(manifest.read_text()).items():
+                asset = Asset(
+                    path=entry["path"],
+                    digest=entry["digest"],
+                    encodings=tuple(entry["encodings"]),
+                )
+                self._logical[logical] = asset
+                self._fingerprinted[asset.path] = asset
+
+    @property
+    def built(self) -> bool:
+        return bool(self._logical)
+
+    def resolve(self, path: str) -> tuple[Asset, bool] | None:
+        """Return the asset at ``path`` and whether it was fingerprinted."""
+        asset = self._fingerprinted.get(path)
+        if asset is not None:
+            return asset, True
+        asset = self._logical.get(path)
+        if asset is not None:
+            return asset, False
+        return None
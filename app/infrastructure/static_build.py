@@ -0,0 +1,99 @@
+"""Fingerprinted, precompressed copies of the static files.
+
+``python -m app.infrastructure.static_build`` copies every file under the
+source directory to ``<stem>.<digest><suffix>`` in the build directory,
+writes ``.br``/``.gz`` variants next to the compressible ones and records
+the mapping in ``manifest.json``. Because a fingerprinted name changes
+whenever the content does, it can be cached forever.
+"""
+
+import argparse
+import hashlib
+import json
+import mimetypes
+import shutil
+from collections.abc import Sequence
+from pathlib import Path, PurePosixPath
+
+from app.infrastructure.compression import (
+    ENCODINGS,
+    SUFFIXES,
+    compress,
+    compressible,
+)
+from app.infrastructure.static_assets import MANIFEST, Asset
+
+# Variants of smaller files save less than their headers cost
+MIN_COMPRESS_BYTES = 256
+
+
+def fingerprinted_name(path: str, digest: str) -> str:
+    posix = PurePosixPath(path)
+    return str(posix.with_name(f"{posix.stem}.{digest}{posix.suffix}"))
+
+
+def build_static(
+    source: Path,
+    output: Path,
+    encodings: Sequence[str] = ENCODINGS,
+) -> dict[str, Asset]:
+    """Rebuild ``output`` from ``source`` and return the manifest."""
+    if output.exists():
+        shutil.rmtree(output)
+    output.mkdir(parents=True)
+    manifest: dict[str, Asset] = {}
+    for file in sorted(source.rglob("*")):
+        if not file.is_file():
+            continue
+        logical = file.relative_to(source).as_posix()
+        data = file.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        target = output / fingerprinted_name(logical, digest)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        written = []
+        mimetype, _ = mimetypes.guess_type(logical)
+        if compressible(mimetype) and len(data) >= MIN_COMPRESS_BYTES:
+            for encoding in encodings:
+                body = compress(data, encoding)
+                if len(body) < len(data):
+                    target.with_name(
+                        target.name + SUFFIXES[encoding],
+                    ).write_bytes(body)
+                    written.append(encoding)
+        manifest[logical] = Asset(
+            path=target.relative_to(output).as_posix(),
+            digest=digest,
+            encodings=tuple(written),
+        )
+    (output / MANIFEST).write_text(
+        json.dumps(
+            {
+                logical: {
+                    "path": asset.path,
+                    "digest": asset.digest,
+                    "encodings": list(asset.encodings),
+                }
+                for logical, asset in manifest.items()
+            },
+            indent=2,
+            sort_keys=True,
+        ),
+    )
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> None:
+    root = Path(__file__).parent.parent.parent
+    parser = argparse.ArgumentParser(description="Build the static assets")
+    parser.add_argument("--source", type=Path, default=root / "public")
+    parser.add_argument("--output", type=Path, default=root / "build/static")
+    args = parser.parse_args(argv)
+    manifest = build_static(args.source, args.output)
+    for logical, asset in manifest.items():
+        variants = ", ".join(asset.encodings) or "-"
+        print(f"{logical} -> {asset.path} ({variants})")
+
+
+if __name__ == "__main__":
+    main()
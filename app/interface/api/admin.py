@@ -0,0 +1,160 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import wraps
+from os import getenv
+from typing import Any
+
+from flask import Blueprint, Flask, Response, g, jsonify, request
+
+from app.infrastructure.profiling.request_profiler import ProfilingSession
+from app.infrastructure.profiling.sampler import (
+    dump_thread_stacks,
+    format_collapsed,
+    sample_stacks,
+)
+from app.interface.api.auth import AuthError, authenticate_request
+
+
+@dataclass(frozen=True)
+class AdminSettings:
+    enabled: bool = getenv("ADMIN_PROFILING_ENABLED", "false").lower() == "true"
+    # Token subjects allowed to use the admin routes; empty denies all
+    subjects: tuple[str, ...] = field(
+        default_factory=lambda: tuple(
+            subject.strip()
+            for subject in getenv("ADMIN_SUBJECTS", "").split(",")
+            if subject.strip()
+        ),
+    )
+    max_seconds: float = float(getenv("ADMIN_PROFILE_MAX_SECONDS", "60"))
+    max_requests: int = int(getenv("ADMIN_PROFILE_MAX_REQUESTS", "1000"))
+
+
+admin_bp = Blueprint("admin", __name__)
+
+_session: ProfilingSession | None = None
+_session_lock = threading.Lock()
+
+
+def require_admin(view: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            claims = authenticate_request()
+        except AuthError as exc:
+            return jsonify({"detail": exc.detail}), 401
+        # Any caller can get a token from /v1/auth/login, so a token alone
+        # is not enough
+        if claims.get("sub") not in AdminSettings().subjects:
+            return jsonify({"detail": "Admin access required"}), 403
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+def _download(body: str | bytes, filename: str, mimetype: str) -> Response:
+    response = Response(body, mimetype=mimetype)
+    response.headers["Content-Disposition"] = (
+        f'attachment; filename="{filename}"'
+    )
+    return response
+
+
+def _bounded(name: str, limit: float, cast: type) -> Any:
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        parsed = cast(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number") from None
+    if not 0 < parsed <= limit:
+        raise ValueError(f"{name} must be between 0 and {limit}")
+    return parsed
+
+
+def _begin_request_profile() -> None:
+    session = _session
+    if session is not None:
+        profile = session.start()
+        if profile is not None:
+            g.admin_profile = (session, profile)
+
+
+def _end_request_profile(exc: BaseException | None) -> None:
+    active = g.pop("admin_profile", None)
+    if active is not None:
+        session, profile = active
+        session.finish(profile)
+
+
+def install_request_profiler(app: Flask) -> None:
+    """Hook requests into the on-demand cProfile session.
+
+    With no session armed each request pays one global lookup.
+    """
+    app.before_request(_begin_request_profile)
+    app.teardown_request(_end_request_profile)
+
+
+@admin_bp.route("/profile", methods=["POST"])
+@require_admin
+def start_profile():
+    global _session
+    settings = AdminSettings()
+    try:
+        max_requests = _bounded("requests", settings.max_requests, int)
+        seconds = _bounded("seconds", settings.max_seconds, float)
+    except ValueError as exc:
+        return jsonify({"detail": str(exc)}), 400
+    if max_requests is None and seconds is None:
+        return jsonify({"detail": "Pass requests=N or seconds=T"}), 400
+    with _session_lock:
+        if _session is not None and not _session.done:
+            return jsonify({"detail": "A profile is already running"}), 409
+        # The admin request itself starts before the session and is not
+        # part of it.
+        _session = ProfilingSession(max_requests, seconds)
+        return jsonify(_session.status()), 202
+
+
+@admin_bp.route("/profile", methods=["GET"])
+@require_admin
+def get_profile():
+    session = _session
+    if session is None:
+        return jsonify({"detail": "No profile has been started"}), 404
+    if not session.done:
+        return jsonify(session.status()), 202
+    output = request.args.get("format", "text")
+    if output == "pstats":
+        return _download(
+            session.pstats_bytes(),
+            "profile.pstats",
+            "application/octet-stream",
+        )
+    if output == "collapsed":
+        return _download(session.collapsed(), "profile.folded", "text/plain")
+    if output == "text":
+        return Response(session.text(), mimetype="text/plain")
+    return jsonify({"detail": "format must be text, pstats or collapsed"}), 400
+
+
+@admin_bp.route("/sample", methods=["GET"])
+@require_admin
+def sample():
+    settings = AdminSettings()
+    try:
+        seconds = _bounded("seconds", settings.max_seconds, float) or 5.0
+        interval_ms = _bounded("interval_ms", 1000, float) or 5.0
+    except ValueError as exc:
+        return jsonify({"detail": str(exc)}), 400
+    samples = sample_stacks(seconds, interval_ms / 1000)
+    return _download(format_collapsed(samples), "samples.folded", "text/plain")
+
+
+@admin_bp.route("/threads", methods=["GET"])
+@require_admin
+def threads():
+    return Response(dump_thread_stacks(), mimetype="text/plain")
@@ -0,0 +1,166 @@
+import asyncio
+import json
+from collections.abc import Iterable
+from time import perf_counter
+from typing import Any
+
+from werkzeug.wsgi import ClosingIterator
+
+from app.infrastructure.admission.limiter import (
+    ADMITTED,
+    QUEUED,
+    AdmissionController,
+    RouteGroup,
+)
+from app.infrastructure.metrics.registry import REGISTRY
+
+ADMISSIONS = REGISTRY.counter(
+    "admission_requests_total",
+    "Requests by route group and admission outcome",
+    ("group", "outcome"),
+)
+LIMIT = REGISTRY.gauge(
+    "admission_limit",
+    "Current concurrency limit per route group",
+    ("group",),
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "admission_queue_depth",
+    "Requests waiting for a slot per route group",
+    ("group",),
+)
+
+_BODY = json.dumps({"detail": "Server is overloaded, retry later"}).encode()
+
+
+def _headers(controller: AdmissionController) -> list[tuple[str, str]]:
+    return [
+        ("Content-Type", "application/json"),
+        ("Content-Length", str(len(_BODY))),
+        ("Retry-After", str(controller.settings.retry_after_seconds)),
+    ]
+
+
+def _observe(controller: AdmissionController) -> None:
+    for group in [*controller.groups, controller.default]:
+        LIMIT.set(group.name, value=int(group.limit.limit))
+        QUEUE_DEPTH.set(group.name, value=group.queued)
+
+
+def install_admission_metrics(controller: AdmissionController) -> None:
+    REGISTRY.on_collect(lambda: _observe(controller))
+
+
+class AdmissionMiddleware:
+    """WSGI middleware (waitress) that sheds load per route group.
+
+    Requests beyond a group's limit wait in its bounded queue on their own
+    thread; when the queue is full or the wait exceeds the deadline they
+    get ``503`` with ``Retry-After`` before any application code runs.
+    The slot is held until the body has been sent, while the latency fed
+    to the limit is the time to produce the response.
+    """
+
+    def __init__(self, app: Any, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    def __call__(
+        self,
+        environ: dict[str, Any],
+        start_response: Any,
+    ) -> Iterable[bytes]:
+        group = self.controller.group_for(environ.get("PATH_INFO", ""))
+        if group is None:
+            return self.app(environ, start_response)
+        if not self.controller.admit(group):
+            ADMISSIONS.inc(group.name, "rejected")
+            start_response("503 Service Unavailable", _headers(self.controller))
+            return [_BODY]
+        ADMISSIONS.inc(group.name, "admitted")
+        started = perf_counter()
+        try:
+            result = self.app(environ, start_response)
+        except BaseException:
+            group.release(None)
+            raise
+        latency = perf_counter() - started
+        return ClosingIterator(result, lambda: group.release(latency))
+
+
+class AsgiAdmissionMiddleware:
+    """ASGI counterpart for uvicorn, in front of the ``WsgiToAsgi`` bridge.
+
+    Queued requests wait on the event loop, so they hold neither a bridge
+    thread nor a database connection while they wait.
+    """
+
+    def __init__(self, app: Any, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        group = None
+        if scope["type"] == "http":
+            group = self.controller.group_for(scope["path"])
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+        if not await self._admit(group):
+            ADMISSIONS.inc(group.name, "rejected")
+            await self._reject(send)
+            return
+        ADMISSIONS.inc(group.name, "admitted")
+        started = perf_counter()
+        latency = None
+
+        async def timed_send(message: dict) -> None:
+            nonlocal latency
+            if message["type"] == "http.response.start":
+                latency = perf_counter() - started
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            group.release(latency)
+
+    async def _admit(self, group: RouteGroup) -> bool:
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(
+                lambda: granted.done() or granted.set_result(None),
+            )
+
+        outcome, ticket = group.try_admit(wake)
+        if outcome != QUEUED:
+            return outcome == ADMITTED
+        assert ticket is not None
+        try:
+            await asyncio.wait_for(
+                granted,
+                self.controller.settings.queue_timeout_seconds,
+            )
+            return True
+        except asyncio.TimeoutError:
+            return not group.abandon(ticket)
+        except asyncio.CancelledError:
+            # The client went away while queued
+            if not group.abandon(ticket):
+                group.release(None)
+            raise
+
+    async def _reject(self, send: Any) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (name.lower().encode(), value.encode())
+                    for name, value in _headers(self.controller)
+                ],
+            },
+        )
+        await send({"type": "http.response.body", "body": _BODY})
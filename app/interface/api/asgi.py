@@ -0,0 +1,28 @@
+import asyncio
+import contextvars
+from typing import Any
+
+
+class FreshContextMiddleware:
+    """Run every HTTP request in its own empty ``contextvars.Context``.
+
+    uvicorn's httptools protocol starts each request on a keep-alive
+    connection in the context the previous request left behind. asgiref
+    keeps the executor behind ``WsgiToAsgi``'s sync/async hops in
+    context-local state, so the next request on the connection found the
+    finished executor of the last one and failed with "CurrentThreadExecutor
+    already quit or is broken" (about every other request).
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        # Cancelling this task (client gone) cancels the inner one too
+        await asyncio.create_task(
+            self.app(scope, receive, send),
+            context=contextvars.Context(),
+        )
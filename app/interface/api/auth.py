@@ -0,0 +1,51 @@
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from flask import g, jsonify, request
+
+from app.core.dependencies import get_auth_service
+
+
+class AuthError(Exception):
+    def __init__(self, detail: str) -> None:
+        super().__init__(detail)
+        self.detail = detail
+
+
+def authenticate_request() -> dict:
+    """Decode the bearer token once per request and keep claims on ``g``.
+
+    Raises ``AuthError`` when the header is missing or the token is
+    invalid or expired.
+    """
+    if "claims" in g:
+        return g.claims
+    authorization = request.headers.get("Authorization", "")
+    if not authorization.startswith("Bearer "):
+        raise AuthError("Missing bearer token")
+    token = authorization.removeprefix("Bearer ").strip()
+    if not token:
+        raise AuthError("Missing bearer token")
+    try:
+        g.claims = get_auth_service().decode_token(token)
+    except Exception:  # noqa: BLE001
+        raise AuthError("Invalid or expired token") from None
+    return g.claims
+
+
+def require_auth(view: Callable[..., Any]) -> Callable[..., Any]:
+    """Reject the request with 401 unless it carries a valid bearer token.
+
+    The decoded claims are available to the view as ``g.claims``.
+    """
+
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            authenticate_request()
+        except AuthError as exc:
+            return jsonify({"detail": exc.detail}), 401
+        return view(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from os import getenv
+
+from flask import Flask, Response, request
+
+from app.infrastructure.cache.backend import MISSING, LRUCache
+from app.infrastructure.compression import ENCODINGS, compress, compressible
+
+
+@dataclass(frozen=True)
+class CompressionSettings:
+    enabled: bool = getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    # Smaller bodies fit in a packet or two either way and only cost CPU
+    min_bytes: int = int(getenv("COMPRESSION_MIN_BYTES", "1024"))
+    # Per-response levels favour speed; the static build uses the maximum
+    gzip_level: int = int(getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    brotli_quality: int = int(getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    # Compressed copies of served files (the Swagger UI bundle), by ETag
+    file_cache_size: int = int(getenv("COMPRESSION_FILE_CACHE_SIZE", "64"))
+
+
+def install_compression(
+    app: Flask,
+    settings: CompressionSettings | None = None,
+) -> None:
+    """Compress responses for clients that send ``Accept-Encoding``.
+
+    Buffered bodies of a compressible type and at least ``min_bytes`` are
+    encoded with the best coding the client accepts. Streamed bodies and
+    responses that already carry a ``Content-Encoding`` (precompressed
+    static files) pass through untouched. The ETag is weakened, as the
+    representation changes but its meaning does not, so conditional
+    requests keep matching.
+    """
+    settings = settings or CompressionSettings()
+    levels = {"gzip": settings.gzip_level, "br": settings.brotli_quality}
+    files = (
+        LRUCache(max_entries=settings.file_cache_size)
+        if settings.file_cache_size > 0
+        else None
+    )
+
+    def compress_file(response: Response, encoding: str) -> bytes | None:
+        # Files are only compressed once per version, keyed by their ETag
+        etag, _ = response.get_etag()
+        if files is None or etag is None:
+            return None
+        key = f"{etag}:{encoding}"
+        body = files.get(key)
+        if body is MISSING:
+            response.direct_passthrough = False
+            body = compress(response.get_data(), encoding, levels[encoding])
+            files.set(key, body)
+        else:
+            response.close()
+        return body
+
+    def compress_response(response: Response) -> Response:
+        if (
+            response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or not compressible(response.mimetype)
+        ):
+            return response
+        size = response.content_length
+        if size is None or size < settings.min_bytes:
+            return response
+        # Whether the body is compressed depends on this header
+        response.vary.add("Accept-Encoding")
+        encoding = request.accept_encodings.best_match(ENCODINGS)
+        if encoding is None:
+            return response
+        if response.direct_passthrough:
+            body = compress_file(response, encoding)
+            if body is None:
+                return response
+            # Ranges would address the uncompressed file
+            response.headers.pop("Accept-Ranges", None)
+        elif response.is_streamed:
+            return response
+        else:
+            body = compress(response.get_data(), encoding, levels[encoding])
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag is not None and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    app.after_request(compress_response)
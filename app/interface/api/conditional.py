@@ -0,0 +1,52 @@
+import hashlib
+from email.utils import formatdate
+
+from flask import Request, Response
+
+from app.domain.versioning import TableVersion
+
+
+def make_etag(table: str, version: TableVersion, request: Request) -> str:
+    """Strong ETag for one representation of ``table`` at ``version``.
+
+    The query string and ``Accept`` header select the representation
+    (page, projection, stream format), so they are part of the tag.
+    """
+    variant = f"{request.query_string.decode()}|{request.headers.get('Accept')}"
+    digest = hashlib.blake2b(variant.encode(), digest_size=8).hexdigest()
+    return f'"{table}-{version.version}-{digest}"'
+
+
+def not_modified(
+    request: Request,
+    etag: str,
+    version: TableVersion,
+) -> Response | None:
+    """Return a bodyless 304 when the client's copy is still current."""
+    if request.if_none_match:
+        matched = request.if_none_match.contains_weak(etag.strip('"'))
+    elif request.if_modified_since:
+        matched = int(version.modified_at) <= int(
+            request.if_modified_since.timestamp(),
+        )
+    else:
+        matched = False
+    if not matched:
+        return None
+    response = Response(status=304)
+    add_validators(response, etag, version)
+    return response
+
+
+def add_validators(
+    response: Response,
+    etag: str,
+    version: TableVersion,
+) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = formatdate(
+        version.modified_at,
+        usegmt=True,
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept")
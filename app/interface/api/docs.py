@@ -0,0 +1,112 @@
+import hashlib
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from os import getenv
+from pathlib import Path
+from typing import Any
+
+from flask import Flask, Response, request
+
+SPEC_ENDPOINT = "swagger"
+
+SWAGGER_CONFIG: dict[str, Any] = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": SPEC_ENDPOINT,
+            "route": "/swagger.json",
+            "rule_filter": lambda rule: True,
+            "model_filter": lambda tag: True,
+        }
+    ],
+    "static_url_path": "/flasgger_static",
+    "swagger_ui": True,
+    "specs_route": "/docs",
+}
+
+
+def _docs_default() -> str:
+    # The UI and spec are development aids, off in production by default
+    return "false" if getenv("FLASK_ENV") == "production" else "true"
+
+
+@dataclass(frozen=True)
+class DocsSettings:
+    enabled: bool = getenv("DOCS_ENABLED", _docs_default()).lower() == "true"
+    # Pre-rendered spec (see ``app.interface.api.spec_build``); served as
+    # is instead of walking the view docstrings
+    spec_file: str | None = getenv("DOCS_SPEC_FILE") or None
+
+
+class CachedSpec:
+    """The serialized spec, built on first request and reused after.
+
+    Routes are all registered before the first request, so one build per
+    process is enough; revalidation is answered from the body's ETag.
+    """
+
+    def __init__(self, build: Callable[[], bytes]) -> None:
+        self._build = build
+        self._body: bytes | None = None
+        self._etag = ""
+        self._lock = threading.Lock()
+
+    def body(self) -> bytes:
+        if self._body is None:
+            with self._lock:
+                if self._body is None:
+                    body = self._build()
+                    self._etag = hashlib.blake2b(
+                        body,
+                        digest_size=8,
+                    ).hexdigest()
+                    self._body = body
+        return self._body
+
+    def response(self) -> Response:
+        body = self.body()
+        headers = {"ETag": f'"{self._etag}"', "Cache-Control": "no-cache"}
+        if request.if_none_match.contains_weak(self._etag):
+            return Response(status=304, headers=headers)
+        return Response(body, mimetype="application/json", headers=headers)
+
+
+def render_spec(app: Flask) -> bytes:
+    """Walk the registered views once and serialize the spec."""
+    swagger = getattr(app, "swag", None)
+    if swagger is None:
+        from flasgger import Swagger
+
+        swagger = Swagger(app, config=SWAGGER_CONFIG)
+    with app.app_context():
+        return json.dumps(
+            swagger.get_apispecs(SPEC_ENDPOINT),
+            sort_keys=True,
+        ).encode()
+
+
+def install_docs(
+    app: Flask,
+    settings: DocsSettings | None = None,
+) -> CachedSpec | None:
+    """Serve ``/docs`` and a memoized ``/swagger.json``.
+
+    flasgger is only imported here, so an app without docs never loads it.
+    Returns the spec cache, or ``None`` when docs are disabled.
+    """
+    settings = settings or DocsSettings()
+    if not settings.enabled:
+        return None
+    from flasgger import Swagger
+
+    Swagger(app, config=SWAGGER_CONFIG)
+    spec_file = settings.spec_file
+    if spec_file is not None:
+        spec = CachedSpec(lambda: Path(spec_file).read_bytes())
+    else:
+        spec = CachedSpec(lambda: render_spec(app))
+    # Same URL rule, answered from the cached body
+    app.view_functions[f"flasgger.{SPEC_ENDPOINT}"] = spec.response
+    return spec
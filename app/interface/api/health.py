@@ -1,8 +1,40 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 
 health_bp = Blueprint("health", __name__)
 
+# Probe answers must never come from an HTTP cache
+_NO_STORE = {"Cache-Control": "no-store"}
+
+
+def _warming_up() -> bool:
+    warmup = current_app.extensions.get("warmup")
+    return warmup is not None and not warmup.done
+
 
 @health_bp.route("/health", methods=["GET"])
 def health_check():
+    # Liveness-style: warmup state is only reported by /health/ready
     return jsonify({"status": "ok", "version": "1.0.0"})
+
+
+@health_bp.route("/health/live", methods=["GET"])
+def liveness():
+    """The process is serving requests; dependencies are not checked."""
+    return jsonify({"status": "ok"}), 200, _NO_STORE
+
+
+@health_bp.route("/health/ready", methods=["GET"])
+def readiness():
+    """Whether this instance should receive traffic."""
+    if _warming_up():
+        return jsonify({"status": "starting"}), 503, _NO_STORE
+    probe = current_app.extensions.get("readiness")
+    if probe is None:
+        return jsonify({"status": "ready", "checks": {}}), 200, _NO_STORE
+    ready, checks = probe.run()
+    status = "ready" if ready else "unavailable"
+    return (
+        jsonify({"status": status, "checks": checks}),
+        200 if ready else 503,
+        _NO_STORE,
+    )
@@ -0,0 +1,92 @@
+import json
+from functools import lru_cache
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without orjson installed
+    orjson = None  # type: ignore[assignment]
+
+
+@lru_cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return DefaultJSONProvider.default(obj)
+
+
+def _homogeneous_models(obj: Any) -> type[BaseModel] | None:
+    """Return the model type when ``obj`` is a list of one pydantic model."""
+    if not isinstance(obj, list) or not obj:
+        return None
+    model = type(obj[0])
+    if not issubclass(model, BaseModel):
+        return None
+    if any(type(item) is not model for item in obj):
+        return None
+    return model
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON using the fastest available path.
+
+    Lists of a single pydantic model are encoded in one pass by pydantic's
+    Rust serializer; everything else goes through orjson when installed,
+    or the stdlib encoder otherwise.
+    """
+    model = _homogeneous_models(obj)
+    if model is not None:
+        return _list_adapter(model).dump_json(obj, indent=2 if indent else None)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump_json(indent=2 if indent else None).encode()
+    if orjson is not None:
+        # Datetimes go through _default to keep Flask's RFC 822 format
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    if indent:
+        return json.dumps(obj, default=_default, indent=2).encode()
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson and pydantic serializers.
+
+    Keys keep their insertion order instead of being sorted. Without
+    orjson installed it behaves like the default provider plus pydantic
+    model support.
+    """
+
+    default = staticmethod(_default)
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            kwargs.setdefault("default", self.default)
+            kwargs.setdefault("sort_keys", self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or (
+            self.compact is False
+        )
+        return self._app.response_class(
+            dumps_bytes(obj, indent=indent) + b"\n",
+            mimetype=self.mimetype,
+        )
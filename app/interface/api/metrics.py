@@ -0,0 +1,123 @@
+import hmac
+from time import perf_counter
+
+from flask import Blueprint, Flask, Response, jsonify, request
+
+from app.core.dependencies import (
+    get_auth_service,
+    get_cache_backend,
+    get_cache_settings,
+)
+from app.infrastructure.metrics.registry import (
+    CONTENT_TYPE,
+    REGISTRY,
+    SIZE_BUCKETS,
+    MetricsSettings,
+)
+
+metrics_bp = Blueprint("metrics", __name__)
+
+REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "HTTP requests by route and status",
+    ("method", "endpoint", "status"),
+)
+LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Time until the response is handed to the server",
+    ("method", "endpoint"),
+)
+RESPONSE_SIZE = REGISTRY.histogram(
+    "http_response_size_bytes",
+    "Response body size, when known up front",
+    ("method", "endpoint"),
+    buckets=SIZE_BUCKETS,
+)
+IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled",
+)
+CACHE_STATS = REGISTRY.gauge(
+    "read_cache_stat",
+    "Read-through cache counters (entries, hits, misses, ...)",
+    ("stat",),
+)
+VERIFY_CACHE_STATS = REGISTRY.gauge(
+    "jwt_verify_cache_stat",
+    "Verified-token cache counters (entries, hits, misses, ...)",
+    ("stat",),
+)
+
+
+# Kept in the WSGI environ: one proxy lookup per hook instead of several
+_STARTED = "metrics.started"
+
+
+def _start_timer() -> None:
+    request.environ[_STARTED] = perf_counter()
+    IN_FLIGHT.inc()
+
+
+def _record(response: Response) -> Response:
+    current = request._get_current_object()
+    started = current.environ.get(_STARTED)
+    if started is None:
+        return response
+    # The URL rule, not the path, keeps label cardinality bounded
+    rule = current.url_rule
+    endpoint = rule.rule if rule is not None else "<unmatched>"
+    method = current.method
+    LATENCY.observe(perf_counter() - started, method, endpoint)
+    REQUESTS.inc(method, endpoint, str(response.status_code))
+    # Streamed bodies have no length until they have been sent
+    size = response.content_length
+    if size is not None:
+        RESPONSE_SIZE.observe(size, method, endpoint)
+    return response
+
+
+def _finish(exc: BaseException | None) -> None:
+    if request.environ.pop(_STARTED, None) is not None:
+        IN_FLIGHT.dec()
+
+
+def _collect_cache_stats() -> None:
+    if get_cache_settings().enabled:
+        for stat, value in get_cache_backend().stats().items():
+            CACHE_STATS.set(stat, value=value)
+    for stat, value in get_auth_service().verify_cache_stats().items():
+        VERIFY_CACHE_STATS.set(stat, value=value)
+
+
+def install_request_metrics(app: Flask) -> None:
+    """Record latency, status, size and in-flight requests for every route.
+
+    Install it first: durations then cover the view and every
+    ``after_request`` hook registered later. Streamed responses are timed
+    until their generator is handed to the server.
+    """
+    app.before_request_funcs.setdefault(None, []).insert(0, _start_timer)
+    app.after_request(_record)
+    app.teardown_request(_finish)
+    REGISTRY.on_collect(_collect_cache_stats)
+
+
+def _authorized() -> bool:
+    # Route labels and admission internals are not for the public
+    token = MetricsSettings().token
+    supplied = request.headers.get("Authorization", "")
+    return bool(token) and hmac.compare_digest(
+        supplied.encode(),
+        f"Bearer {token}".encode(),
+    )
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    if not _authorized():
+        return (
+            jsonify({"detail": "A valid metrics token is required"}),
+            401,
+            {"WWW-Authenticate": "Bearer"},
+        )
+    return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
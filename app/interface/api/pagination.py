@@ -0,0 +1,118 @@
+import base64
+import binascii
+import json
+from os import getenv
+from urllib.parse import urlencode
+
+from flask import Request, Response
+
+from app.domain.pagination import Page, PageRequest
+
+DEFAULT_LIMIT = int(getenv("LIST_DEFAULT_LIMIT", "100"))
+MAX_LIMIT = int(getenv("LIST_MAX_LIMIT", "1000"))
+
+
+def encode_cursor(after: int, rank: float | None = None) -> str:
+    payload: dict = {"after": after}
+    if rank is not None:
+        payload["rank"] = rank
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _load_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid cursor") from None
+    # bool is an int subclass, but true/false are not row ids
+    after = payload.get("after") if isinstance(payload, dict) else None
+    if not isinstance(after, int) or isinstance(after, bool):
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+def decode_cursor(cursor: str) -> int:
+    return _load_cursor(cursor)["after"]
+
+
+def decode_search_cursor(cursor: str) -> tuple[int, float]:
+    payload = _load_cursor(cursor)
+    rank = payload.get("rank")
+    if not isinstance(rank, int | float) or isinstance(rank, bool):
+        raise ValueError("Invalid cursor")
+    return payload["after"], float(rank)
+
+
+def parse_page_request(
+    request: Request,
+    allowed: tuple[str, ...],
+    streaming: bool = False,
+) -> PageRequest:
+    """Read ``limit``, ``after``, ``fields`` and ``q`` from the query string.
+
+    Streaming reads are unbounded unless ``limit`` is given explicitly.
+    A ``q`` turns the request into a ranked search, which cannot be
+    streamed. Raises ``ValueError`` with a client-facing message on bad
+    input.
+    """
+    raw_limit = request.args.get("limit")
+    limit: int | None = None if streaming else DEFAULT_LIMIT
+    if raw_limit is not None:
+        try:
+            limit = int(raw_limit)
+        except ValueError:
+            raise ValueError("Invalid limit") from None
+        if limit < 1 or (not streaming and limit > MAX_LIMIT):
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+
+    query = request.args.get("q")
+    if query is not None:
+        query = query.strip()
+        if not query:
+            raise ValueError("q must not be empty")
+        if streaming:
+            raise ValueError("Search results cannot be streamed")
+
+    cursor = request.args.get("after")
+    after = after_rank = None
+    if cursor and query is not None:
+        after, after_rank = decode_search_cursor(cursor)
+    elif cursor:
+        after = decode_cursor(cursor)
+
+    fields: tuple[str, ...] | None = None
+    raw_fields = request.args.get("fields")
+    if raw_fields:
+        names = (name.strip() for name in raw_fields.split(","))
+        fields = tuple(name for name in names if name)
+        if not fields:
+            raise ValueError("fields must name at least one column")
+        unknown = [name for name in fields if name not in allowed]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return PageRequest(
+        limit=limit,
+        after=after,
+        fields=fields,
+        query=query,
+        after_rank=after_rank,
+    )
+
+
+def add_total_count(response: Response, count: int) -> None:
+    response.headers["X-Total-Count"] = str(count)
+
+
+def add_page_headers(response: Response, request: Request, page: Page) -> None:
+    """Expose the next cursor as ``X-Next-Cursor`` and a ``Link`` header."""
+    if page.next_after is None:
+        return
+    cursor = encode_cursor(page.next_after, page.next_rank)
+    args = request.args.to_dict()
+    args["after"] = cursor
+    response.headers["X-Next-Cursor"] = cursor
+    response.headers["Link"] = (
+        f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    )
@@ -0,0 +1,31 @@
+"""Pre-render the OpenAPI spec for ``DOCS_SPEC_FILE``.
+
+``python -m app.interface.api.spec_build`` writes the spec of the current
+routes to ``build/swagger.json``, so a deployment serves a file instead of
+walking the view docstrings after each start.
+"""
+
+import argparse
+from pathlib import Path
+
+from app import create_app
+from app.interface.api.docs import render_spec
+
+
+def main(argv: list[str] | None = None) -> None:
+    root = Path(__file__).parent.parent.parent.parent
+    parser = argparse.ArgumentParser(description="Pre-render the API spec")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=root / "build" / "swagger.json",
+    )
+    args = parser.parse_args(argv)
+    body = render_spec(create_app())
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_bytes(body)
+    print(f"Wrote {args.output} ({len(body)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from flask import Blueprint, Response, request, send_from_directory
+
+from app.core.dependencies import get_static_assets
+from app.infrastructure.compression import SUFFIXES
+
+static_bp = Blueprint("static_files", __name__)
+
+# A fingerprinted URL never changes content, so it may be kept for a year
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+@static_bp.route("/static/<path:path>")
+def asset(path: str) -> Response:
+    assets = get_static_assets()
+    resolved = assets.resolve(path)
+    if resolved is None:
+        # Not built yet, or added since the last build
+        return send_from_directory(assets.source_dir, path)
+    found, fingerprinted = resolved
+    encoding = request.accept_encodings.best_match(found.encodings)
+    filename = found.path + SUFFIXES[encoding] if encoding else found.path
+    response = send_from_directory(
+        assets.build_dir,
+        filename,
+        mimetype=found.mimetype,
+        etag=f"{found.digest}-{encoding}" if encoding else found.digest,
+        max_age=IMMUTABLE_MAX_AGE if fingerprinted else None,
+    )
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    if found.encodings:
+        response.vary.add("Accept-Encoding")
+    if fingerprinted:
+        response.cache_control.immutable = True
+    else:
+        # The logical URL is revalidated; the ETag makes that a 304
+        response.cache_control.no_cache = True
+    return response
@@ -0,0 +1,49 @@
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from flask import Request, Response
+
+from app.interface.api.json_provider import dumps_bytes
+
+JSON = "application/json"
+NDJSON = "application/x-ndjson"
+
+
+def negotiate_stream(request: Request) -> str | None:
+    """Return the streaming mimetype the client asked for, if any.
+
+    ``Accept: application/x-ndjson`` selects NDJSON; ``?stream=true`` with a
+    JSON ``Accept`` selects a chunked JSON array. Anything else gets the
+    regular buffered page.
+    """
+    if request.accept_mimetypes.best_match([JSON, NDJSON]) == NDJSON:
+        return NDJSON
+    if request.args.get("stream", "").lower() in ("1", "true"):
+        return JSON
+    return None
+
+
+def _ndjson(batches: Iterable[list[dict[str, Any]]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield b"".join(dumps_bytes(item) + b"\n" for item in batch)
+
+
+def _json_array(batches: Iterable[list[dict[str, Any]]]) -> Iterator[bytes]:
+    yield b"["
+    separator = b""
+    for batch in batches:
+        if batch:
+            # A batch encodes as "[...]"; strip the brackets to splice it in
+            yield separator + dumps_bytes(batch)[1:-1]
+            separator = b","
+    yield b"]"
+
+
+def stream_response(
+    batches: Iterable[list[dict[str, Any]]],
+    mimetype: str,
+) -> Response:
+    body = _ndjson(batches) if mimetype == NDJSON else _json_array(batches)
+    response = Response(body, mimetype=mimetype)
+    response.headers["Vary"] = "Accept"
+    return response
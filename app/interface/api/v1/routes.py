@@ -1,15 +1,114 @@
-from flask import Blueprint, jsonify, request
+import asyncio
 
-from app.core.dependencies import get_auth_service, get_list_customers_use_case
+from flask import Blueprint, Response, g, jsonify, request
+
+from app.core.dependencies import (
+    get_async_list_customers_use_case,
+    get_auth_service,
+    get_list_customers_use_case,
+)
+from app.domain.customer import CUSTOMER_FIELDS
+from app.domain.pagination import Page
+from app.interface.api.auth import require_auth
+from app.interface.api.conditional import (
+    add_validators,
+    make_etag,
+    not_modified,
+)
+from app.interface.api.pagination import (
+    add_page_headers,
+    add_total_count,
+    parse_page_request,
+)
+from app.interface.api.streaming import negotiate_stream, stream_response
 
 v1_bp = Blueprint("v1", __name__)
 
 
 @v1_bp.route("/customer", methods=["GET"])
 def list_customers():
+    stream = negotiate_stream(request)
+    try:
+        page_request = parse_page_request(
+            request,
+            CUSTOMER_FIELDS,
+            streaming=stream is not None,
+        )
+    except ValueError as exc:
+        return jsonify({"detail": str(exc)}), 400
     use_case = get_list_customers_use_case()
-    customers = use_case.execute()
-    return jsonify([c.model_dump() for c in customers])
+    version = use_case.version()
+    etag = make_etag("customers", version, request)
+    unchanged = not_modified(request, etag, version)
+    if unchanged is not None:
+        return unchanged
+    if request.method == "HEAD":
+        response = Response()
+    elif stream is not None:
+        response = stream_response(
+            use_case.execute_stream(page_request), stream
+        )
+    else:
+        if page_request.query is not None:
+            page = use_case.execute_search(page_request, version)
+        else:
+            page = use_case.execute_page(page_request, version)
+        response = jsonify(page.items)
+        add_page_headers(response, request, page)
+    if page_request.query is None:
+        add_total_count(response, use_case.count(version))
+    add_validators(response, etag, version)
+    return response
+
+
+async def list_customers_async():
+    """Async counterpart of ``list_customers``, enabled by ASYNC_VIEWS.
+
+    Queries run on the repository's SQLite executor. Streams keep the
+    sync generator path since they hold a cursor open until the client
+    has read everything.
+    """
+    stream = negotiate_stream(request)
+    if stream is not None:
+        return list_customers()
+    try:
+        page_request = parse_page_request(request, CUSTOMER_FIELDS)
+    except ValueError as exc:
+        return jsonify({"detail": str(exc)}), 400
+    use_case = get_async_list_customers_use_case()
+    version = await use_case.version()
+    etag = make_etag("customers", version, request)
+    unchanged = not_modified(request, etag, version)
+    if unchanged is not None:
+        return unchanged
+    page: Page | None = None
+    total: int | None = None
+    if page_request.query is not None:
+        if request.method != "HEAD":
+            page = await use_case.execute_search(page_request, version)
+    elif request.method == "HEAD":
+        total = await use_case.count(version)
+    else:
+        # On separate executor workers, so the count does not queue
+        # behind the page query
+        page, total = await asyncio.gather(
+            use_case.execute_page(page_request, version),
+            use_case.count(version),
+        )
+    if page is None:
+        response = Response()
+    else:
+        response = jsonify(page.items)
+        add_page_headers(response, request, page)
+    if total is not None:
+        add_total_count(response, total)
+    add_validators(response, etag, version)
+    return response
+
+
+@v1_bp.route("/customer/count", methods=["GET"])
+def count_customers():
+    return jsonify({"count": get_list_customers_use_case().count()})
 
 
 @v1_bp.route("/auth/login", methods=["GET"])
@@ -22,22 +121,21 @@ def login():
     )
 
 
+@v1_bp.route("/auth/logout", methods=["POST"])
+@require_auth
+def logout():
+    get_auth_service().revoke(g.claims)
+    return jsonify({"message": "Token revoked"})
+
+
 @v1_bp.route("/public", methods=["GET"])
 def public():
     return jsonify({"message": "public endpoint"})
 
 
 @v1_bp.route("/private", methods=["GET"])
+@require_auth
 def private():
-    authorization = request.headers.get("Authorization", "")
-    if not authorization.startswith("Bearer "):
-        return jsonify({"detail": "Missing bearer token"}), 401
-
-    token = authorization.removeprefix("Bearer ").strip()
-    if not token:
-        return jsonify({"detail": "Missing bearer token"}), 401
-
-    payload = get_auth_service().decode_token(token)
     return jsonify(
-        {"message": "private endpoint", "subject": payload.get("sub")},
+        {"message": "private endpoint", "subject": g.claims.get("sub")},
     )
@@ -0,0 +1,13 @@
+from flask import Blueprint, jsonify
+
+from app.core.dependencies import get_auth_service
+
+well_known_bp = Blueprint("well_known", __name__)
+
+
+@well_known_bp.route("/.well-known/jwks.json", methods=["GET"])
+def jwks():
+    response = jsonify(get_auth_service().jwks())
+    # Verifiers may cache keys briefly; rotations publish keys ahead of use
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return response
@@ -1,9 +1,16 @@
+import hashlib
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from os import getenv
 
 import jwt
 
+from app.domain.revocation import RevocationStore
+from app.infrastructure.cache.backend import MISSING, LRUCache
+from app.services.key_set import KeySet
+
 
 @dataclass(frozen=True)
 class AuthSettings:
@@ -13,16 +20,51 @@ class AuthSettings:
     )
     algorithm: str = getenv("JWT_ALGORITHM", "HS256")
     expiry_minutes: int = int(getenv("JWT_EXPIRY_MINUTES", "60"))
+    # Asymmetric keys with kids; when unset, ``secret`` signs with HS*
+    keyset_file: str | None = getenv("JWT_KEYSET_FILE")
+    keyset_reload_seconds: float = float(
+        getenv("JWT_KEYSET_RELOAD_SECONDS", "30"),
+    )
+    # Verified tokens are remembered by digest until they expire, capped
+    # by this TTL; a size of 0 turns the cache off.
+    verify_cache_size: int = int(getenv("JWT_VERIFY_CACHE_SIZE", "10000"))
+    verify_cache_ttl_seconds: int = int(
+        getenv("JWT_VERIFY_CACHE_TTL_SECONDS", "300"),
+    )
 
 
 class AuthService:
-    def __init__(self, settings: AuthSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: AuthSettings | None = None,
+        key_set: KeySet | None = None,
+        revocations: RevocationStore | None = None,
+    ) -> None:
         self._settings = settings or AuthSettings()
+        if key_set is None:
+            if self._settings.keyset_file:
+                key_set = KeySet(
+                    source=self._settings.keyset_file,
+                    reload_seconds=self._settings.keyset_reload_seconds,
+                )
+            else:
+                key_set = KeySet.from_secret(
+                    self._settings.secret,
+                    self._settings.algorithm,
+                )
+        self._keys = key_set
+        self._revocations = revocations
+        self._verified: LRUCache | None = None
+        if self._settings.verify_cache_size > 0:
+            self._verified = LRUCache(
+                max_entries=self._settings.verify_cache_size,
+            )
 
     def issue_token(self, subject: str) -> str:
         now = datetime.now(tz=timezone.utc)
         payload = {
             "sub": subject,
+            "jti": uuid.uuid4().hex,
             "iat": int(now.timestamp()),
             "exp": int(
                 (
@@ -30,15 +72,65 @@ class AuthService:
                 ).timestamp(),
             ),
         }
+        key = self._keys.signing_key()
         return jwt.encode(
             payload,
-            self._settings.secret,
-            algorithm=self._settings.algorithm,
+            key.sign_key,
+            algorithm=key.algorithm,
+            headers={"kid": key.kid},
         )
 
     def decode_token(self, token: str) -> dict:
-        return jwt.decode(
-            token,
-            self._settings.secret,
-            algorithms=[self._settings.algorithm],
+        payload = self._verify(token)
+        # Checked on cache hits too, so a revocation applies immediately
+        jti = payload.get("jti")
+        if (
+            jti is not None
+            and self._revocations is not None
+            and self._revocations.is_revoked(jti)
+        ):
+            raise jwt.InvalidTokenError("Token has been revoked")
+        return payload
+
+    def revoke(self, claims: dict) -> None:
+        """Revoke the token carrying ``claims`` until it would expire."""
+        if self._revocations is None:
+            raise RuntimeError("Token revocation is not configured")
+        if "jti" not in claims:
+            raise jwt.InvalidTokenError("Token has no jti claim")
+        expires_at = claims.get(
+            "exp",
+            time.time() + self._settings.expiry_minutes * 60,
         )
+        self._revocations.revoke(claims["jti"], expires_at)
+
+    def _verify(self, token: str) -> dict:
+        if self._verified is None:
+            return self._decode(token)
+        key = hashlib.sha256(token.encode()).hexdigest()
+        payload = self._verified.get(key)
+        if payload is not MISSING:
+            if payload.get("exp", float("inf")) > time.time():
+                return dict(payload)
+            self._verified.delete(key)
+        payload = self._decode(token)
+        ttl = float(self._settings.verify_cache_ttl_seconds)
+        if "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            self._verified.set(key, payload, ttl)
+        return dict(payload)
+
+    def verify_cache_stats(self) -> dict[str, int]:
+        return self._verified.stats() if self._verified is not None else {}
+
+    def jwks(self) -> dict:
+        return self._keys.jwks()
+
+    def _decode(self, token: str) -> dict:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self._keys.verification_key(kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f"Unknown key id {kid!r}")
+        # Pinning the algorithm to the key rules out alg-confusion tokens
+        return jwt.decode(token, key.verify_key, algorithms=[key.algorithm])
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from jwt.algorithms import get_default_algorithms
+
+SYMMETRIC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    # Parsed key objects (or the shared secret for HMAC), never PEM text
+    verify_key: Any
+    sign_key: Any | None = None
+    # Unix time from which the key may sign; it verifies from load on
+    not_before: float = 0.0
+
+    @property
+    def symmetric(self) -> bool:
+        return self.algorithm in SYMMETRIC_ALGORITHMS
+
+    def jwk(self) -> dict[str, Any]:
+        algorithm = get_default_algorithms()[self.algorithm]
+        jwk = algorithm.to_jwk(self.verify_key, as_dict=True)
+        return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+class KeySet:
+    """Signing and verification keys addressed by ``kid``.
+
+    The signing key is the newest one whose ``not_before`` has passed, so
+    a rotation is scheduled by publishing the next key ahead of time.
+    When loaded from a manifest file the set re-reads it at most every
+    ``reload_seconds`` when its mtime changes, re-parsing only keys whose
+    PEM changed.
+    """
+
+    def __init__(
+        self,
+        keys: list[SigningKey] | None = None,
+        source: str | None = None,
+        reload_seconds: float = 30.0,
+    ) -> None:
+        self._keys: dict[str, SigningKey] = {}
+        self._signers: list[SigningKey] = []
+        self._source = source
+        self._reload_seconds = reload_seconds
+        self._mtime: float | None = None
+        self._checked_at = 0.0
+        self._parsed: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._install(keys or [])
+        if source is not None:
+            self.refresh(force=True)
+
+    @classmethod
+    def from_secret(cls, secret: str, algorithm: str = "HS256") -> "KeySet":
+        return cls([SigningKey("default", algorithm, secret, secret)])
+
+    def _install(self, keys: list[SigningKey]) -> None:
+        self._keys = {key.kid: key for key in keys}
+        self._signers = sorted(
+            (key for key in keys if key.sign_key is not None),
+            key=lambda key: key.not_before,
+            reverse=True,
+        )
+
+    def refresh(self, force: bool = False) -> None:
+        if self._source is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._checked_at < self._reload_seconds:
+            return
+        with self._lock:
+            self._checked_at = now
+            mtime = os.stat(self._source).st_mtime
+            if not force and mtime == self._mtime:
+                return
+            self._install(self._load_manifest(Path(self._source)))
+            self._mtime = mtime
+
+    def signing_key(self) -> SigningKey:
+        self.refresh()
+        now = time.time()
+        for key in self._signers:
+            if key.not_before <= now:
+                return key
+        raise LookupError("No active signing key")
+
+    def verification_key(self, kid: str | None) -> SigningKey | None:
+        self.refresh()
+        if kid is None:
+            # Tokens minted before kids were issued used the only key
+            return self._keys.get("default")
+        return self._keys.get(kid)
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        self.refresh()
+        return {
+            "keys": [
+                key.jwk() for key in self._keys.values() if not key.symmetric
+            ],
+        }
+
+    def _load_manifest(self, path: Path) -> list[SigningKey]:
+        # {"keys": [{"kid", "alg", "private_key"?, "public_key"?,
+        #            "not_before"?}]}, PEM paths relative to the manifest
+        manifest = json.loads(path.read_text())
+        keys = []
+        for entry in manifest["keys"]:
+            algorithm = entry["alg"]
+            if algorithm in SYMMETRIC_ALGORITHMS:
+                raise ValueError("Manifest keys must be asymmetric")
+            impl = get_default_algorithms()[algorithm]
+            sign_key = None
+            if entry.get("private_key"):
+                pem = (path.parent / entry["private_key"]).read_bytes()
+                sign_key = self._parse(impl.prepare_key, pem)
+                verify_key = sign_key.public_key()
+            if entry.get("public_key"):
+                pem = (path.parent / entry["public_key"]).read_bytes()
+                verify_key = self._parse(impl.prepare_key, pem)
+            elif sign_key is None:
+                raise ValueError(f"Key {entry['kid']!r} has no key material")
+            not_before = 0.0
+            if entry.get("not_before"):
+                not_before = datetime.fromisoformat(
+                    entry["not_before"],
+                ).timestamp()
+            keys.append(
+                SigningKey(
+                    kid=entry["kid"],
+                    algorithm=algorithm,
+                    verify_key=verify_key,
+                    sign_key=sign_key,
+                    not_before=not_before,
+                ),
+            )
+        return keys
+
+    def _parse(self, prepare: Any, pem: bytes) -> Any:
+        digest = hashlib.sha256(pem).hexdigest()
+        if digest not in self._parsed:
+            self._parsed[digest] = prepare(pem)
+        return self._parsed[digest]
+
+
+def generate_signing_key(
+    kid: str,
+    algorithm: str,
+    not_before: float = 0.0,
+) -> SigningKey:
+    """Create an in-memory asymmetric key (tests, benchmarks, local dev)."""
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    if algorithm.startswith(("RS", "PS")):
+        private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif algorithm == "ES256":
+        private = ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "ES384":
+        private = ec.generate_private_key(ec.SECP384R1())
+    elif algorithm == "EdDSA":
+        private = ed25519.Ed25519PrivateKey.generate()
+    else:
+        raise ValueError(f"Unsupported algorithm {algorithm!r}")
+    return SigningKey(
+        kid=kid,
+        algorithm=algorithm,
+        verify_key=private.public_key(),
+        sign_key=private,
+        not_before=not_before,
+    )
@@ -1,30 +1,183 @@
-import os
 import sqlite3
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import AbstractContextManager
+from typing import Any, TypeVar
 
-from app.user.models import User, UserRequest
+from app.domain.cache import ReadCache
+from app.domain.pagination import Page, PageRequest
+from app.domain.versioning import TableVersion
+from app.infrastructure.sqlite.counts import install_row_count, read_row_count
+from app.infrastructure.sqlite.keyset import fetch_page, iter_rows
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.infrastructure.sqlite.search import (
+    fetch_search_page,
+    install_search_index,
+)
+from app.infrastructure.sqlite.versions import (
+    install_version_tracking,
+    read_version,
+)
+from app.user.models import BulkImportResult, User, UserRequest
+
+T = TypeVar("T")
+
+COLUMNS = ("id", "name", "email")
+SEARCH_COLUMNS = ("name", "email")
+BULK_CHUNK_SIZE = 1000
+ASCII_LOWER = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "abcdefghijklmnopqrstuvwxyz",
+)
+
+
+# Both constraints guard the email: the column's own UNIQUE and the
+# case-insensitive index
+EMAIL_CONSTRAINTS = ("users.email", "users_email_lower")
+
+
+class DuplicateEmailError(sqlite3.IntegrityError):
+    """The email is taken by another user, ignoring case."""
+
+
+class DuplicateEmailsFound(RuntimeError):
+    """Existing users share an email that only differs in case."""
+
+    def __init__(self, ids: Sequence[int]) -> None:
+        self.ids = list(ids)
+        super().__init__(
+            "users share an email ignoring case, so users_email_lower "
+            f"cannot be made unique (ids: {', '.join(map(str, self.ids))}). "
+            "Resolve them by hand or run `python -m app.user.migrate_emails` "
+            "to move all but the oldest to users_duplicate_emails.",
+        )
+
+
+def is_duplicate_email(error: sqlite3.IntegrityError) -> bool:
+    """Whether ``error`` is the UNIQUE email failure, not another constraint."""
+    if isinstance(error, DuplicateEmailError):
+        return True
+    # Writes that race the pre-check still fail on one of the constraints
+    return any(name in str(error) for name in EMAIL_CONSTRAINTS)
+
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL UNIQUE
+    )
+"""
+
+
+def install_unique_email_index(
+    conn: sqlite3.Connection,
+    move_duplicates: bool = False,
+) -> list[int]:
+    """Make emails unique regardless of case via ``users_email_lower``.
+
+    Older databases have it as a plain index and may hold emails that only
+    differ in case. Those are never removed on startup: this raises
+    ``DuplicateEmailsFound`` with the newer ids unless ``move_duplicates``
+    is set (``python -m app.user.migrate_emails``), in which case the
+    oldest user of each email is kept and the others are moved to
+    ``users_duplicate_emails``. Returns the moved ids.
+    """
+    indexes = {
+        row[1]: row[2] for row in conn.execute("PRAGMA index_list(users)")
+    }
+    if indexes.get("users_email_lower"):
+        return []
+    # The plain index serves the duplicate lookup below
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS users_email_lower ON users (lower(email))",
+    )
+    duplicates = [
+        row[0]
+        for row in conn.execute(
+            "SELECT id FROM users AS u WHERE EXISTS ("
+            "SELECT 1 FROM users AS o "
+            "WHERE lower(o.email) = lower(u.email) AND o.id < u.id) "
+            "ORDER BY id",
+        )
+    ]
+    if duplicates and not move_duplicates:
+        raise DuplicateEmailsFound(duplicates)
+    if duplicates:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS users_duplicate_emails "
+            "(id INTEGER PRIMARY KEY, name TEXT, email TEXT)",
+        )
+        placeholders = ", ".join("?" for _ in duplicates)
+        conn.execute(
+            "INSERT OR REPLACE INTO users_duplicate_emails "
+            f"SELECT id, name, email FROM users WHERE id IN ({placeholders})",
+            duplicates,
+        )
+        conn.execute(
+            f"DELETE FROM users WHERE id IN ({placeholders})",
+            duplicates,
+        )
+    conn.execute("DROP INDEX users_email_lower")
+    conn.execute(
+        "CREATE UNIQUE INDEX users_email_lower ON users (lower(email))",
+    )
+    return duplicates
 
 
 class UserDatabase:
-    def __init__(self, db_path: str) -> None:
-        if db_path not in (":memory:", "file::memory:?cache=shared"):
-            db_dir = os.path.dirname(db_path)
-            if db_dir and not os.path.exists(db_dir):
-                os.makedirs(db_dir, exist_ok=True)
-        self.__conn: sqlite3.Connection | None = sqlite3.connect(db_path)
-        # row_factory is available when connection is not None
-        if self.__conn is not None:
-            self.__conn.row_factory = sqlite3.Row
-        self.__initialize_db()
+    def __init__(
+        self,
+        db_path: str | None = None,
+        pool: SQLiteConnectionPool | None = None,
+        cache: ReadCache | None = None,
+    ) -> None:
+        self.__cache = cache
+        if pool is None:
+            if db_path is None:
+                raise ValueError("Either db_path or pool must be provided")
+            # A private pool owns its connections and its schema setup;
+            # shared pools are initialized once at application startup.
+            pool = SQLiteConnectionPool(db_path, size=1)
+            self.__owns_pool = True
+            self.__pool: SQLiteConnectionPool | None = pool
+            try:
+                self.initialize_schema(pool)
+            except BaseException:
+                pool.close()
+                raise
+        else:
+            self.__owns_pool = False
+            self.__pool = pool
+
+    @staticmethod
+    def initialize_schema(
+        pool: SQLiteConnectionPool,
+        move_duplicate_emails: bool = False,
+    ) -> list[int]:
+        """Create or upgrade the schema; returns the ids of moved users."""
+
+        def init(conn: sqlite3.Connection) -> list[int]:
+            conn.execute(SCHEMA)
+            install_version_tracking(conn, "users")
+            install_search_index(conn, "users", SEARCH_COLUMNS)
+            install_row_count(conn, "users")
+            # After the triggers, so moved duplicates update the count,
+            # version and search index
+            return install_unique_email_index(conn, move_duplicate_emails)
+
+        return pool.write(init)
 
     def close(self) -> None:
-        if getattr(self, "_UserDatabase__conn", None):
-            try:
-                if self.__conn is not None:
-                    self.__conn.close()
-            except Exception:
-                pass
-            finally:
-                self.__conn = None
+        pool = getattr(self, "_UserDatabase__pool", None)
+        if pool is None:
+            return
+        try:
+            if self.__owns_pool:
+                pool.close()
+        except Exception:
+            pass
+        finally:
+            self.__pool = None
 
     def __del__(self) -> None:
         try:
@@ -32,99 +185,280 @@ class UserDatabase:
         except Exception:
             pass
 
-    def __get_connection(self) -> sqlite3.Connection:
-        if self.__conn is None:
+    def __get_pool(self) -> SQLiteConnectionPool:
+        if self.__pool is None or self.__pool.closed:
             raise RuntimeError("Database connection is closed")
-        return self.__conn
+        return self.__pool
 
-    def __initialize_db(self) -> None:
-        conn = self.__get_connection()
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT NOT NULL UNIQUE
-            )
-            """,
+    def __connection(self) -> AbstractContextManager[sqlite3.Connection]:
+        return self.__get_pool().connection()
+
+    @staticmethod
+    def __to_user(row: sqlite3.Row) -> User:
+        return User(
+            id=row["id"],
+            name=row["name"],
+            email=row["email"],
         )
-        conn.commit()
+
+    def __cached(self, key: str, loader: Callable[[], T]) -> T:
+        if self.__cache is None:
+            return loader()
+        return self.__cache.get_or_load(key, loader)
+
+    def __invalidate(self, id: int | None = None) -> None:
+        if self.__cache is None:
+            return
+        if id is None:
+            self.__cache.invalidate_prefix()
+            return
+        self.__cache.invalidate(f"item:{id}")
+        self.__cache.invalidate_prefix("list:")
+
+    def __cached_list(
+        self,
+        key: str,
+        loader: Callable[[], T],
+        version: TableVersion | None = None,
+    ) -> T:
+        # Keyed by the table version, so writes from other processes are
+        # seen at once; local writes also drop the "list:" entries. Routes
+        # pass the version they already read for the ETag.
+        if self.__cache is None:
+            return loader()
+        if version is None:
+            version = self.version()
+        return self.__cache.get_or_load(
+            f"list:{version.version}:{key}",
+            loader,
+        )
+
+    def version(self) -> TableVersion:
+        # Never cached: a primary-key lookup, and the only way to see
+        # writes made by other processes
+        with self.__connection() as conn:
+            return read_version(conn, "users")
+
+    def count(self, version: TableVersion | None = None) -> int:
+        def load() -> int:
+            with self.__connection() as conn:
+                return read_row_count(conn, "users")
+
+        return self.__cached_list("count", load, version)
 
     def get_all(self) -> list[User]:
-        conn = self.__get_connection()
-        users = conn.execute("SELECT * FROM users").fetchall()
-        return [
-            User(
-                id=user["id"],
-                name=user["name"],
-                email=user["email"],
-            )
-            for user in users
-        ]
+        def load() -> list[User]:
+            with self.__connection() as conn:
+                users = conn.execute("SELECT * FROM users").fetchall()
+            return [self.__to_user(user) for user in users]
+
+        return self.__cached_list("all", load)
+
+    def get_page(
+        self,
+        page: PageRequest,
+        version: TableVersion | None = None,
+    ) -> Page:
+        def load() -> Page:
+            with self.__connection() as conn:
+                return fetch_page(conn, "users", COLUMNS, page)
+
+        fields = ",".join(page.fields) if page.fields else "*"
+        return self.__cached_list(
+            f"{page.limit}:{page.after}:{fields}",
+            load,
+            version,
+        )
+
+    def search(
+        self,
+        page: PageRequest,
+        version: TableVersion | None = None,
+    ) -> Page:
+        def load() -> Page:
+            with self.__connection() as conn:
+                return fetch_search_page(conn, "users", COLUMNS, page)
+
+        fields = ",".join(page.fields) if page.fields else "*"
+        return self.__cached_list(
+            f"search:{page.query}:{page.limit}:{page.after_rank}:"
+            f"{page.after}:{fields}",
+            load,
+            version,
+        )
+
+    def iter_batches(self, page: PageRequest) -> Iterator[list[dict[str, Any]]]:
+        # Held until the client has read the whole stream, so it is not
+        # taken from the pool
+        with self.__get_pool().dedicated() as conn:
+            yield from iter_rows(conn, "users", COLUMNS, page)
 
     def exists(self, id: int) -> bool:
-        conn = self.__get_connection()
-        user = conn.execute(
-            "SELECT * FROM users WHERE id = ?",
-            (id,),
-        ).fetchone()
+        with self.__connection() as conn:
+            user = conn.execute(
+                "SELECT 1 FROM users WHERE id = ?",
+                (id,),
+            ).fetchone()
         return user is not None
 
     def get(self, id: int) -> User | None:
-        conn = self.__get_connection()
-        user = conn.execute(
-            "SELECT * FROM users WHERE id = ?",
-            (id,),
-        ).fetchone()
-        if user:
-            return User(
-                id=user["id"],
-                name=user["name"],
-                email=user["email"],
-            )
-        return None
+        def load() -> User | None:
+            with self.__connection() as conn:
+                user = conn.execute(
+                    "SELECT * FROM users WHERE id = ?",
+                    (id,),
+                ).fetchone()
+            if user:
+                return self.__to_user(user)
+            return None
+
+        return self.__cached(f"item:{id}", load)
 
     def create(self, model: UserRequest) -> User | None:
-        conn = self.__get_connection()
-        cur = conn.execute(
-            "INSERT INTO users (name, email) VALUES (?, ?)",
-            (model.name, model.email),
-        )
-        conn.commit()
-        user_id = cur.lastrowid
-        if user_id is None:
+        """Insert a user in one statement.
+
+        Raises ``DuplicateEmailError`` when the email is already taken.
+        """
+
+        def insert(conn: sqlite3.Connection) -> list[Any]:
+            conn.execute("BEGIN IMMEDIATE")
+            self.__check_email(conn, model.email)
+            return conn.execute(
+                "INSERT INTO users (name, email) VALUES (?, ?) "
+                "RETURNING id, name, email",
+                (model.name, model.email),
+            ).fetchall()
+
+        rows = self.__get_pool().write(insert)
+        if not rows:
             return None
-        return self.get(int(user_id))
+        user = self.__to_user(rows[0])
+        self.__invalidate(user.id)
+        return user
+
+    def bulk_create(
+        self,
+        rows: Sequence[tuple[int, UserRequest]],
+        result: BulkImportResult,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> BulkImportResult:
+        """Insert ``(index, request)`` rows in chunked transactions.
+
+        Each chunk takes the write lock up front, looks up the emails that
+        already exist (ignoring case) in one query, and inserts the rest
+        with ``executemany``. Conflicting rows, including repeats inside
+        the payload, are recorded on ``result`` by their original index.
+        """
+
+        def insert_chunk(
+            conn: sqlite3.Connection,
+            chunk: Sequence[tuple[int, UserRequest]],
+        ) -> tuple[list[tuple[int, str]], list[tuple[str, str]]]:
+            conn.execute("BEGIN IMMEDIATE")
+            placeholders = ", ".join("lower(?)" for _ in chunk)
+            existing = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT lower(email) FROM users "
+                    f"WHERE lower(email) IN ({placeholders})",
+                    [model.email for _, model in chunk],
+                )
+            }
+            # Earlier chunks are committed and show up in ``existing``;
+            # ``seen`` only catches repeats within this chunk.
+            seen: set[str] = set()
+            conflicts: list[tuple[int, str]] = []
+            values: list[tuple[str, str]] = []
+            for index, model in chunk:
+                # Same folding as SQLite's lower(): ASCII only
+                key = model.email.translate(ASCII_LOWER)
+                if key in existing or key in seen:
+                    conflicts.append((index, model.email))
+                else:
+                    seen.add(key)
+                    values.append((model.name, model.email))
+            conn.executemany(
+                "INSERT INTO users (name, email) VALUES (?, ?)",
+                values,
+            )
+            return conflicts, values
+
+        pool = self.__get_pool()
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            conflicts, values = pool.write(
+                lambda conn: insert_chunk(conn, chunk),
+            )
+            for index, email in conflicts:
+                result.add_conflict(index, email)
+            result.created += len(values)
+        if result.created:
+            self.__invalidate()
+        return result
 
     def update(self, id: int, model: UserRequest) -> User | None:
-        conn = self.__get_connection()
-        user = self.get(id)
-        if not user:
+        """Apply the non-``None`` fields of ``model`` in one statement.
+
+        Returns ``None`` when the user does not exist and raises
+        ``DuplicateEmailError`` when the new email is already taken.
+        """
+
+        def apply(conn: sqlite3.Connection) -> list[Any]:
+            conn.execute("BEGIN IMMEDIATE")
+            if model.email is not None:
+                self.__check_email(conn, model.email, exclude_id=id)
+            return conn.execute(
+                "UPDATE users SET name = COALESCE(?, name), "
+                "email = COALESCE(?, email) WHERE id = ? "
+                "RETURNING id, name, email",
+                (model.name, model.email, id),
+            ).fetchall()
+
+        rows = self.__get_pool().write(apply)
+        if not rows:
             return None
-        name = model.name if model.name is not None else user.name
-        email = model.email if model.email is not None else user.email
-        conn.execute(
-            "UPDATE users SET name = ?, email = ? WHERE id = ?",
-            (name, email, id),
-        )
-        conn.commit()
-        return self.get(id)
+        self.__invalidate(id)
+        return self.__to_user(rows[0])
 
-    def delete(self, id: int) -> None:
-        conn = self.__get_connection()
-        conn.execute("DELETE FROM users WHERE id = ?", (id,))
-        conn.commit()
+    @staticmethod
+    def __check_email(
+        conn: sqlite3.Connection,
+        email: str,
+        exclude_id: int | None = None,
+    ) -> None:
+        # Runs under BEGIN IMMEDIATE, so no other writer can take the email
+        # between this lookup and the write
+        taken = conn.execute(
+            "SELECT 1 FROM users WHERE lower(email) = lower(?) AND id IS NOT ?",
+            (email, exclude_id),
+        ).fetchone()
+        if taken:
+            raise DuplicateEmailError(f"email already exists: {email}")
+
+    def delete(self, id: int) -> bool:
+        rows = self.__get_pool().write(
+            lambda conn: conn.execute(
+                "DELETE FROM users WHERE id = ? RETURNING id",
+                (id,),
+            ).fetchall(),
+        )
+        if not rows:
+            return False
+        self.__invalidate(id)
+        return True
 
     def email_exists(self, email: str, exclude_id: int | None = None) -> bool:
-        conn = self.__get_connection()
-        if exclude_id:
-            user = conn.execute(
-                "SELECT * FROM users WHERE email = ? AND id != ?",
-                (email, exclude_id),
-            ).fetchone()
-        else:
-            user = conn.execute(
-                "SELECT * FROM users WHERE email = ?",
-                (email,),
-            ).fetchone()
+        """Case-insensitive lookup served by the ``lower(email)`` index."""
+        with self.__connection() as conn:
+            if exclude_id:
+                user = conn.execute(
+                    "SELECT 1 FROM users WHERE lower(email) = lower(?) "
+                    "AND id != ?",
+                    (email, exclude_id),
+                ).fetchone()
+            else:
+                user = conn.execute(
+                    "SELECT 1 FROM users WHERE lower(email) = lower(?)",
+                    (email,),
+                ).fetchone()
         return user is not None
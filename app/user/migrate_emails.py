@@ -0,0 +1,38 @@
+"""Make user emails unique ignoring case on a database that predates it.
+
+Startup refuses to build the ``users_email_lower`` unique index while users
+share an email that only differs in case, and lists their ids.
+``python -m app.user.migrate_emails`` is the explicit way past that: it
+keeps the oldest user of each email and moves the others to
+``users_duplicate_emails`` for review.
+"""
+
+import argparse
+
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.user.database import UserDatabase
+from app.user_routes import DB_PATH
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Move case-duplicated users to users_duplicate_emails",
+    )
+    parser.add_argument("--path", default=DB_PATH)
+    args = parser.parse_args(argv)
+    pool = SQLiteConnectionPool(args.path, size=1)
+    try:
+        moved = UserDatabase.initialize_schema(
+            pool,
+            move_duplicate_emails=True,
+        )
+    finally:
+        pool.close()
+    if moved:
+        print(f"Moved users {', '.join(map(str, moved))}")
+    else:
+        print("No duplicate emails")
+
+
+if __name__ == "__main__":
+    main()
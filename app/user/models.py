@@ -23,3 +23,27 @@ class UserRequest:
             name=data.get("name"),
             email=data.get("email"),
         )
+
+
+class BulkImportResult:
+    def __init__(self, received=0):
+        self.received = received
+        self.created = 0
+        self.conflicts = []
+        self.invalid = []
+
+    def add_conflict(self, index, email):
+        self.conflicts.append(
+            {"index": index, "email": email, "error": "Email already exists"},
+        )
+
+    def add_invalid(self, index, error):
+        self.invalid.append({"index": index, "error": error})
+
+    def to_dict(self):
+        return {
+            "received": self.received,
+            "created": self.created,
+            "conflicts": self.conflicts,
+            "invalid": self.invalid,
+        }
@@ -1,23 +1,122 @@
-from os import path
+import atexit
+import json
+import sqlite3
+from functools import lru_cache
+from os import getenv, path
+
+from flask import Blueprint, Response, jsonify, request
+
+from app.core.dependencies import get_cache
+from app.infrastructure.metrics.sqlite import connection_factory
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.interface.api.conditional import (
+    add_validators,
+    make_etag,
+    not_modified,
+)
+from app.interface.api.pagination import (
+    add_page_headers,
+    add_total_count,
+    parse_page_request,
+)
+from app.interface.api.streaming import (
+    NDJSON,
+    negotiate_stream,
+    stream_response,
+)
+from app.user.database import COLUMNS, UserDatabase, is_duplicate_email
+from app.user.models import BulkImportResult, UserRequest
 
-from flask import Blueprint, jsonify, request
+blueprint = Blueprint("User's routes", __name__)
 
-from app.user.database import UserDatabase
-from app.user.models import UserRequest
+DB_PATH = path.join(path.dirname(__file__), "..", "..", ".data", "users.db")
 
-blueprint = Blueprint("User's routes", __name__)
+
+@lru_cache
+def get_connection_pool() -> SQLiteConnectionPool:
+    pool = SQLiteConnectionPool(
+        db_path=DB_PATH,
+        size=int(getenv("USER_DB_POOL_SIZE", "5")),
+        timeout=float(getenv("USER_DB_POOL_TIMEOUT", "5")),
+        factory=connection_factory(),
+    )
+    UserDatabase.initialize_schema(pool)
+    atexit.register(pool.close)
+    return pool
 
 
 def get_database():
-    data_folder = path.join(path.dirname(__file__), "..", "..", ".data")
-    return UserDatabase(db_path=path.join(data_folder, "users.db"))
+    return UserDatabase(pool=get_connection_pool(), cache=get_cache("users"))
+
+
+@blueprint.errorhandler(sqlite3.IntegrityError)
+def handle_integrity_error(error):
+    # Writes check the email under the write lock; the constraints back it up
+    if is_duplicate_email(error):
+        return jsonify({"error": "Email already exists"}), 409
+    # NOT NULL and the like: the payload was accepted but is not a valid row
+    return jsonify({"error": "Invalid request"}), 400
 
 
 @blueprint.route("/", methods=["GET"])
 def get_all():
+    stream = negotiate_stream(request)
+    try:
+        page_request = parse_page_request(
+            request,
+            COLUMNS,
+            streaming=stream is not None,
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    database = get_database()
+    version = database.version()
+    etag = make_etag("users", version, request)
+    unchanged = not_modified(request, etag, version)
+    if unchanged is not None:
+        return unchanged
+    if request.method == "HEAD":
+        # Headers only: the count and validators, without reading a page
+        response = Response()
+    elif stream is not None:
+        response = stream_response(database.iter_batches(page_request), stream)
+    else:
+        if page_request.query is not None:
+            page = database.search(page_request, version)
+        else:
+            page = database.get_page(page_request, version)
+        response = jsonify(page.items)
+        add_page_headers(response, request, page)
+    if page_request.query is None:
+        add_total_count(response, database.count(version))
+    add_validators(response, etag, version)
+    return response
+
+
+@blueprint.route("/count", methods=["GET"])
+def count():
+    return jsonify({"count": get_database().count()})
+
+
+@blueprint.route("/search", methods=["GET"])
+def search():
+    if not request.args.get("q", "").strip():
+        return jsonify({"error": "q is required"}), 400
+    try:
+        page_request = parse_page_request(request, COLUMNS)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
     database = get_database()
-    list = database.get_all()
-    return jsonify([item.to_dict() for item in list])
+    version = database.version()
+    etag = make_etag("users", version, request)
+    unchanged = not_modified(request, etag, version)
+    if unchanged is not None:
+        return unchanged
+    page = database.search(page_request, version)
+    response = jsonify(page.items)
+    add_page_headers(response, request, page)
+    add_validators(response, etag, version)
+    return response
 
 
 @blueprint.route("/<int:id>", methods=["GET"])
@@ -35,9 +134,6 @@ def create():
     if not data or "name" not in data or "email" not in data:
         return jsonify({"error": "Invalid request"}), 400
     database = get_database()
-    if database.email_exists(data["email"]):
-        return jsonify({"error": "Email already exists"}), 409
-
     rq = UserRequest(
         name=data["name"],
         email=data["email"],
@@ -48,17 +144,57 @@ def create():
     return jsonify(model.to_dict()), 201
 
 
+def read_bulk_payload() -> list | None:
+    if request.mimetype == NDJSON:
+        items: list = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                # Keep the slot so the row is reported by its position
+                items.append(None)
+        return items
+    data = request.get_json(silent=True)
+    return data if isinstance(data, list) else None
+
+
+@blueprint.route("/bulk", methods=["POST"])
+def bulk_create():
+    items = read_bulk_payload()
+    if items is None:
+        return jsonify({"error": "Invalid request"}), 400
+    max_rows = int(getenv("USER_BULK_MAX_ROWS", "100000"))
+    if len(items) > max_rows:
+        return jsonify({"error": f"At most {max_rows} rows per request"}), 413
+
+    result = BulkImportResult(received=len(items))
+    rows: list[tuple[int, UserRequest]] = []
+    for index, data in enumerate(items):
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("name"), str)
+            or not isinstance(data.get("email"), str)
+        ):
+            result.add_invalid(index, "Invalid request")
+            continue
+        rows.append(
+            (index, UserRequest(name=data["name"], email=data["email"]))
+        )
+
+    database = get_database()
+    database.bulk_create(rows, result)
+    return jsonify(result.to_dict())
+
+
 @blueprint.route("/<int:id>", methods=["PUT"])
 def update(id):
-    database = get_database()
-    if not database.exists(id):
-        return jsonify({"error": "User not found"}), 404
     data = request.get_json()
     if not data or ("name" not in data and "email" not in data):
         return jsonify({"error": "Invalid request"}), 400
-    if "email" in data and database.email_exists(data["email"], exclude_id=id):
-        return jsonify({"error": "Email already exists"}), 409
 
+    database = get_database()
     rq = UserRequest.from_dict(data)
     model = database.update(id, rq)
     if model is None:
@@ -69,7 +205,6 @@ def update(id):
 @blueprint.route("/<int:id>", methods=["DELETE"])
 def delete(id):
     database = get_database()
-    if not database.exists(id):
+    if not database.delete(id):
         return jsonify({"error": "User not found"}), 404
-    database.delete(id)
     return jsonify({"message": "User deleted"})
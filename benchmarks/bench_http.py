@@ -0,0 +1,255 @@
+"""HTTP load generator for the ASGI and WSGI entry points.
+
+Usage: python -m benchmarks.bench_http --target both --concurrency 16 \\
+    --requests 2000 --output .benchmarks/http.json
+
+Requests are handed straight to ``main:asgi_app`` (as ASGI scopes on one
+event loop) or to the Flask WSGI app (as environs from a thread pool),
+so the numbers cover the application stack without socket or server
+overhead. Every endpoint is driven separately at the given concurrency.
+
+With ``--url http://127.0.0.1:8000`` the same load goes over sockets to
+a server started with ``python main.py --server-mode ...``, one
+keep-alive connection per client, to compare the serving modes.
+"""
+
+import argparse
+import asyncio
+import http.client
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import urlsplit
+
+from werkzeug.test import EnvironBuilder
+
+from benchmarks.results import print_table, summarize, write_results
+
+DEFAULT_ENDPOINTS = (
+    "/health",
+    "/v1/public",
+    "/v1/customer",
+    "/v1/private",
+    "/users/",
+    "/users/?limit=10",
+)
+
+
+async def asgi_request(
+    app: Any,
+    path: str,
+    headers: dict[str, str],
+) -> int:
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "root_path": "",
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in headers.items()
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+    requested = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def wsgi_request(app: Any, path: str, headers: dict[str, str]) -> int:
+    environ = EnvironBuilder(path=path, headers=headers).get_environ()
+    status = 0
+
+    def start_response(line: str, *args: Any) -> None:
+        nonlocal status
+        status = int(line.split(" ", 1)[0])
+
+    body = app(environ, start_response)
+    try:
+        for _ in body:
+            pass
+    finally:
+        close = getattr(body, "close", None)
+        if close is not None:
+            close()
+    return status
+
+
+class HttpClient:
+    """Keep-alive connection to a running server, one per client thread."""
+
+    def __init__(self, url: str) -> None:
+        self._url = urlsplit(url)
+        self._local = threading.local()
+
+    def __call__(self, path: str, headers: dict[str, str]) -> int:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(
+                self._url.hostname,
+                self._url.port,
+                timeout=30,
+            )
+            self._local.conn = conn
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            self._local.conn = None
+            return 599
+        return response.status
+
+
+def run_asgi(
+    app: Any,
+    path: str,
+    headers: dict[str, str],
+    requests: int,
+    concurrency: int,
+) -> dict[str, float]:
+    samples: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            before = time.perf_counter()
+            status = await asgi_request(app, path, headers)
+            samples.append(time.perf_counter() - before)
+            errors += status >= 400
+
+    async def drive() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(drive())
+    return summarize(samples, elapsed, errors)
+
+
+def run_threads(
+    call: Callable[[str, dict[str, str]], int],
+    path: str,
+    headers: dict[str, str],
+    requests: int,
+    concurrency: int,
+) -> dict[str, float]:
+    samples: list[float] = []
+    errors = 0
+    remaining = requests
+    lock = threading.Lock()
+
+    def worker() -> None:
+        nonlocal remaining, errors
+        while True:
+            with lock:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            before = time.perf_counter()
+            status = call(path, headers)
+            elapsed = time.perf_counter() - before
+            with lock:
+                samples.append(elapsed)
+                errors += status >= 400
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    return summarize(samples, time.perf_counter() - start, errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--target",
+        choices=("asgi", "wsgi", "both"),
+        default="both",
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        dest="endpoints",
+        help="path to drive (repeatable); defaults to the main routes",
+    )
+    parser.add_argument(
+        "--url",
+        help="drive a running server at this base URL instead (overrides "
+        "--target)",
+    )
+    parser.add_argument("--output", help="write results as JSON here")
+    args = parser.parse_args()
+
+    # Imported late so --help works without creating databases
+    from app.core.dependencies import get_auth_service
+
+    token = get_auth_service().issue_token("bench-user")
+    headers = {"Authorization": f"Bearer {token}"}
+    if args.url:
+        client = HttpClient(args.url)
+        targets: tuple[str, ...] = ("http",)
+        runners = {
+            "http": lambda path, n, c: run_threads(client, path, headers, n, c),
+        }
+    else:
+        from main import asgi_app, flask_app
+
+        def wsgi_call(path: str, headers: dict[str, str]) -> int:
+            return wsgi_request(flask_app, path, headers)
+
+        targets = ("asgi", "wsgi") if args.target == "both" else (args.target,)
+        runners = {
+            "asgi": lambda path, n, c: run_asgi(asgi_app, path, headers, n, c),
+            "wsgi": lambda path, n, c: run_threads(
+                wsgi_call, path, headers, n, c
+            ),
+        }
+
+    results = {}
+    for target in targets:
+        for path in args.endpoints or DEFAULT_ENDPOINTS:
+            runners[target](path, args.warmup, args.concurrency)
+            results[f"{target} GET {path}"] = runners[target](
+                path,
+                args.requests,
+                args.concurrency,
+            )
+
+    print_table(results)
+    if args.output:
+        write_results(args.output, "http", vars(args), results)
+
+
+if __name__ == "__main__":
+    main()
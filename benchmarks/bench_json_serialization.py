@@ -0,0 +1,49 @@
+"""Compare the old customer serialization path with FastJSONProvider.
+
+Usage: python -m benchmarks.bench_json_serialization --rows 10000
+"""
+
+import argparse
+import json
+import timeit
+
+from app.domain.customer import Customer
+from app.interface.api import json_provider
+from app.interface.api.json_provider import dumps_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    customers = [
+        Customer(id=i, name=f"Customer {i}", email=f"c{i}@example.com")
+        for i in range(args.rows)
+    ]
+    rows = [c.model_dump() for c in customers]
+
+    cases = {
+        # What GET /v1/customer did before: model_dump + stdlib jsonify
+        "model_dump + json.dumps": lambda: json.dumps(
+            [c.model_dump() for c in customers],
+            sort_keys=True,
+            separators=(",", ":"),
+        ),
+        "TypeAdapter(list[Customer])": lambda: dumps_bytes(customers),
+        "dict rows (fast provider)": lambda: dumps_bytes(rows),
+    }
+    print(f"rows: {args.rows}, orjson: {json_provider.orjson is not None}")
+    baseline = None
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(
+            f"{name:<30} {seconds * 1000:>8.2f} ms"
+            f"  {baseline / seconds:>5.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
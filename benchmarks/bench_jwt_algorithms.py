@@ -0,0 +1,52 @@
+"""Measure token issue/verify throughput per signing algorithm.
+
+The verified-token cache is disabled so every decode pays for a full
+signature check. Usage: python -m benchmarks.bench_jwt_algorithms
+"""
+
+import argparse
+import time
+
+from app.services.auth_service import AuthService, AuthSettings
+from app.services.key_set import KeySet, generate_signing_key
+
+ALGORITHMS = ("HS256", "RS256", "ES256", "EdDSA")
+
+
+def ops_per_second(func, seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        func()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    settings = AuthSettings(verify_cache_size=0)
+    print(f"{'algorithm':<10} {'issue/s':>10} {'verify/s':>10}")
+    for algorithm in ALGORITHMS:
+        if algorithm == "HS256":
+            key_set = KeySet.from_secret(settings.secret, algorithm)
+        else:
+            key_set = KeySet([generate_signing_key("bench", algorithm)])
+        service = AuthService(settings, key_set=key_set)
+        token = service.issue_token("bench-user")
+        issue = ops_per_second(
+            lambda: service.issue_token("bench-user"),
+            args.seconds,
+        )
+        verify = ops_per_second(
+            lambda: service.decode_token(token),
+            args.seconds,
+        )
+        print(f"{algorithm:<10} {issue:>10,.0f} {verify:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Microbenchmarks for the storage, auth and serialization hot paths.
+
+Usage: python -m benchmarks.bench_micro --iterations 2000 \\
+    --output .benchmarks/micro.json
+
+Each case times individual calls, so the percentiles show per-operation
+latency. Databases are created in a temporary directory.
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from app.domain.customer import Customer
+from app.infrastructure.repositories.sqlite_customer_repository import (
+    SQLiteCustomerRepository,
+)
+from app.interface.api.json_provider import dumps_bytes
+from app.services.auth_service import AuthService, AuthSettings
+from app.user.database import UserDatabase
+from app.user.models import UserRequest
+from benchmarks.results import print_table, summarize, write_results
+
+
+def measure(
+    operation: Callable[[int], Any],
+    iterations: int,
+    warmup: int,
+) -> dict[str, float]:
+    for i in range(warmup):
+        operation(-i - 1)
+    samples = []
+    clock = time.perf_counter
+    start = clock()
+    for i in range(iterations):
+        before = clock()
+        operation(i)
+        samples.append(clock() - before)
+    return summarize(samples, clock() - start)
+
+
+def user_cases(tmp: Path, rows: int) -> dict[str, Callable[[int], Any]]:
+    db = UserDatabase(str(tmp / "users.db"))
+    for i in range(rows):
+        db.create(UserRequest(name=f"Seed {i}", email=f"seed{i}@example.com"))
+    created: list[int] = []
+
+    def create(i: int) -> None:
+        user = db.create(UserRequest(name="Bench", email=f"b{i}@example.com"))
+        created.append(user.id)
+
+    def update(i: int) -> None:
+        db.update(created[i % len(created)], UserRequest(name=f"Bench {i}"))
+
+    def delete(i: int) -> None:
+        # Without earlier create calls (--filter) this times the miss path
+        db.delete(created.pop() if created else rows + i + 1)
+
+    return {
+        "users.create": create,
+        "users.get": lambda i: db.get(i % rows + 1),
+        "users.update": update,
+        "users.get_all": lambda i: db.get_all(),
+        "users.delete": delete,
+    }
+
+
+def customer_cases(tmp: Path, rows: int) -> dict[str, Callable[[int], Any]]:
+    path = str(tmp / "customers.db")
+    SQLiteCustomerRepository(path).close()
+    with sqlite3.connect(path) as conn:
+        conn.executemany(
+            "INSERT INTO customers (name, email) VALUES (?, ?)",
+            [(f"Customer {i}", f"c{i}@example.com") for i in range(rows)],
+        )
+    repository = SQLiteCustomerRepository(path)
+    return {"customers.list_customers": lambda i: repository.list_customers()}
+
+
+def auth_cases() -> dict[str, Callable[[int], Any]]:
+    cached = AuthService()
+    uncached = AuthService(AuthSettings(verify_cache_size=0))
+    token = cached.issue_token("bench-user")
+    return {
+        "auth.issue_token": lambda i: cached.issue_token("bench-user"),
+        "auth.decode_token (cached)": lambda i: cached.decode_token(token),
+        "auth.decode_token (uncached)": lambda i: uncached.decode_token(token),
+    }
+
+
+def json_cases(rows: int) -> dict[str, Callable[[int], Any]]:
+    customers = [
+        Customer(id=i, name=f"Customer {i}", email=f"c{i}@example.com")
+        for i in range(rows)
+    ]
+    dicts = [customer.model_dump() for customer in customers]
+    return {
+        f"json.models[{rows}]": lambda i: dumps_bytes(customers),
+        f"json.dicts[{rows}]": lambda i: dumps_bytes(dicts),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--filter", default="", help="substring of case names")
+    parser.add_argument("--output", help="write results as JSON here")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = {
+            **user_cases(Path(tmp), args.rows),
+            **customer_cases(Path(tmp), args.rows),
+            **auth_cases(),
+            **json_cases(args.rows),
+        }
+        for name, operation in cases.items():
+            if args.filter in name:
+                results[name] = measure(
+                    operation,
+                    args.iterations,
+                    args.warmup,
+                )
+
+    print_table(results)
+    if args.output:
+        write_results(args.output, "micro", vars(args), results)
+
+
+if __name__ == "__main__":
+    main()
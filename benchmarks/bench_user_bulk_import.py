@@ -0,0 +1,59 @@
+"""Compare single-row user creation with the bulk import path.
+
+Usage: python -m benchmarks.bench_user_bulk_import --rows 20000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from app.user.database import UserDatabase
+from app.user.models import BulkImportResult, UserRequest
+
+
+def single_row(db: UserDatabase, rows: int) -> float:
+    start = time.perf_counter()
+    for i in range(rows):
+        # Mirrors POST /users/: one INSERT ... RETURNING and commit per row
+        email = f"single{i}@example.com"
+        db.create(UserRequest(name=f"Single {i}", email=email))
+    return time.perf_counter() - start
+
+
+def bulk(db: UserDatabase, rows: int, chunk_size: int) -> float:
+    payload = [
+        (i, UserRequest(name=f"Bulk {i}", email=f"bulk{i}@example.com"))
+        for i in range(rows)
+    ]
+    start = time.perf_counter()
+    db.bulk_create(payload, BulkImportResult(received=rows), chunk_size)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single_db = UserDatabase(str(Path(tmp) / "single.db"))
+        bulk_db = UserDatabase(str(Path(tmp) / "bulk.db"))
+        try:
+            single_seconds = single_row(single_db, args.rows)
+            bulk_seconds = bulk(bulk_db, args.rows, args.chunk_size)
+        finally:
+            single_db.close()
+            bulk_db.close()
+
+    single_rate = args.rows / single_seconds
+    bulk_rate = args.rows / bulk_seconds
+    print(f"rows:        {args.rows}")
+    print(f"single-row:  {single_rate:>12,.0f} rows/s ({single_seconds:.2f}s)")
+    print(f"bulk:        {bulk_rate:>12,.0f} rows/s ({bulk_seconds:.2f}s)")
+    print(f"speedup:     {bulk_rate / single_rate:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
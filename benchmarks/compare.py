@@ -0,0 +1,71 @@
+"""Flag regressions between two benchmark result files.
+
+Usage: python -m benchmarks.compare baseline.json current.json --threshold 0.1
+
+Exits with status 1 when any shared case got slower than the threshold
+allows: a latency percentile grew, or ops/s dropped, by more than the
+given fraction.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.results import LATENCY_KEYS, THROUGHPUT_KEYS
+
+
+def find_regressions(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    regressions = []
+    for case in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[case], current[case]
+        for key in LATENCY_KEYS:
+            if before.get(key) and after.get(key, 0) > before[key] * (
+                1 + threshold
+            ):
+                regressions.append(
+                    f"{case}: {key} {before[key]} -> {after[key]}",
+                )
+        for key in THROUGHPUT_KEYS:
+            if before.get(key) and after.get(key, 0) < before[key] * (
+                1 - threshold
+            ):
+                regressions.append(
+                    f"{case}: {key} {before[key]} -> {after[key]}",
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    if baseline["suite"] != current["suite"]:
+        print("Result files come from different suites")
+        return 2
+    if baseline["environment"] != current["environment"]:
+        print("warning: results were recorded on different environments")
+
+    regressions = find_regressions(
+        baseline["results"],
+        current["results"],
+        args.threshold,
+    )
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
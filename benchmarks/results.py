@@ -0,0 +1,82 @@
+"""Shared summaries and JSON result files for the benchmark scripts."""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Lower is better for latencies, higher is better for throughput
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms", "mean_ms")
+THROUGHPUT_KEYS = ("ops_per_sec",)
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summarize(
+    samples: list[float],
+    elapsed: float,
+    errors: int = 0,
+) -> dict[str, float]:
+    """Latency percentiles (ms) and throughput for per-call durations (s)."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "ops_per_sec": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4)
+        if ordered
+        else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 4),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+    }
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def write_results(
+    path: str,
+    suite: str,
+    config: dict[str, Any],
+    results: dict[str, dict[str, float]],
+) -> None:
+    document = {
+        "suite": suite,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": environment(),
+        "config": config,
+        "results": results,
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def print_table(results: dict[str, dict[str, float]]) -> None:
+    width = max((len(name) for name in results), default=10)
+    print(
+        f"{'case':<{width}} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9}"
+        f" {'p99 ms':>9} {'errors':>7}",
+    )
+    for name, row in results.items():
+        print(
+            f"{name:<{width}} {row['ops_per_sec']:>10.1f}"
+            f" {row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f}"
+            f" {row['p99_ms']:>9.3f} {row['errors']:>7}",
+        )
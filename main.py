@@ -1,19 +1,165 @@
+import argparse
+import os
+from functools import cache
 from os import getenv
+from typing import Any
 
-from asgiref.wsgi import WsgiToAsgi
 from dotenv import load_dotenv
 
-from app import app as flask_app
-
+# Before the app is built, since settings are read when it is
 load_dotenv()
 
-asgi_app = WsgiToAsgi(flask_app)
+# asgi:    uvicorn in front of the WsgiToAsgi bridge (default)
+# wsgi:    waitress serving the Flask app directly from a thread pool
+# workers: several uvicorn processes, each with its own bridge
+SERVER_MODES = ("asgi", "wsgi", "workers")
+
+
+def _admission_controller() -> Any:
+    """The load shedder when ADMISSION_ENABLED, else ``None``."""
+    from app.infrastructure.admission.limiter import (
+        AdmissionController,
+        AdmissionSettings,
+    )
+    from app.infrastructure.metrics.registry import MetricsSettings
+
+    settings = AdmissionSettings()
+    if not settings.enabled:
+        return None
+    controller = AdmissionController(settings)
+    if MetricsSettings().enabled:
+        from app.interface.api.admission import install_admission_metrics
+
+        install_admission_metrics(controller)
+    return controller
+
+
+@cache
+def _asgi_app() -> Any:
+    from asgiref.wsgi import WsgiToAsgi
+
+    from app import app
+    from app.interface.api.asgi import FreshContextMiddleware
+
+    bridge = FreshContextMiddleware(WsgiToAsgi(app))
+    controller = _admission_controller()
+    if controller is None:
+        return bridge
+    from app.interface.api.admission import AsgiAdmissionMiddleware
+
+    # In front of the bridge, so queued requests hold no bridge thread
+    return AsgiAdmissionMiddleware(bridge, controller)
+
+
+def __getattr__(name: str) -> Any:
+    # uvicorn resolves "main:asgi_app" through here, so only the process
+    # that serves requests builds the app; --startup-report does not
+    if name == "asgi_app":
+        return _asgi_app()
+    if name == "flask_app":
+        from app import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the API server")
+    parser.add_argument(
+        "--server-mode",
+        choices=SERVER_MODES,
+        default=getenv("SERVER_MODE", "asgi"),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(getenv("WEB_CONCURRENCY", "2")),
+        help="uvicorn worker processes in workers mode",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=int(getenv("WSGI_THREADS", "8")),
+        help="request threads in wsgi mode",
+    )
+    parser.add_argument(
+        "--admission",
+        action=argparse.BooleanOptionalAction,
+        default=getenv("ADMISSION_ENABLED", "false").lower() == "true",
+        help="shed load with per-route-group concurrency limits "
+        "(ADMISSION_* settings)",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="time a cold start up to the first request instead of serving",
+    )
+    parser.add_argument(
+        "--startup-path",
+        default="/health",
+        help="request served by --startup-report",
+    )
+    return parser.parse_args(argv)
+
+
+def serve(args: argparse.Namespace, host: str, port: int) -> None:
+    production = getenv("FLASK_ENV") == "production"
+    # Through the environment, so reload and worker processes see it too
+    os.environ["ADMISSION_ENABLED"] = "true" if args.admission else "false"
+
+    if args.server_mode == "wsgi":
+        try:
+            from waitress import serve as waitress_serve
+        except ImportError:
+            raise SystemExit(
+                "wsgi mode needs the wsgi extra: uv sync --extra wsgi "
+                "(or pip install '.[wsgi]')",
+            ) from None
+        from app import app as flask_app
+
+        wsgi_app: Any = flask_app
+        controller = _admission_controller()
+        if controller is not None:
+            from app.interface.api.admission import AdmissionMiddleware
+
+            wsgi_app = AdmissionMiddleware(flask_app, controller)
+        waitress_serve(wsgi_app, host=host, port=port, threads=args.threads)
+        return
 
-if __name__ == "__main__":
     import uvicorn
 
+    if args.server_mode == "workers":
+        # uvicorn cannot combine reload with multiple workers
+        uvicorn.run(
+            "main:asgi_app",
+            host=host,
+            port=port,
+            workers=args.workers,
+            reload=False,
+        )
+        return
+
+    # One process; uvicorn would otherwise take WEB_CONCURRENCY workers
+    uvicorn.run(
+        "main:asgi_app",
+        host=host,
+        port=port,
+        workers=1,
+        reload=not production,
+    )
+
+
+if __name__ == "__main__":
     host = str(getenv("HOST")) if getenv("HOST") else "0.0.0.0"
     port = int(str(getenv("PORT"))) if getenv("PORT") else 8000
-    reload = getenv("FLASK_ENV") != "production"
 
-    uvicorn.run("main:asgi_app", host=host, port=port, reload=reload)
+    args = parse_args()
+    if args.startup_report:
+        from app.infrastructure.profiling.startup import (
+            format_report,
+            measure_startup,
+        )
+
+        print(format_report(measure_startup(args.startup_path)))
+    else:
+        serve(args, host, port)
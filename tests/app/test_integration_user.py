@@ -157,3 +157,83 @@ def test_delete_user_not_found(client):
     # Delete non-existent user
     resp = client.delete("/users/9999")
     assert resp.status_code == 404
+
+
+def test_bulk_import_json(client):
+    resp = client.post(
+        "/users/bulk",
+        json=[
+            {"name": "Bulk1", "email": "bulk1@example.com"},
+            {"name": "Bulk2", "email": "integration@example.com"},
+            {"name": "NoEmail"},
+        ],
+    )
+    assert resp.status_code == 200
+    summary = resp.get_json()
+    assert summary["received"] == 3
+    assert summary["created"] == 1
+    assert [c["index"] for c in summary["conflicts"]] == [1]
+    assert [i["index"] for i in summary["invalid"]] == [2]
+
+
+def test_bulk_import_ndjson(client):
+    body = (
+        '{"name": "Nd1", "email": "nd1@example.com"}\n'
+        "not json\n"
+        '{"name": "Nd2", "email": "nd2@example.com"}\n'
+    )
+    resp = client.post(
+        "/users/bulk",
+        data=body,
+        content_type="application/x-ndjson",
+    )
+    assert resp.status_code == 200
+    summary = resp.get_json()
+    assert summary["created"] == 2
+    assert [i["index"] for i in summary["invalid"]] == [1]
+
+
+def test_bulk_import_rejects_non_list(client):
+    resp = client.post("/users/bulk", json={"name": "x", "email": "x@x.com"})
+    assert resp.status_code == 400
+
+
+def test_list_etag_changes_after_write(client):
+    first = client.get("/users/")
+    etag = first.headers["ETag"]
+    assert first.headers["Last-Modified"]
+
+    unchanged = client.get("/users/", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    client.post(
+        "/users/",
+        json={"name": "Etag", "email": "etag@example.com"},
+    )
+    changed = client.get("/users/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_search_users(client):
+    client.post(
+        "/users/",
+        json={"name": "Searchable Person", "email": "findme@example.com"},
+    )
+
+    resp = client.get("/users/search?q=searchable")
+    assert resp.status_code == 200
+    assert [u["email"] for u in resp.get_json()] == ["findme@example.com"]
+
+    assert client.get("/users/search").status_code == 400
+    assert client.get("/users/search?q=x&after=bad").status_code == 400
+
+
+def test_count_matches_list_header(client):
+    counted = client.get("/users/count").get_json()["count"]
+
+    head = client.head("/users/")
+    assert head.status_code == 200
+    assert head.data == b""
+    assert head.headers["X-Total-Count"] == str(counted)
+    assert client.get("/users/").headers["X-Total-Count"] == str(counted)
@@ -1,8 +1,11 @@
+import sqlite3
 from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import Flask
 
+from app.domain.pagination import Page, PageRequest
+from app.domain.versioning import TableVersion
 from app.user.models import User, UserRequest
 from app.user_routes import blueprint
 
@@ -22,15 +25,99 @@ def client(app):
 def test_get_all_users(client):
     with patch("app.user_routes.get_database") as mock_get_db:
         mock_db = MagicMock()
-        mock_db.get_all.return_value = [
-            User(id=1, name="Test", email="test@test.com"),
-        ]
+        mock_db.version.return_value = TableVersion(1, 0.0)
+        mock_db.get_page.return_value = Page(
+            items=[{"id": 1, "name": "Test", "email": "test@test.com"}],
+        )
         mock_get_db.return_value = mock_db
         resp = client.get("/users/")
         assert resp.status_code == 200
         assert resp.get_json() == [
             {"id": 1, "name": "Test", "email": "test@test.com"},
         ]
+        assert "X-Next-Cursor" not in resp.headers
+
+
+def test_get_all_users_paginated(client):
+    with patch("app.user_routes.get_database") as mock_get_db:
+        mock_db = MagicMock()
+        mock_db.version.return_value = TableVersion(1, 0.0)
+        mock_db.get_page.return_value = Page(items=[{"id": 1}], next_after=1)
+        mock_get_db.return_value = mock_db
+        resp = client.get("/users/?limit=1&fields=id")
+        assert resp.status_code == 200
+        assert resp.get_json() == [{"id": 1}]
+        mock_db.get_page.assert_called_once_with(
+            PageRequest(limit=1, after=None, fields=("id",)),
+            TableVersion(1, 0.0),
+        )
+        mock_db.count.assert_called_once_with(TableVersion(1, 0.0))
+        cursor = resp.headers["X-Next-Cursor"]
+        assert f"after={cursor}" in resp.headers["Link"]
+
+
+def test_head_users_reports_count_without_reading_rows(client):
+    with patch("app.user_routes.get_database") as mock_get_db:
+        mock_db = MagicMock()
+        mock_db.version.return_value = TableVersion(1, 0.0)
+        mock_db.count.return_value = 42
+        mock_get_db.return_value = mock_db
+        resp = client.head("/users/")
+        assert resp.status_code == 200
+        assert resp.headers["X-Total-Count"] == "42"
+        assert resp.headers["ETag"]
+        mock_db.get_page.assert_not_called()
+
+
+def test_count_users(client):
+    with patch("app.user_routes.get_database") as mock_get_db:
+        mock_db = MagicMock()
+        mock_db.count.return_value = 7
+        mock_get_db.return_value = mock_db
+        resp = client.get("/users/count")
+        assert resp.status_code == 200
+        assert resp.get_json() == {"count": 7}
+
+
+def test_get_all_users_ndjson_stream(client):
+    with patch("app.user_routes.get_database") as mock_get_db:
+        mock_db = MagicMock()
+        mock_db.version.return_value = TableVersion(1, 0.0)
+        mock_db.iter_batches.return_value = iter([[{"id": 1}, {"id": 2}]])
+        mock_get_db.return_value = mock_db
+        resp = client.get(
+            "/users/",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/x-ndjson"
+        assert resp.get_data(as_text=True) == '{"id":1}\n{"id":2}\n'
+        mock_db.iter_batches.assert_called_once_with(
+            PageRequest(limit=None, after=None, fields=None),
+        )
+
+
+def test_get_all_users_not_modified_skips_query(client):
+    with patch("app.user_routes.get_database") as mock_get_db:
+        mock_db = MagicMock()
+        mock_db.version.return_value = TableVersion(7, 1700000000.0)
+        mock_db.get_page.return_value = Page(items=[])
+        mock_get_db.return_value = mock_db
+        etag = client.get("/users/").headers["ETag"]
+        mock_db.get_page.reset_mock()
+
+        resp = client.get("/users/", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 304
+        assert resp.data == b""
+        assert resp.headers["ETag"] == etag
+        mock_db.get_page.assert_not_called()
+
+
+def test_get_all_users_invalid_page_args(client):
+    assert client.get("/users/?limit=0").status_code == 400
+    assert client.get("/users/?after=not-a-cursor").status_code == 400
+    assert client.get("/users/?fields=password").status_code == 400
 
 
 def test_get_user_not_found(client):
@@ -52,7 +139,9 @@ def test_create_user_invalid_request(client):
 def test_create_user_duplicate_email(client):
     with patch("app.user_routes.get_database") as mock_get_db:
         mock_db = MagicMock()
-        mock_db.email_exists.return_value = True
+        mock_db.create.side_effect = sqlite3.IntegrityError(
+            "UNIQUE constraint failed: users.email",
+        )
         mock_get_db.return_value = mock_db
         resp = client.post(
             "/users/",
@@ -65,7 +154,7 @@ def test_create_user_duplicate_email(client):
 def test_delete_user_not_found(client):
     with patch("app.user_routes.get_database") as mock_get_db:
         mock_db = MagicMock()
-        mock_db.exists.return_value = False
+        mock_db.delete.return_value = False
         mock_get_db.return_value = mock_db
         resp = client.delete("/users/123")
         assert resp.status_code == 404
@@ -125,7 +214,7 @@ def test_create_user_success(client):
 def test_update_user_not_found(client):
     with patch("app.user_routes.get_database") as mock_get_db:
         mock_db = MagicMock()
-        mock_db.exists.return_value = False
+        mock_db.update.return_value = None
         mock_get_db.return_value = mock_db
         resp = client.put("/users/123", json={"name": "New Name"})
         assert resp.status_code == 404
@@ -142,11 +231,27 @@ def test_update_user_invalid_request(client):
         assert resp.get_json()["error"] == "Invalid request"
 
 
+def test_create_user_other_constraint_is_a_bad_request(client):
+    with patch("app.user_routes.get_database") as mock_get_db:
+        mock_db = MagicMock()
+        mock_db.create.side_effect = sqlite3.IntegrityError(
+            "NOT NULL constraint failed: users.name",
+        )
+        mock_get_db.return_value = mock_db
+        resp = client.post(
+            "/users/",
+            json={"name": None, "email": "test@test.com"},
+        )
+        assert resp.status_code == 400
+        assert resp.get_json()["error"] == "Invalid request"
+
+
 def test_update_user_email_exists(client):
     with patch("app.user_routes.get_database") as mock_get_db:
         mock_db = MagicMock()
-        mock_db.exists.return_value = True
-        mock_db.email_exists.return_value = True
+        mock_db.update.side_effect = sqlite3.IntegrityError(
+            "UNIQUE constraint failed: users.email",
+        )
         mock_get_db.return_value = mock_db
         resp = client.put("/users/1", json={"email": "exists@test.com"})
         assert resp.status_code == 409
@@ -186,7 +291,7 @@ def test_userrequest_from_dict():
 def test_delete_user_success(client):
     with patch("app.user_routes.get_database") as mock_get_db:
         mock_db = MagicMock()
-        mock_db.exists.return_value = True
+        mock_db.delete.return_value = True
         mock_get_db.return_value = mock_db
         resp = client.delete("/users/1")
         assert resp.status_code == 200
@@ -1,7 +1,19 @@
+import sqlite3
+
 import pytest
 
-from app.user.database import UserDatabase
-from app.user.models import UserRequest
+from app.domain.pagination import PageRequest
+from app.infrastructure.cache.backend import LRUCache
+from app.infrastructure.cache.read_through import ReadThroughCache
+from app.user.database import (
+    SCHEMA,
+    DuplicateEmailError,
+    DuplicateEmailsFound,
+    UserDatabase,
+    is_duplicate_email,
+)
+from app.user.migrate_emails import main as migrate_emails
+from app.user.models import BulkImportResult, UserRequest
 
 
 @pytest.fixture
@@ -35,6 +47,43 @@ def test_get_all_users(db):
     assert "a@a.com" in emails and "b@b.com" in emails
 
 
+def test_get_page_walks_keyset(db):
+    for i in range(5):
+        db.create(UserRequest(name=f"U{i}", email=f"u{i}@u.com"))
+
+    first = db.get_page(PageRequest(limit=2))
+    assert [u["name"] for u in first.items] == ["U0", "U1"]
+    assert first.next_after == first.items[-1]["id"]
+
+    second = db.get_page(PageRequest(limit=2, after=first.next_after))
+    assert [u["name"] for u in second.items] == ["U2", "U3"]
+
+    last = db.get_page(PageRequest(limit=2, after=second.next_after))
+    assert [u["name"] for u in last.items] == ["U4"]
+    assert last.next_after is None
+
+
+def test_get_page_projects_fields(db):
+    db.create(UserRequest(name="P", email="p@p.com"))
+
+    page = db.get_page(PageRequest(limit=10, fields=("email",)))
+
+    assert page.items == [{"email": "p@p.com"}]
+
+
+def test_iter_batches_streams_every_row(db):
+    for i in range(3):
+        db.create(UserRequest(name=f"S{i}", email=f"s{i}@s.com"))
+
+    batches = list(db.iter_batches(PageRequest(limit=None, fields=("name",))))
+
+    assert [item for batch in batches for item in batch] == [
+        {"name": "S0"},
+        {"name": "S1"},
+        {"name": "S2"},
+    ]
+
+
 def test_update_user(db):
     user = db.create(UserRequest(name="C", email="c@c.com"))
     updated = db.update(user.id, UserRequest(name="C2", email="c2@c.com"))
@@ -50,10 +99,27 @@ def test_update_nonexistent_user(db):
     assert updated is None
 
 
+def test_update_partial_keeps_other_fields(db):
+    user = db.create(UserRequest(name="H", email="h@h.com"))
+    updated = db.update(user.id, UserRequest(name="H2"))
+    assert updated.name == "H2"
+    assert updated.email == "h@h.com"
+
+
+def test_create_and_update_duplicate_email_raise(db):
+    user = db.create(UserRequest(name="I", email="i@i.com"))
+    other = db.create(UserRequest(name="J", email="j@j.com"))
+    with pytest.raises(sqlite3.IntegrityError):
+        db.create(UserRequest(name="I2", email="i@i.com"))
+    with pytest.raises(sqlite3.IntegrityError):
+        db.update(other.id, UserRequest(email=user.email))
+
+
 def test_delete_user(db):
     user = db.create(UserRequest(name="D", email="d@d.com"))
-    db.delete(user.id)
+    assert db.delete(user.id) is True
     assert db.get(user.id) is None
+    assert db.delete(user.id) is False
 
 
 def test_exists_and_email_exists(db):
@@ -70,3 +136,183 @@ def test_email_exists_exclude_id(db):
     assert not db.email_exists("f@f.com", exclude_id=user1.id)
     # Should find user1's email if not excluding
     assert db.email_exists("f@f.com")
+
+
+def test_bulk_create_reports_conflicts(db):
+    db.create(UserRequest(name="Existing", email="taken@b.com"))
+    rows = [
+        (0, UserRequest(name="B0", email="b0@b.com")),
+        (1, UserRequest(name="B1", email="Taken@B.com")),
+        (2, UserRequest(name="B2", email="b2@b.com")),
+        (3, UserRequest(name="B3", email="B0@b.com")),
+        (4, UserRequest(name="B4", email="b4@b.com")),
+    ]
+
+    result = db.bulk_create(rows, BulkImportResult(received=5), chunk_size=2)
+
+    assert result.created == 3
+    assert [c["index"] for c in result.conflicts] == [1, 3]
+    assert {u.email for u in db.get_all()} == {
+        "taken@b.com",
+        "b0@b.com",
+        "b2@b.com",
+        "b4@b.com",
+    }
+
+
+def test_cached_reads_are_invalidated_by_writes():
+    backend = LRUCache()
+    db = UserDatabase(":memory:", cache=ReadThroughCache(backend, "users"))
+    try:
+        user = db.create(UserRequest(name="K", email="k@k.com"))
+        assert db.get(user.id).name == "K"
+        assert db.get(user.id).name == "K"
+        assert len(db.get_page(PageRequest(limit=10)).items) == 1
+        assert backend.hits == 1
+
+        db.update(user.id, UserRequest(name="K2"))
+        assert db.get(user.id).name == "K2"
+        assert db.get_page(PageRequest(limit=10)).items[0]["name"] == "K2"
+
+        db.delete(user.id)
+        assert db.get(user.id) is None
+        assert db.get_page(PageRequest(limit=10)).items == []
+    finally:
+        db.close()
+
+
+def test_cached_lists_see_writes_from_other_connections(tmp_path):
+    path = str(tmp_path / "users.db")
+    db = UserDatabase(path, cache=ReadThroughCache(LRUCache(), "users"))
+    try:
+        db.create(UserRequest(name="A", email="a@a.com"))
+        before = db.version()
+        assert db.count() == 1
+        assert len(db.get_page(PageRequest(limit=10)).items) == 1
+        assert len(db.get_all()) == 1
+
+        # Another process writing to the same file
+        other = sqlite3.connect(path)
+        other.execute("INSERT INTO users (name, email) VALUES ('B', 'b@b')")
+        other.commit()
+        other.close()
+
+        assert db.version().version == before.version + 1
+        assert db.count() == 2
+        assert len(db.get_page(PageRequest(limit=10)).items) == 2
+        assert len(db.get_all()) == 2
+    finally:
+        db.close()
+
+
+def test_email_exists_ignores_case(db):
+    user = db.create(UserRequest(name="Case", email="Case@Example.com"))
+
+    assert db.email_exists("case@example.COM")
+    assert not db.email_exists("case@example.com", exclude_id=user.id)
+
+
+def test_emails_are_unique_ignoring_case(db):
+    db.create(UserRequest(name="Foo", email="Foo@x.com"))
+
+    with pytest.raises(DuplicateEmailError) as excinfo:
+        db.create(UserRequest(name="foo", email="foo@x.com"))
+    assert is_duplicate_email(excinfo.value)
+
+
+def test_update_keeps_own_email_in_other_case(db):
+    user = db.create(UserRequest(name="Own", email="own@x.com"))
+
+    assert db.update(user.id, UserRequest(email="OWN@x.com")).email == (
+        "OWN@x.com"
+    )
+
+
+def test_duplicate_email_matches_constraint_names():
+    assert is_duplicate_email(
+        sqlite3.IntegrityError("UNIQUE constraint failed: users.email"),
+    )
+    assert is_duplicate_email(
+        sqlite3.IntegrityError(
+            "UNIQUE constraint failed: index 'users_email_lower'",
+        ),
+    )
+    assert not is_duplicate_email(
+        sqlite3.IntegrityError("NOT NULL constraint failed: users.name"),
+    )
+
+
+def _legacy_database(path: str) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    conn.execute("CREATE INDEX users_email_lower ON users (lower(email))")
+    conn.executemany(
+        "INSERT INTO users (name, email) VALUES (?, ?)",
+        [("A", "a@x.com"), ("A2", "A@x.com"), ("B", "b@x.com")],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_startup_refuses_case_duplicates(tmp_path):
+    path = str(tmp_path / "users.db")
+    _legacy_database(path)
+
+    with pytest.raises(DuplicateEmailsFound) as excinfo:
+        UserDatabase(path)
+    assert excinfo.value.ids == [2]
+    assert "ids: 2" in str(excinfo.value)
+
+    conn = sqlite3.connect(path)
+    names = conn.execute("SELECT name FROM users ORDER BY id").fetchall()
+    conn.close()
+    assert names == [("A",), ("A2",), ("B",)]
+
+
+def test_migration_moves_case_duplicates_aside(tmp_path, capsys):
+    path = str(tmp_path / "users.db")
+    _legacy_database(path)
+
+    migrate_emails(["--path", path])
+    assert "Moved users 2" in capsys.readouterr().out
+
+    db = UserDatabase(path)
+    try:
+        assert [u.email for u in db.get_all()] == ["a@x.com", "b@x.com"]
+        assert db.count() == 2
+        with pytest.raises(sqlite3.IntegrityError):
+            db.create(UserRequest(name="A3", email="A@X.COM"))
+    finally:
+        db.close()
+    conn = sqlite3.connect(path)
+    moved = conn.execute("SELECT name FROM users_duplicate_emails").fetchall()
+    conn.close()
+    assert moved == [("A2",)]
+
+
+def test_search_ranks_and_tracks_writes(db):
+    db.create(UserRequest(name="Maria Souza", email="maria@example.com"))
+    user = db.create(UserRequest(name="Joao Souza", email="joao@example.com"))
+
+    page = db.search(PageRequest(limit=10, query="souza"))
+    assert {item["name"] for item in page.items} == {
+        "Maria Souza",
+        "Joao Souza",
+    }
+
+    db.update(user.id, UserRequest(name="Joao Lima"))
+    page = db.search(PageRequest(limit=10, query="souza"))
+    assert [item["name"] for item in page.items] == ["Maria Souza"]
+
+
+def test_count_tracks_writes(db):
+    assert db.count() == 0
+    user = db.create(UserRequest(name="One", email="one@example.com"))
+    db.bulk_create(
+        [(0, UserRequest(name="Two", email="two@example.com"))],
+        BulkImportResult(received=1),
+    )
+    assert db.count() == 2
+
+    db.delete(user.id)
+    assert db.count() == 1
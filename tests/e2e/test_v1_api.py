@@ -11,6 +11,14 @@ def test_v1_customer_auth_public_private_and_swagger() -> None:
     assert customer_response.status_code == 200
     assert isinstance(customer_response.get_json(), list)
 
+    total = customer_response.headers["X-Total-Count"]
+    count_response = client.get("/v1/customer/count")
+    assert count_response.get_json() == {"count": int(total)}
+
+    search_response = client.get("/v1/customer?q=bruno&limit=5")
+    assert search_response.status_code == 200
+    assert [c["name"] for c in search_response.get_json()] == ["Bruno Flask"]
+
     login_response = client.get("/v1/auth/login")
     assert login_response.status_code == 200
     auth_header = login_response.headers.get("Authorization")
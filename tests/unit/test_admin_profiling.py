@@ -0,0 +1,119 @@
+import marshal
+
+import pytest
+from flask import Flask, jsonify
+
+from app.core.dependencies import get_auth_service
+from app.infrastructure.profiling.request_profiler import ProfilingSession
+from app.interface.api import admin
+from app.interface.api.admin import admin_bp, install_request_profiler
+
+
+def busy_work() -> int:
+    return sum(i * i for i in range(2000))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(admin, "_session", None)
+    monkeypatch.setenv("ADMIN_SUBJECTS", "admin-user")
+    app = Flask(__name__)
+    install_request_profiler(app)
+    app.register_blueprint(admin_bp, url_prefix="/admin")
+
+    @app.get("/work")
+    def work():
+        return jsonify({"result": busy_work()})
+
+    return app.test_client()
+
+
+@pytest.fixture
+def headers():
+    token = get_auth_service().issue_token("admin-user")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_admin_routes_require_a_token(client) -> None:
+    assert client.get("/admin/threads").status_code == 401
+
+
+def test_admin_routes_check_allowed_subjects(
+    client,
+    headers,
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("ADMIN_SUBJECTS", "ops, oncall")
+
+    assert client.get("/admin/threads", headers=headers).status_code == 403
+
+
+def test_admin_routes_deny_all_subjects_by_default(
+    client,
+    headers,
+    monkeypatch,
+) -> None:
+    monkeypatch.delenv("ADMIN_SUBJECTS")
+
+    assert client.get("/admin/threads", headers=headers).status_code == 403
+
+
+def test_profile_next_requests(client, headers) -> None:
+    started = client.post("/admin/profile?requests=2", headers=headers)
+    assert started.status_code == 202
+    assert client.get("/admin/profile", headers=headers).status_code == 202
+
+    client.get("/work")
+    client.get("/work")
+
+    text = client.get("/admin/profile", headers=headers)
+    assert text.status_code == 200
+    assert "busy_work" in text.get_data(as_text=True)
+    dump = client.get("/admin/profile?format=pstats", headers=headers)
+    stats = marshal.loads(dump.data)
+    assert any(name == "busy_work" for _, _, name in stats)
+    assert "attachment" in dump.headers["Content-Disposition"]
+    folded = client.get("/admin/profile?format=collapsed", headers=headers)
+    assert "busy_work" in folded.get_data(as_text=True)
+
+
+def test_profile_arguments_are_validated(client, headers) -> None:
+    assert client.post("/admin/profile", headers=headers).status_code == 400
+    response = client.post("/admin/profile?seconds=9999", headers=headers)
+    assert response.status_code == 400
+
+
+def test_only_one_profile_runs_at_a_time(client, headers) -> None:
+    client.post("/admin/profile?requests=5", headers=headers)
+
+    response = client.post("/admin/profile?requests=5", headers=headers)
+
+    assert response.status_code == 409
+
+
+def test_time_window_session_stops_accepting(mocker) -> None:
+    session = ProfilingSession(seconds=10)
+    profile = session.start()
+    session.finish(profile)
+
+    later = session.deadline + 1
+    mocker.patch(
+        "app.infrastructure.profiling.request_profiler.time.monotonic",
+        return_value=later,
+    )
+
+    assert session.start() is None
+    assert session.done
+    assert session.status()["profiled"] == 1
+
+
+def test_sample_and_thread_dump(client, headers) -> None:
+    sampled = client.get(
+        "/admin/sample?seconds=0.05&interval_ms=5",
+        headers=headers,
+    )
+    assert sampled.status_code == 200
+    assert sampled.headers["Content-Disposition"].endswith('.folded"')
+
+    dump = client.get("/admin/threads", headers=headers)
+    assert "MainThread" in dump.get_data(as_text=True)
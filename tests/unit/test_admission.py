@@ -0,0 +1,173 @@
+import asyncio
+import threading
+
+import pytest
+from flask import Flask, jsonify
+
+from app.infrastructure.admission.limiter import (
+    ADMITTED,
+    QUEUED,
+    REJECTED,
+    AdmissionController,
+    AdmissionSettings,
+    AIMDLimit,
+    RouteGroup,
+    _parse_groups,
+)
+from app.interface.api.admission import (
+    AdmissionMiddleware,
+    AsgiAdmissionMiddleware,
+)
+
+
+def settings(**overrides) -> AdmissionSettings:
+    values = {
+        "enabled": True,
+        "groups": (("api", ("/v1",), 1),),
+        "default_limit": 1,
+        "exempt": ("/health",),
+        "min_limit": 1,
+        "queue_size": 1,
+        "queue_timeout_seconds": 0.05,
+        "retry_after_seconds": 3,
+        "adaptive": False,
+    }
+    return AdmissionSettings(**{**values, **overrides})
+
+
+def test_parse_groups() -> None:
+    assert _parse_groups("api=/v1:32, users=/users|/admin:8") == (
+        ("api", ("/v1",), 32),
+        ("users", ("/users", "/admin"), 8),
+    )
+    with pytest.raises(ValueError):
+        _parse_groups("api=/v1")
+
+
+def test_limit_grows_while_reached_and_backs_off_on_latency() -> None:
+    limit = AIMDLimit(4, min_limit=2, max_limit=8)
+    for _ in range(100):
+        limit.update(0.01, in_flight=int(limit.limit) - 1)
+    grown = limit.limit
+
+    for _ in range(30):
+        limit.update(0.1, in_flight=1)
+
+    assert grown == 8
+    assert 2 <= limit.limit < 5
+
+
+def test_limit_stays_put_when_not_reached() -> None:
+    limit = AIMDLimit(10)
+    for _ in range(100):
+        limit.update(0.01, in_flight=0)
+
+    assert limit.limit == 10
+
+
+def test_group_admits_queues_and_rejects_in_order() -> None:
+    group = RouteGroup("api", ("/v1",), AIMDLimit(1), queue_size=1)
+    woken = []
+
+    first, _ = group.try_admit(lambda: woken.append("first"))
+    second, ticket = group.try_admit(lambda: woken.append("second"))
+    third, _ = group.try_admit(lambda: woken.append("third"))
+    group.release(None)
+
+    assert (first, second, third) == (ADMITTED, QUEUED, REJECTED)
+    assert woken == ["second"]
+    assert ticket.admitted
+    assert not group.abandon(ticket)
+    assert group.in_flight == 1
+
+
+def test_controller_routes_paths_to_groups() -> None:
+    controller = AdmissionController(settings())
+
+    assert controller.group_for("/v1/customer").name == "api"
+    assert controller.group_for("/users/1").name == "default"
+    assert controller.group_for("/health/ready") is None
+
+
+def test_queued_request_gives_up_at_the_deadline() -> None:
+    controller = AdmissionController(settings())
+    group = controller.group_for("/v1/customer")
+
+    assert controller.admit(group)
+    assert not controller.admit(group)
+    assert group.queued == 0
+    group.release(None)
+    assert controller.admit(group)
+
+
+def test_wsgi_middleware_sheds_with_retry_after() -> None:
+    entered = threading.Event()
+    release = threading.Event()
+    app = Flask(__name__)
+
+    @app.route("/v1/slow")
+    def slow():
+        entered.set()
+        release.wait(5)
+        return jsonify({"ok": True})
+
+    @app.route("/health")
+    def health_check():
+        return jsonify({"ok": True})
+
+    controller = AdmissionController(settings(queue_size=0))
+    app.wsgi_app = AdmissionMiddleware(app.wsgi_app, controller)
+    client = app.test_client()
+    responses = []
+    thread = threading.Thread(
+        target=lambda: responses.append(client.get("/v1/slow")),
+    )
+    thread.start()
+    entered.wait(5)
+
+    shed = client.get("/v1/slow")
+    health = client.get("/health")
+    release.set()
+    thread.join()
+    responses[0].close()
+
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "3"
+    assert shed.get_json()["detail"].startswith("Server is overloaded")
+    assert health.status_code == 200
+    assert responses[0].status_code == 200
+    assert controller.group_for("/v1").in_flight == 0
+
+
+def test_asgi_middleware_queues_then_sheds() -> None:
+    async def scenario() -> list[int]:
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        middleware = AsgiAdmissionMiddleware(
+            app,
+            AdmissionController(settings(queue_timeout_seconds=5)),
+        )
+
+        async def call() -> int:
+            sent = []
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "path": "/v1/customer"}
+            await middleware(scope, None, send)
+            return sent[0]["status"]
+
+        running = asyncio.create_task(call())
+        queued = asyncio.create_task(call())
+        await asyncio.sleep(0.01)
+        rejected = await call()
+        release.set()
+        return [await running, await queued, rejected]
+
+    assert asyncio.run(scenario()) == [200, 200, 503]
@@ -0,0 +1,27 @@
+import asyncio
+import contextvars
+
+from app.interface.api.asgi import FreshContextMiddleware
+
+LEAKED: contextvars.ContextVar[str] = contextvars.ContextVar("leaked")
+
+
+def test_requests_do_not_share_context() -> None:
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(LEAKED.get(None))
+        LEAKED.set(scope["path"])
+
+    middleware = FreshContextMiddleware(app)
+
+    async def connection() -> None:
+        # Same task, like two requests on one keep-alive connection
+        LEAKED.set("connection")
+        await middleware({"type": "http", "path": "/a"}, None, None)
+        await middleware({"type": "http", "path": "/b"}, None, None)
+        seen.append(LEAKED.get())
+
+    asyncio.run(connection())
+
+    assert seen == [None, None, "connection"]
@@ -1,4 +1,8 @@
-from app.services.auth_service import AuthService
+import time
+
+import jwt
+
+from app.services.auth_service import AuthService, AuthSettings
 
 
 def test_issue_and_decode_token() -> None:
@@ -8,3 +12,50 @@ def test_issue_and_decode_token() -> None:
     payload = service.decode_token(token)
 
     assert payload["sub"] == "unit-user"
+
+
+def test_decode_token_serves_repeat_tokens_from_cache(mocker) -> None:
+    service = AuthService()
+    token = service.issue_token("cached-user")
+    decode = mocker.spy(jwt, "decode")
+
+    first = service.decode_token(token)
+    second = service.decode_token(token)
+
+    assert first == second
+    assert decode.call_count == 1
+    assert service.verify_cache_stats()["hits"] == 1
+
+
+def test_decode_token_cache_returns_copies() -> None:
+    service = AuthService()
+    token = service.issue_token("copy-user")
+
+    service.decode_token(token)["sub"] = "tampered"
+
+    assert service.decode_token(token)["sub"] == "copy-user"
+
+
+def test_cached_token_is_reverified_after_expiry(mocker) -> None:
+    service = AuthService()
+    token = service.issue_token("expiring-user")
+    service.decode_token(token)
+    decode = mocker.spy(jwt, "decode")
+
+    later = time.time() + 2 * 60 * 60
+    mocker.patch("app.services.auth_service.time.time", return_value=later)
+    service.decode_token(token)
+
+    assert decode.call_count == 1
+
+
+def test_decode_token_without_cache(mocker) -> None:
+    service = AuthService(AuthSettings(verify_cache_size=0))
+    token = service.issue_token("uncached-user")
+    decode = mocker.spy(jwt, "decode")
+
+    service.decode_token(token)
+    service.decode_token(token)
+
+    assert decode.call_count == 2
+    assert service.verify_cache_stats() == {}
@@ -0,0 +1,36 @@
+import json
+
+from benchmarks.compare import find_regressions, main
+from benchmarks.results import summarize, write_results
+
+
+def test_summarize_reports_percentiles_and_throughput() -> None:
+    samples = [i / 1000 for i in range(1, 101)]
+
+    summary = summarize(samples, elapsed=2.0, errors=1)
+
+    assert summary["count"] == 100
+    assert summary["ops_per_sec"] == 50.0
+    assert summary["p50_ms"] == 51.0
+    assert summary["p99_ms"] == 99.0
+    assert summary["errors"] == 1
+
+
+def test_find_regressions_flags_slower_and_lower_throughput() -> None:
+    baseline = {"a": {"p95_ms": 1.0, "ops_per_sec": 100.0}}
+    faster = {"a": {"p95_ms": 1.05, "ops_per_sec": 95.0}}
+    slower = {"a": {"p95_ms": 1.5, "ops_per_sec": 50.0}}
+
+    assert find_regressions(baseline, faster, threshold=0.1) == []
+    assert len(find_regressions(baseline, slower, threshold=0.1)) == 2
+
+
+def test_compare_exit_status(tmp_path) -> None:
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    write_results(str(baseline), "micro", {}, {"a": summarize([0.001], 1.0)})
+    write_results(str(current), "micro", {}, {"a": summarize([0.002], 1.0)})
+
+    assert main([str(baseline), str(baseline)]) == 0
+    assert main([str(baseline), str(current)]) == 1
+    assert json.loads(current.read_text())["suite"] == "micro"
@@ -0,0 +1,97 @@
+import sqlite3
+
+import pytest
+
+from app.infrastructure.sqlite.bulk_load import bulk_load
+from app.infrastructure.sqlite.versions import (
+    install_version_tracking,
+    read_version,
+)
+from benchmarks import seed_data
+from benchmarks.seed_data import generate_people
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE people (id INTEGER PRIMARY KEY, name TEXT, "
+        "email TEXT UNIQUE)",
+    )
+    conn.execute("CREATE INDEX people_name ON people (name)")
+    install_version_tracking(conn, "people")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def schema(conn: sqlite3.Connection) -> set[str]:
+    return {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE tbl_name = 'people'",
+        )
+    }
+
+
+def test_bulk_load_restores_indexes_and_bumps_version_once(conn) -> None:
+    before = schema(conn)
+
+    inserted = bulk_load(
+        conn,
+        "people",
+        ("name", "email"),
+        ((f"Name {i}", f"p{i}@example.com") for i in range(500)),
+    )
+
+    assert inserted == 500
+    assert schema(conn) == before
+    assert read_version(conn, "people").version == 1
+    conn.execute("INSERT INTO people (name, email) VALUES ('x', 'x@x')")
+    assert read_version(conn, "people").version == 2
+
+
+def test_bulk_load_rolls_back_on_failure(conn) -> None:
+    before = schema(conn)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        bulk_load(
+            conn,
+            "people",
+            ("name", "email"),
+            [("A", "dup@example.com"), ("B", "dup@example.com")],
+        )
+
+    assert conn.execute("SELECT COUNT(*) FROM people").fetchone()[0] == 0
+    assert schema(conn) == before
+    assert read_version(conn, "people").version == 0
+
+
+def test_generated_people_are_deterministic_and_unique() -> None:
+    first = list(generate_people(2000, seed=7))
+    second = list(generate_people(2000, seed=7))
+    other = list(generate_people(2000, seed=8))
+
+    assert first == second
+    assert first != other
+    assert len({email for _, email in first}) == 2000
+    assert all(email.isascii() for _, email in first)
+    _, email = next(generate_people(1, seed=7, start=10))
+    assert email.split("@")[0].endswith(".11")
+
+
+def test_seed_restores_the_journal_mode(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "users.db")
+    seed_data.prepare("users", path)
+    other = sqlite3.connect(path)
+    other.execute("PRAGMA journal_mode = DELETE")
+    other.close()
+    monkeypatch.setattr(seed_data, "prepare", lambda table, path: None)
+
+    inserted = seed_data.seed("users", path, 10, 42)
+
+    check = sqlite3.connect(path)
+    mode = check.execute("PRAGMA journal_mode").fetchone()[0]
+    count = check.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+    check.close()
+    assert (inserted, count, mode) == (10, 10, "delete")
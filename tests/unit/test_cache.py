@@ -0,0 +1,123 @@
+import time
+
+from app.application.use_cases.list_customers import ListCustomersUseCase
+from app.domain.customer import Customer
+from app.domain.pagination import Page, PageRequest
+from app.domain.versioning import TableVersion
+from app.infrastructure.cache.backend import MISSING, LRUCache
+from app.infrastructure.cache.read_through import ReadThroughCache
+
+
+def test_lru_counts_hits_misses_and_evictions() -> None:
+    cache = LRUCache(max_entries=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "entries": 2,
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+    }
+
+
+def test_lru_expires_entries_after_ttl() -> None:
+    cache = LRUCache(ttl=0.01)
+
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_delete_prefix() -> None:
+    cache = LRUCache()
+    cache.set("users:list:1", 1)
+    cache.set("users:item:1", 2)
+
+    cache.delete_prefix("users:list:")
+
+    assert cache.get("users:list:1") is MISSING
+    assert cache.get("users:item:1") == 2
+
+
+def test_read_through_loads_once_until_invalidated() -> None:
+    cache = ReadThroughCache(LRUCache(), "ns")
+    calls = []
+
+    def load() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_load("k", load) == 1
+    assert cache.get_or_load("k", load) == 1
+    cache.invalidate("k")
+    assert cache.get_or_load("k", load) == 2
+
+
+def test_read_through_does_not_store_load_racing_a_write() -> None:
+    cache = ReadThroughCache(LRUCache(), "ns")
+
+    def load() -> str:
+        cache.invalidate("k")
+        return "stale"
+
+    assert cache.get_or_load("k", load) == "stale"
+    assert cache.get_or_load("k", lambda: "fresh") == "fresh"
+
+
+class VersionedRepository:
+    def __init__(self) -> None:
+        self.customers = [Customer(id=1, name="Erika", email="e@x.com")]
+        self.current = 1
+        self.version_reads = 0
+
+    def version(self) -> TableVersion:
+        self.version_reads += 1
+        return TableVersion(self.current, 0.0)
+
+    def list_customers(self) -> list[Customer]:
+        return list(self.customers)
+
+    def count(self) -> int:
+        return len(self.customers)
+
+    def list_customers_page(self, page: PageRequest) -> Page:
+        return Page(items=[c.model_dump() for c in self.customers])
+
+
+def test_list_customers_use_case_serves_from_cache() -> None:
+    repository = VersionedRepository()
+    use_case = ListCustomersUseCase(
+        repository=repository,
+        cache=ReadThroughCache(LRUCache(), "customers"),
+    )
+
+    first = use_case.execute()
+    repository.customers = []
+
+    assert use_case.execute() == first
+    # A write from another process bumps the version
+    repository.current = 2
+    assert use_case.execute() == []
+
+
+def test_list_customers_use_case_reuses_the_request_version() -> None:
+    repository = VersionedRepository()
+    use_case = ListCustomersUseCase(
+        repository=repository,
+        cache=ReadThroughCache(LRUCache(), "customers"),
+    )
+
+    version = use_case.version()
+    use_case.execute_page(PageRequest(limit=10), version)
+    use_case.count(version)
+
+    assert repository.version_reads == 1
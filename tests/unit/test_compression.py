@@ -0,0 +1,212 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from flask import Flask, Response, jsonify, send_file
+
+from app.infrastructure.compression import compressible
+from app.infrastructure.static_assets import StaticAssets
+from app.infrastructure.static_build import build_static
+from app.interface.api import static_files
+from app.interface.api.compression import (
+    CompressionSettings,
+    install_compression,
+)
+
+SETTINGS = CompressionSettings(enabled=True, min_bytes=100)
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Flask:
+    app = Flask(__name__)
+    install_compression(app, SETTINGS)
+    big = tmp_path / "big.js"
+    big.write_text("console.log('hello');\n" * 200)
+
+    @app.route("/big")
+    def big_json() -> Response:
+        response = jsonify([{"id": i, "name": "Ada"} for i in range(50)])
+        response.set_etag("items-1")
+        return response
+
+    @app.route("/small")
+    def small_json() -> Response:
+        return jsonify({"ok": True})
+
+    @app.route("/stream")
+    def stream() -> Response:
+        return Response((b"x" * 500 for _ in range(3)), mimetype="text/plain")
+
+    @app.route("/file")
+    def file() -> Response:
+        return send_file(big)
+
+    return app
+
+
+def test_compressible_types() -> None:
+    assert compressible("application/json")
+    assert compressible("text/html")
+    assert compressible("application/problem+json")
+    assert not compressible("image/png")
+    assert not compressible(None)
+
+
+def test_large_json_is_gzipped_with_weak_etag(app: Flask) -> None:
+    response = app.test_client().get(
+        "/big",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == 'W/"items-1"'
+    assert "Accept-Encoding" in response.vary
+    body = gzip.decompress(response.data)
+    assert len(json.loads(body)) == 50
+    assert response.content_length == len(response.data)
+
+
+def test_responses_are_left_alone_when_not_worth_it(app: Flask) -> None:
+    client = app.test_client()
+
+    identity = client.get("/big")
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    streamed = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in identity.headers
+    assert "Accept-Encoding" in identity.vary
+    assert "Content-Encoding" not in small.headers
+    assert "Content-Encoding" not in streamed.headers
+    assert streamed.data == b"x" * 1500
+
+
+def test_files_are_compressed_once_per_etag(app: Flask) -> None:
+    client = app.test_client()
+
+    first = client.get("/file", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/file", headers={"Accept-Encoding": "gzip"})
+    revalidated = client.get(
+        "/file",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": first.headers["ETag"],
+        },
+    )
+
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Ranges" not in first.headers
+    assert second.data == first.data
+    assert gzip.decompress(first.data).startswith(b"console.log")
+    assert revalidated.status_code == 304
+
+
+@pytest.fixture
+def assets(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> StaticAssets:
+    source = tmp_path / "public"
+    (source / "js").mkdir(parents=True)
+    (source / "index.html").write_text("<p>hello</p>\n" * 100)
+    (source / "js" / "app.js").write_text("let answer = 42;\n" * 100)
+    (source / "tiny.txt").write_text("hi")
+    build_static(source, tmp_path / "build", encodings=("gzip",))
+    assets = StaticAssets(source, tmp_path / "build")
+    monkeypatch.setattr(static_files, "get_static_assets", lambda: assets)
+    return assets
+
+
+@pytest.fixture
+def static_app(assets: StaticAssets) -> Flask:
+    app = Flask(__name__, static_folder=None)
+    install_compression(app, SETTINGS)
+    app.register_blueprint(static_files.static_bp)
+    return app
+
+
+def test_build_writes_fingerprinted_files_and_variants(
+    assets: StaticAssets,
+) -> None:
+    built, fingerprinted = assets.resolve("js/app.js")
+    tiny, _ = assets.resolve("tiny.txt")
+
+    assert not fingerprinted
+    assert built.path == f"js/app.{built.digest}.js"
+    assert built.encodings == ("gzip",)
+    assert (assets.build_dir / (built.path + ".gz")).is_file()
+    assert tiny.encodings == ()
+    assert assets.resolve(built.path) == (built, True)
+    assert assets.resolve("missing.css") is None
+
+
+def test_fingerprinted_url_is_immutable_and_precompressed(
+    static_app: Flask,
+    assets: StaticAssets,
+) -> None:
+    built, _ = assets.resolve("js/app.js")
+
+    response = static_app.test_client().get(
+        f"/static/{built.path}",
+        headers={"Accept-Encoding": "br;q=0.9, gzip"},
+    )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.mimetype in ("text/javascript", "application/javascript")
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age == static_files.IMMUTABLE_MAX_AGE
+    assert gzip.decompress(response.data) == b"let answer = 42;\n" * 100
+
+
+def test_logical_url_is_revalidated(static_app: Flask) -> None:
+    client = static_app.test_client()
+
+    response = client.get("/static/index.html")
+    revalidated = client.get(
+        "/static/index.html",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+
+    assert "Content-Encoding" not in response.headers
+    assert response.cache_control.no_cache
+    assert "Accept-Encoding" in response.vary
+    assert response.data == b"<p>hello</p>\n" * 100
+    assert revalidated.status_code == 304
+
+
+def test_unbuilt_files_are_served_from_the_source(
+    static_app: Flask,
+    assets: StaticAssets,
+) -> None:
+    (assets.source_dir / "new.txt").write_text("fresh")
+
+    response = static_app.test_client().get("/static/new.txt")
+
+    assert response.status_code == 200
+    assert response.data == b"fresh"
+
+
+def test_brotli_variants_when_installed(tmp_path: Path) -> None:
+    brotli = pytest.importorskip("brotli")
+    source = tmp_path / "public"
+    source.mkdir()
+    (source / "app.js").write_text("let answer = 42;\n" * 100)
+    build_static(source, tmp_path / "build")
+    assets = StaticAssets(source, tmp_path / "build")
+    built, _ = assets.resolve("app.js")
+    app = Flask(__name__, static_folder=None)
+    install_compression(app, SETTINGS)
+
+    @app.route("/big")
+    def big() -> Response:
+        return jsonify([{"id": i, "name": "Ada"} for i in range(50)])
+
+    response = app.test_client().get(
+        "/big",
+        headers={"Accept-Encoding": "gzip;q=0.5, br"},
+    )
+
+    assert built.encodings == ("br", "gzip")
+    variant = assets.build_dir / (built.path + ".br")
+    assert brotli.decompress(variant.read_bytes()) == (
+        b"let answer = 42;\n" * 100
+    )
+    assert response.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(response.data))[0]["name"] == "Ada"
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+from flask import Flask, jsonify
+
+from app.interface.api.docs import DocsSettings, install_docs, render_spec
+
+
+def make_app(settings: DocsSettings) -> Flask:
+    app = Flask(__name__, static_folder=None)
+
+    @app.route("/ping")
+    def ping():
+        """Ping.
+        ---
+        responses:
+          200:
+            description: pong
+        """
+        return jsonify({"pong": True})
+
+    install_docs(app, settings)
+    return app
+
+
+def test_spec_is_built_once_and_revalidated(monkeypatch) -> None:
+    app = make_app(DocsSettings(enabled=True, spec_file=None))
+    builds = []
+    swagger = app.swag
+    original = swagger.get_apispecs
+
+    def counting(endpoint: str) -> dict:
+        builds.append(endpoint)
+        return original(endpoint)
+
+    monkeypatch.setattr(swagger, "get_apispecs", counting)
+    client = app.test_client()
+
+    first = client.get("/swagger.json")
+    second = client.get("/swagger.json")
+    revalidated = client.get(
+        "/swagger.json",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert "/ping" in first.get_json()["paths"]
+    assert second.data == first.data
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert revalidated.status_code == 304
+    assert builds == ["swagger"]
+    assert client.get("/docs").status_code == 200
+
+
+def test_pre_rendered_spec_file_is_served(tmp_path: Path) -> None:
+    spec_file = tmp_path / "swagger.json"
+    spec_file.write_bytes(render_spec(make_app(DocsSettings(enabled=False))))
+    app = make_app(DocsSettings(enabled=True, spec_file=str(spec_file)))
+
+    response = app.test_client().get("/swagger.json")
+
+    assert response.data == spec_file.read_bytes()
+    assert "/ping" in json.loads(response.data)["paths"]
+
+
+def test_disabled_docs_register_nothing() -> None:
+    app = make_app(DocsSettings(enabled=False))
+    client = app.test_client()
+
+    assert client.get("/docs").status_code == 404
+    assert client.get("/swagger.json").status_code == 404
+    assert not hasattr(app, "swag")
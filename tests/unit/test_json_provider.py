@@ -0,0 +1,59 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask, jsonify
+
+from app.domain.customer import Customer
+from app.interface.api import json_provider
+from app.interface.api.json_provider import FastJSONProvider, dumps_bytes
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+CUSTOMERS = [
+    Customer(id=1, name="Ana", email="ana@flask.com"),
+    Customer(id=2, name="Bruno", email="bruno@flask.com"),
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_provider, "orjson", None)
+    else:
+        pytest.importorskip("orjson")
+    return request.param
+
+
+def test_models_are_serialized_in_bulk(encoder) -> None:
+    assert json.loads(dumps_bytes(CUSTOMERS)) == [
+        c.model_dump() for c in CUSTOMERS
+    ]
+
+
+def test_mixed_values_keep_flask_semantics(encoder) -> None:
+    when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    payload = {"point": Point(1, 2), "when": when, "customer": CUSTOMERS[0]}
+
+    assert json.loads(dumps_bytes(payload)) == {
+        "point": {"x": 1, "y": 2},
+        "when": "Tue, 02 Jan 2024 03:04:05 GMT",
+        "customer": CUSTOMERS[0].model_dump(),
+    }
+
+
+def test_provider_is_used_by_jsonify(encoder) -> None:
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+
+    with app.app_context():
+        response = jsonify(CUSTOMERS)
+
+    assert response.mimetype == "application/json"
+    assert response.get_json() == [c.model_dump() for c in CUSTOMERS]
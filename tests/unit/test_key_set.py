@@ -0,0 +1,133 @@
+import json
+import os
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+
+from app.services.auth_service import AuthService, AuthSettings
+from app.services.key_set import KeySet, generate_signing_key
+
+NO_CACHE = AuthSettings(verify_cache_size=0)
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256", "EdDSA"])
+def test_asymmetric_round_trip(algorithm: str) -> None:
+    key = generate_signing_key("k1", algorithm)
+    service = AuthService(NO_CACHE, key_set=KeySet([key]))
+
+    token = service.issue_token("asym-user")
+
+    assert jwt.get_unverified_header(token)["kid"] == "k1"
+    assert service.decode_token(token)["sub"] == "asym-user"
+
+
+def test_scheduled_rotation_switches_signer(mocker) -> None:
+    current = generate_signing_key("current", "ES256")
+    upcoming = generate_signing_key(
+        "upcoming",
+        "ES256",
+        not_before=time.time() + 3600,
+    )
+    service = AuthService(NO_CACHE, key_set=KeySet([current, upcoming]))
+    old_token = service.issue_token("rotating-user")
+    assert jwt.get_unverified_header(old_token)["kid"] == "current"
+
+    later = time.time() + 7200
+    mocker.patch("app.services.key_set.time.time", return_value=later)
+    new_token = service.issue_token("rotating-user")
+
+    assert jwt.get_unverified_header(new_token)["kid"] == "upcoming"
+    assert service.decode_token(old_token)["sub"] == "rotating-user"
+
+
+def test_unknown_kid_is_rejected() -> None:
+    issuer = AuthService(
+        NO_CACHE,
+        key_set=KeySet([generate_signing_key("a", "ES256")]),
+    )
+    verifier = AuthService(
+        NO_CACHE,
+        key_set=KeySet([generate_signing_key("b", "ES256")]),
+    )
+
+    with pytest.raises(jwt.InvalidKeyError):
+        verifier.decode_token(issuer.issue_token("someone"))
+
+
+def test_hmac_token_cannot_claim_an_asymmetric_kid() -> None:
+    key = generate_signing_key("rsa", "RS256")
+    service = AuthService(NO_CACHE, key_set=KeySet([key]))
+    forged = jwt.encode(
+        {"sub": "attacker"},
+        "guess",
+        algorithm="HS256",
+        headers={"kid": "rsa"},
+    )
+
+    with pytest.raises(jwt.InvalidTokenError):
+        service.decode_token(forged)
+
+
+def test_jwks_publishes_only_public_asymmetric_keys() -> None:
+    key_set = KeySet(
+        [
+            generate_signing_key("ec", "ES256"),
+            *KeySet.from_secret("secret")._keys.values(),
+        ],
+    )
+
+    keys = key_set.jwks()["keys"]
+
+    assert [k["kid"] for k in keys] == ["ec"]
+    assert keys[0]["kty"] == "EC"
+    assert "d" not in keys[0]
+
+
+def _write_key(directory, kid: str) -> str:
+    key = generate_signing_key(kid, "ES256")
+    path = directory / f"{kid}.pem"
+    path.write_bytes(
+        key.sign_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+    )
+    return path.name
+
+
+def test_manifest_reload_picks_up_new_keys(tmp_path) -> None:
+    manifest = tmp_path / "keys.json"
+    first = _write_key(tmp_path, "first")
+    manifest.write_text(
+        json.dumps(
+            {"keys": [{"kid": "first", "alg": "ES256", "private_key": first}]}
+        ),
+    )
+    key_set = KeySet(source=str(manifest), reload_seconds=0)
+    parsed = key_set.verification_key("first").sign_key
+
+    second = _write_key(tmp_path, "second")
+    manifest.write_text(
+        json.dumps(
+            {
+                "keys": [
+                    {"kid": "first", "alg": "ES256", "private_key": first},
+                    {
+                        "kid": "second",
+                        "alg": "ES256",
+                        "private_key": second,
+                        "not_before": "2000-01-01T00:00:00+00:00",
+                    },
+                ],
+            },
+        ),
+    )
+    stat = os.stat(manifest)
+    os.utime(manifest, (stat.st_atime, stat.st_mtime + 1))
+
+    assert key_set.signing_key().kid == "second"
+    # The unchanged PEM is not parsed again
+    assert key_set.verification_key("first").sign_key is parsed
@@ -0,0 +1,142 @@
+import sqlite3
+
+import pytest
+from flask import Flask, jsonify
+
+from app.infrastructure.metrics.registry import MetricsRegistry
+from app.infrastructure.metrics.sqlite import (
+    SQL_METRICS,
+    InstrumentedConnection,
+    statement_labels,
+)
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.interface.api.metrics import (
+    IN_FLIGHT,
+    LATENCY,
+    REQUESTS,
+    install_request_metrics,
+    metrics_bp,
+)
+
+
+def test_counter_and_gauge_render_with_labels() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs", ("queue",))
+    gauge = registry.gauge("workers", "Workers")
+    counter.inc("fast")
+    counter.inc("fast", amount=2)
+    counter.inc('sl"ow')
+    gauge.set(value=4)
+    gauge.dec()
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{queue="fast"} 3' in text
+    assert 'jobs_total{queue="sl\\"ow"} 1' in text
+    assert "workers 3" in text
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert 'latency_bucket{le="0.1"} 1' in lines
+    assert 'latency_bucket{le="1"} 3' in lines
+    assert 'latency_bucket{le="+Inf"} 4' in lines
+    assert "latency_count 4" in lines
+    assert "latency_sum 6.05" in lines
+
+
+def test_registering_twice_returns_the_same_metric() -> None:
+    registry = MetricsRegistry()
+
+    first = registry.counter("hits_total", "Hits")
+
+    assert registry.counter("hits_total", "Hits") is first
+    with pytest.raises(ValueError):
+        registry.gauge("hits_total", "Hits")
+
+
+def test_statement_labels_are_bounded() -> None:
+    assert statement_labels(
+        "SELECT email FROM users WHERE email IN (?, ?, ?)",
+    ) == ("SELECT", "users")
+    assert statement_labels(
+        "CREATE TRIGGER IF NOT EXISTS t AFTER UPDATE ON users BEGIN END",
+    ) == ("CREATE", "users")
+    assert statement_labels("PRAGMA journal_mode") == ("PRAGMA", "")
+
+
+def test_instrumented_pool_records_statements(tmp_path) -> None:
+    pool = SQLiteConnectionPool(
+        str(tmp_path / "timed.db"),
+        factory=InstrumentedConnection,
+    )
+    labels = ("timed", "INSERT", "items")
+    before = SQL_METRICS.statements.value(*labels)
+
+    pool.write(lambda conn: conn.execute("CREATE TABLE items (id INTEGER)"))
+    pool.write(
+        lambda conn: conn.executemany(
+            "INSERT INTO items (id) VALUES (?)",
+            [(1,), (2,)],
+        ),
+    )
+    with pytest.raises(sqlite3.OperationalError):
+        pool.write(lambda conn: conn.execute("INSERT INTO items VALUES (1, 2)"))
+
+    assert SQL_METRICS.statements.value(*labels) == before + 2
+    assert SQL_METRICS.errors.value(*labels) >= 1
+    assert SQL_METRICS.duration.count(*labels) >= 2
+    pool.close()
+
+
+def test_request_hooks_record_routes(monkeypatch) -> None:
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+    app = Flask(__name__)
+    install_request_metrics(app)
+    app.register_blueprint(metrics_bp)
+
+    @app.get("/items/<int:item_id>")
+    def item(item_id: int):
+        return jsonify({"id": item_id})
+
+    client = app.test_client()
+    labels = ("GET", "/items/<int:item_id>")
+    before = LATENCY.count(*labels)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    response = client.get(
+        "/metrics",
+        headers={"Authorization": "Bearer scrape-secret"},
+    )
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    assert LATENCY.count(*labels) == before + 2
+    assert REQUESTS.value(*labels, "200") >= 2
+    assert IN_FLIGHT.value() == 0
+    assert 'endpoint="/items/<int:item_id>"' in response.get_data(as_text=True)
+
+
+def test_metrics_route_requires_the_token(monkeypatch) -> None:
+    app = Flask(__name__)
+    app.register_blueprint(metrics_bp)
+    client = app.test_client()
+
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    unset = client.get("/metrics", headers={"Authorization": "Bearer "})
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+    anonymous = client.get("/metrics")
+    wrong = client.get("/metrics", headers={"Authorization": "Bearer nope"})
+
+    assert unset.status_code == 401
+    assert anonymous.status_code == 401
+    assert anonymous.headers["WWW-Authenticate"] == "Bearer"
+    assert wrong.status_code == 401
@@ -0,0 +1,74 @@
+import base64
+
+import pytest
+from flask import Flask, request
+
+from app.domain.pagination import PageRequest
+from app.infrastructure.repositories.sqlite_customer_repository import (
+    SQLiteCustomerRepository,
+)
+from app.interface.api.pagination import (
+    decode_cursor,
+    decode_search_cursor,
+    encode_cursor,
+    parse_page_request,
+)
+
+
+def test_cursor_round_trip() -> None:
+    assert decode_cursor(encode_cursor(42)) == 42
+
+
+def _cursor(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "abc",
+        "eyJ4IjoxfQ",
+        "bnVsbA",
+        _cursor('{"after":true}'),
+        _cursor('{"after":"1"}'),
+        _cursor('{"after":1.5}'),
+    ],
+)
+def test_decode_cursor_rejects_garbage(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_search_cursor_rejects_a_boolean_rank() -> None:
+    with pytest.raises(ValueError):
+        decode_search_cursor(_cursor('{"after":1,"rank":false}'))
+
+
+def test_fields_ignore_blank_names() -> None:
+    app = Flask(__name__)
+    allowed = ("id", "name", "email")
+
+    with app.test_request_context("/?fields=id, ,email,"):
+        page = parse_page_request(request, allowed)
+    with app.test_request_context("/?fields=,%20"):
+        with pytest.raises(ValueError):
+            parse_page_request(request, allowed)
+
+    assert page.fields == ("id", "email")
+
+
+def test_customer_repository_pages_by_id(tmp_path) -> None:
+    repository = SQLiteCustomerRepository(str(tmp_path / "customers.db"))
+
+    first = repository.list_customers_page(PageRequest(limit=1))
+    second = repository.list_customers_page(
+        PageRequest(limit=1, after=first.next_after, fields=("name",)),
+    )
+
+    assert first.items == [
+        {"id": 1, "name": "Ana Flask", "email": "ana@flask.com"},
+    ]
+    assert second.items == [{"name": "Bruno Flask"}]
+    assert second.next_after is None
+    repository.close()
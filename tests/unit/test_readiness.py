@@ -0,0 +1,131 @@
+import sqlite3
+
+import pytest
+from flask import Flask
+
+from app.core.warmup import Warmup
+from app.infrastructure.health.readiness import (
+    HealthSettings,
+    ReadinessProbe,
+    UnhealthyError,
+    executor_lag_check,
+    pool_check,
+)
+from app.infrastructure.sqlite.executor import SQLiteExecutor
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.infrastructure.sqlite.profile import StorageProfile
+from app.interface.api.health import health_bp
+
+SETTINGS = HealthSettings(check_timeout_seconds=0.1, max_pool_saturation=1.0)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SQLiteConnectionPool(
+        str(tmp_path / "ready.db"),
+        size=2,
+        profile=StorageProfile(journal_mode="DELETE"),
+    )
+    pool.write(lambda conn: conn.execute("CREATE TABLE t (id INTEGER)"))
+    yield pool
+    pool.close()
+
+
+def test_results_are_cached_between_probes() -> None:
+    calls = []
+    probe = ReadinessProbe(cache_seconds=60)
+    probe.add("counted", lambda: calls.append(1) or {})
+
+    first = probe.run()
+    second = probe.run()
+
+    assert first == second
+    assert first[0] is True
+    assert len(calls) == 1
+
+
+def test_a_failing_check_makes_the_probe_unready() -> None:
+    def broken() -> dict:
+        raise UnhealthyError("Too slow", lag_seconds=2.0)
+
+    probe = ReadinessProbe(cache_seconds=0)
+    probe.add("fine", dict)
+    probe.add("broken", broken)
+    probe.add("crashing", lambda: 1 / 0)
+
+    ready, report = probe.run()
+
+    assert not ready
+    assert report["fine"]["ok"]
+    assert report["broken"]["error"] == "Too slow"
+    assert report["broken"]["lag_seconds"] == 2.0
+    assert report["crashing"]["error"].startswith("ZeroDivisionError")
+
+
+def test_pool_check_reports_saturation(pool) -> None:
+    check = pool_check(lambda: pool, SETTINGS)
+
+    assert check() == {"saturation": 0.0}
+    held = [pool.acquire(), pool.acquire()]
+    with pytest.raises(UnhealthyError) as excinfo:
+        check()
+    assert excinfo.value.details == {"saturation": 1.0}
+    for conn in held:
+        pool.release(conn)
+
+
+def test_ping_notices_a_missing_or_locked_file(pool, tmp_path) -> None:
+    locker = sqlite3.connect(pool.db_path, isolation_level=None)
+    locker.execute("BEGIN EXCLUSIVE")
+    with pytest.raises(sqlite3.OperationalError):
+        pool.ping(timeout=0.05)
+    locker.execute("ROLLBACK")
+    locker.close()
+    pool.ping(timeout=0.05)
+
+    (tmp_path / "ready.db").unlink()
+    with pytest.raises(FileNotFoundError):
+        pool.ping(timeout=0.05)
+
+
+def test_executor_lag_check(tmp_path) -> None:
+    executor = SQLiteExecutor(str(tmp_path / "lag.db"), max_workers=1)
+
+    result = executor_lag_check(lambda: executor, SETTINGS)()
+
+    assert 0 <= result["lag_seconds"] < SETTINGS.max_lag_seconds
+    executor.close()
+
+
+def test_probe_routes() -> None:
+    app = Flask(__name__)
+    app.register_blueprint(health_bp)
+    warmup = Warmup()
+    app.extensions["warmup"] = warmup
+    probe = ReadinessProbe(cache_seconds=0)
+    healthy = [True]
+
+    def flaky() -> dict:
+        if not healthy[0]:
+            raise UnhealthyError("Down")
+        return {}
+
+    probe.add("store", flaky)
+    app.extensions["readiness"] = probe
+    client = app.test_client()
+
+    starting = client.get("/health/ready")
+    warmup.run()
+    ready = client.get("/health/ready")
+    healthy[0] = False
+    unavailable = client.get("/health/ready")
+    live = client.get("/health/live")
+
+    assert starting.status_code == 503
+    assert starting.get_json() == {"status": "starting"}
+    assert ready.status_code == 200
+    assert ready.headers["Cache-Control"] == "no-store"
+    assert ready.get_json()["checks"]["store"]["ok"]
+    assert unavailable.status_code == 503
+    assert unavailable.get_json()["status"] == "unavailable"
+    assert live.status_code == 200
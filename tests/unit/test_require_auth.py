@@ -0,0 +1,74 @@
+import pytest
+from flask import Flask, g, jsonify
+
+from app.core.dependencies import get_auth_service
+from app.infrastructure.repositories.sqlite_revocation_store import (
+    SQLiteRevocationStore,
+)
+from app.interface.api.auth import require_auth
+from app.interface.api.v1.routes import v1_bp
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+
+    @app.get("/secret")
+    @require_auth
+    def secret():
+        return jsonify({"sub": g.claims["sub"]})
+
+    return app.test_client()
+
+
+def test_missing_token_is_rejected(client) -> None:
+    response = client.get("/secret")
+
+    assert response.status_code == 401
+    assert response.get_json() == {"detail": "Missing bearer token"}
+
+
+def test_invalid_token_is_rejected(client) -> None:
+    response = client.get(
+        "/secret",
+        headers={"Authorization": "Bearer not-a-jwt"},
+    )
+
+    assert response.status_code == 401
+    assert response.get_json() == {"detail": "Invalid or expired token"}
+
+
+def test_valid_token_exposes_claims(client) -> None:
+    token = get_auth_service().issue_token("decorated-user")
+
+    response = client.get(
+        "/secret",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == {"sub": "decorated-user"}
+
+
+def test_logout_revokes_the_token(tmp_path, mocker) -> None:
+    store = SQLiteRevocationStore(str(tmp_path / "revoked.db"))
+    service = AuthService(revocations=store)
+    mocker.patch(
+        "app.interface.api.auth.get_auth_service", return_value=service
+    )
+    mocker.patch(
+        "app.interface.api.v1.routes.get_auth_service",
+        return_value=service,
+    )
+    app = Flask(__name__)
+    app.register_blueprint(v1_bp, url_prefix="/v1")
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {service.issue_token('bye')}"}
+
+    assert client.get("/v1/private", headers=headers).status_code == 200
+    assert client.post("/v1/auth/logout", headers=headers).status_code == 200
+    response = client.get("/v1/private", headers=headers)
+
+    assert response.status_code == 401
+    store.close()
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import jwt
+import pytest
+
+from app.infrastructure.cache.bloom import BloomFilter
+from app.infrastructure.repositories import sqlite_revocation_store
+from app.infrastructure.repositories.sqlite_revocation_store import (
+    SQLiteRevocationStore,
+)
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteRevocationStore(str(tmp_path / "revoked.db"), capacity=100)
+    yield store
+    store.close()
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+
+    assert all(f"jti-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_revoked_ids_are_reported(store) -> None:
+    store.revoke("abc", time.time() + 60)
+
+    assert store.is_revoked("abc")
+    assert not store.is_revoked("def")
+
+
+def test_revocations_from_other_processes_are_synced(tmp_path) -> None:
+    path = str(tmp_path / "revoked.db")
+    reader = SQLiteRevocationStore(path, sync_seconds=0)
+    writer = SQLiteRevocationStore(path)
+
+    writer.revoke("shared", time.time() + 60)
+
+    assert reader.is_revoked("shared")
+    reader.close()
+    writer.close()
+
+
+def test_expired_ids_are_pruned(tmp_path) -> None:
+    store = SQLiteRevocationStore(
+        str(tmp_path / "revoked.db"),
+        sync_seconds=0,
+        prune_seconds=0,
+    )
+    store.revoke("old", time.time() - 1)
+    store.revoke("live", time.time() + 60)
+
+    assert not store.is_revoked("old")
+    assert store.is_revoked("live")
+    store.close()
+
+
+def test_filter_grows_past_capacity(tmp_path) -> None:
+    path = str(tmp_path / "revoked.db")
+    store = SQLiteRevocationStore(path, capacity=10, sync_seconds=0)
+    writer = SQLiteRevocationStore(path)
+    for i in range(50):
+        writer.revoke(f"jti-{i}", time.time() + 60)
+
+    assert store.is_revoked("jti-49")
+    assert all(store.is_revoked(f"jti-{i}") for i in range(50))
+    writer.close()
+    store.close()
+
+
+def test_revoke_during_rebuild_lands_in_the_new_filter(
+    store,
+    monkeypatch,
+) -> None:
+    store.revoke("early", time.time() + 60)
+    snapshotting = threading.Event()
+    release = threading.Event()
+
+    class SlowBloom(BloomFilter):
+        def add(self, item: str) -> None:
+            snapshotting.set()
+            release.wait(5)
+            super().add(item)
+
+    monkeypatch.setattr(sqlite_revocation_store, "BloomFilter", SlowBloom)
+    rebuild = threading.Thread(target=store._rebuild)
+    rebuild.start()
+    assert snapshotting.wait(5)
+    # Commits while the rebuild reads its snapshot
+    revoke = threading.Thread(
+        target=store.revoke,
+        args=("late", time.time() + 60),
+    )
+    revoke.start()
+    time.sleep(0.05)
+    release.set()
+    rebuild.join(5)
+    revoke.join(5)
+
+    assert "early" in store._filter
+    assert "late" in store._filter
+
+
+def test_revoked_token_is_rejected_even_when_cached(store) -> None:
+    service = AuthService(revocations=store)
+    token = service.issue_token("revoked-user")
+    claims = service.decode_token(token)
+
+    service.revoke(claims)
+
+    with pytest.raises(jwt.InvalidTokenError):
+        service.decode_token(token)
+    other = service.issue_token("revoked-user")
+    assert service.decode_token(other)["jti"] != claims["jti"]
@@ -0,0 +1,57 @@
+import sqlite3
+
+from app.infrastructure.sqlite.bulk_load import bulk_load
+from app.infrastructure.sqlite.counts import install_row_count, read_row_count
+
+
+def test_counts_existing_rows_once_then_tracks_writes() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO items (name) VALUES (?)", [("a",), ("b",)])
+    install_row_count(conn, "items")
+    assert read_row_count(conn, "items") == 2
+
+    conn.execute("INSERT INTO items (name) VALUES ('c')")
+    conn.execute("UPDATE items SET name = 'z'")
+    conn.execute("DELETE FROM items WHERE name = 'z' AND id < 3")
+    install_row_count(conn, "items")
+
+    assert read_row_count(conn, "items") == 1
+    conn.close()
+
+
+def test_reinstall_does_not_count_the_table_again() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    install_row_count(conn, "items")
+    statements = []
+    conn.set_trace_callback(statements.append)
+
+    install_row_count(conn, "items")
+
+    assert statements
+    assert not [sql for sql in statements if "COUNT(*)" in sql]
+    conn.close()
+
+
+def test_bulk_load_adjusts_the_count() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    install_row_count(conn, "items")
+    conn.commit()
+
+    bulk_load(conn, "items", ("name",), ((str(i),) for i in range(100)))
+
+    assert read_row_count(conn, "items") == 100
+    conn.execute("DELETE FROM items WHERE id <= 10")
+    assert read_row_count(conn, "items") == 90
+    conn.close()
+
+
+def test_unknown_table_counts_zero() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    install_row_count(conn, "items")
+
+    assert read_row_count(conn, "missing") == 0
+    conn.close()
@@ -0,0 +1,108 @@
+import sqlite3
+
+import pytest
+
+from app.domain.pagination import PageRequest
+from app.infrastructure.repositories.sqlite_customer_repository import (
+    SQLiteCustomerRepository,
+)
+from app.infrastructure.sqlite.search import (
+    fetch_search_page,
+    install_search_index,
+    match_expression,
+)
+from app.interface.api.pagination import decode_search_cursor, encode_cursor
+
+COLUMNS = ("id", "name", "email")
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE people (id INTEGER PRIMARY KEY, name TEXT, email TEXT)",
+    )
+    conn.execute(
+        "INSERT INTO people (name, email) VALUES ('Ana Silva', 'ana@x.com')",
+    )
+    install_search_index(conn, "people", ("name", "email"))
+    yield conn
+    conn.close()
+
+
+def search(conn, query: str, **kwargs):
+    return fetch_search_page(
+        conn,
+        "people",
+        COLUMNS,
+        PageRequest(limit=10, query=query, **kwargs),
+    )
+
+
+def ids(page) -> list[int]:
+    return [item["id"] for item in page.items]
+
+
+def test_existing_rows_are_indexed(conn) -> None:
+    assert ids(search(conn, "silva")) == [1]
+
+
+def test_triggers_keep_the_index_in_sync(conn) -> None:
+    conn.execute(
+        "INSERT INTO people (name, email) VALUES ('José Souza', 'jo@y.com')",
+    )
+    conn.execute("UPDATE people SET name = 'Ana Costa' WHERE id = 1")
+
+    assert ids(search(conn, "jose")) == [2]
+    assert ids(search(conn, "silva")) == []
+    assert ids(search(conn, "cost")) == [1]
+
+    conn.execute("DELETE FROM people WHERE id = 2")
+    assert ids(search(conn, "souza")) == []
+
+
+def test_best_match_first_and_keyset_pages(conn) -> None:
+    conn.executemany(
+        "INSERT INTO people (name, email) VALUES (?, ?)",
+        [("Ana Ana", "ana.ana@x.com"), ("Anabela", "bela@x.com")],
+    )
+
+    first = fetch_search_page(
+        conn,
+        "people",
+        COLUMNS,
+        PageRequest(limit=2, query="ana"),
+    )
+    second = search(
+        conn,
+        "ana",
+        after=first.next_after,
+        after_rank=first.next_rank,
+    )
+
+    assert ids(first)[0] == 2
+    assert sorted(ids(first) + ids(second)) == [1, 2, 3]
+    assert second.next_after is None
+
+
+def test_query_operators_are_neutralised(conn) -> None:
+    assert match_expression('ana OR "x" NEAR(') == '"ana"* "or"* "x"* "near"*'
+    assert match_expression("  !!  ") is None
+    assert search(conn, "!!").items == []
+
+
+def test_search_cursor_round_trip() -> None:
+    assert decode_search_cursor(encode_cursor(7, -1.25)) == (7, -1.25)
+    with pytest.raises(ValueError):
+        decode_search_cursor(encode_cursor(7))
+
+
+def test_customer_repository_search(tmp_path) -> None:
+    repository = SQLiteCustomerRepository(str(tmp_path / "customers.db"))
+
+    page = repository.search_customers(PageRequest(limit=5, query="bruno"))
+
+    assert page.items == [
+        {"id": 2, "name": "Bruno Flask", "email": "bruno@flask.com"},
+    ]
+    repository.close()
@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+
+from app.domain.pagination import PageRequest
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.user.database import UserDatabase
+from app.user.models import UserRequest
+
+
+def test_connections_are_reused(tmp_path) -> None:
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=2)
+
+    with pool.connection() as conn:
+        first = conn
+    with pool.connection() as conn:
+        assert conn is first
+
+    pool.close()
+
+
+def test_pool_is_bounded(tmp_path) -> None:
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=1, timeout=0.05)
+
+    conn = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    pool.release(conn)
+    assert pool.acquire() is conn
+    pool.close()
+
+
+def test_waiting_checkout_gets_released_connection(tmp_path) -> None:
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=1, timeout=2)
+    conn = pool.acquire()
+    acquired = []
+
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    thread.start()
+    pool.release(conn)
+    thread.join()
+
+    assert acquired == [conn]
+    pool.close()
+
+
+def test_broken_connection_is_replaced(tmp_path) -> None:
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=1)
+
+    with pool.connection() as conn:
+        broken = conn
+    broken.close()
+
+    with pool.connection() as conn:
+        assert conn is not broken
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    pool.close()
+
+
+def test_release_rolls_back_open_transaction(tmp_path) -> None:
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=1)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    pool.close()
+
+
+def test_memory_database_uses_single_connection() -> None:
+    pool = SQLiteConnectionPool(":memory:", size=4)
+
+    assert pool.size == 1
+    pool.close()
+
+
+def test_closed_pool_rejects_checkout(tmp_path) -> None:
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"))
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_open_streams_do_not_hold_pooled_connections(tmp_path) -> None:
+    path = str(tmp_path / "stream.db")
+    pool = SQLiteConnectionPool(path, size=1, timeout=0.05)
+    db = UserDatabase(pool=pool)
+    UserDatabase.initialize_schema(pool)
+    for i in range(3):
+        db.create(UserRequest(name=f"U{i}", email=f"u{i}@x.com"))
+
+    streams = [db.iter_batches(PageRequest(limit=None)) for _ in range(3)]
+    for stream in streams:
+        next(stream)
+
+    assert pool.in_use == 0
+    assert db.count() == 3
+    for stream in streams:
+        stream.close()
+    pool.close()
@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+
+from app.infrastructure.sqlite.pool import SQLiteConnectionPool
+from app.infrastructure.sqlite.profile import StorageProfile, is_busy_error
+
+
+def test_profile_pragmas_applied_on_connect(tmp_path) -> None:
+    profile = StorageProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-2000,
+        temp_store="MEMORY",
+        busy_timeout_ms=1234,
+    )
+    pool = SQLiteConnectionPool(str(tmp_path / "p.db"), profile=profile)
+
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2000
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+
+    pool.close()
+
+
+def test_profile_rejects_unknown_pragma_values() -> None:
+    with pytest.raises(ValueError):
+        StorageProfile(journal_mode="WAL; DROP TABLE users")
+
+
+def test_retry_on_busy_retries_until_success() -> None:
+    profile = StorageProfile(write_retries=3, retry_backoff_ms=0)
+    calls = []
+
+    def operation() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise sqlite3.OperationalError("database is locked")
+        return "done"
+
+    assert profile.retry_on_busy(operation) == "done"
+    assert len(calls) == 3
+
+
+def test_retry_on_busy_gives_up_after_limit() -> None:
+    profile = StorageProfile(write_retries=2, retry_backoff_ms=0)
+    calls = []
+
+    def operation() -> None:
+        calls.append(1)
+        raise sqlite3.OperationalError("database is locked")
+
+    with pytest.raises(sqlite3.OperationalError):
+        profile.retry_on_busy(operation)
+    assert len(calls) == 3
+
+
+def test_retry_on_busy_does_not_retry_other_errors() -> None:
+    profile = StorageProfile(write_retries=3, retry_backoff_ms=0)
+    calls = []
+
+    def operation() -> None:
+        calls.append(1)
+        raise sqlite3.OperationalError("no such table: users")
+
+    with pytest.raises(sqlite3.OperationalError):
+        profile.retry_on_busy(operation)
+    assert len(calls) == 1
+    assert not is_busy_error(sqlite3.OperationalError("no such table"))
+
+
+def test_reads_proceed_while_write_is_open(tmp_path) -> None:
+    pool = SQLiteConnectionPool(
+        str(tmp_path / "p.db"),
+        size=2,
+        profile=StorageProfile(journal_mode="WAL", busy_timeout_ms=0),
+    )
+    pool.write(lambda conn: conn.execute("CREATE TABLE t (x INTEGER)"))
+
+    writer = pool.acquire()
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("INSERT INTO t VALUES (1)")
+    with pool.connection() as reader:
+        assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    writer.commit()
+    pool.release(writer)
+
+    pool.close()
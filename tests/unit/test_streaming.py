@@ -0,0 +1,49 @@
+import json
+
+from flask import Flask, request
+
+from app.interface.api.streaming import (
+    JSON,
+    NDJSON,
+    negotiate_stream,
+    stream_response,
+)
+
+BATCHES = [[{"id": 1}, {"id": 2}], [], [{"id": 3}]]
+
+
+def test_ndjson_stream_writes_one_object_per_line() -> None:
+    response = stream_response(iter(BATCHES), NDJSON)
+
+    assert response.mimetype == NDJSON
+    assert response.is_streamed
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1},
+        {"id": 2},
+        {"id": 3},
+    ]
+
+
+def test_json_stream_writes_a_valid_array() -> None:
+    response = stream_response(iter(BATCHES), JSON)
+
+    assert json.loads(response.get_data()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_json_stream_of_nothing_is_empty_array() -> None:
+    response = stream_response(iter([]), JSON)
+
+    assert response.get_data(as_text=True) == "[]"
+
+
+def test_negotiate_stream() -> None:
+    app = Flask(__name__)
+    cases = [
+        ({"Accept": NDJSON}, "", NDJSON),
+        ({"Accept": "application/json"}, "?stream=true", JSON),
+        ({"Accept": "*/*"}, "", None),
+    ]
+    for headers, query, expected in cases:
+        with app.test_request_context(f"/{query}", headers=headers):
+            assert negotiate_stream(request) == expected
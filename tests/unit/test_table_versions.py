@@ -0,0 +1,33 @@
+import sqlite3
+
+from app.infrastructure.sqlite.versions import (
+    install_version_tracking,
+    read_version,
+)
+
+
+def test_triggers_bump_version_on_every_write() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    install_version_tracking(conn, "items")
+    start = read_version(conn, "items")
+
+    conn.execute("INSERT INTO items (name) VALUES ('a')")
+    conn.execute("UPDATE items SET name = 'b'")
+    conn.execute("DELETE FROM items")
+
+    end = read_version(conn, "items")
+    assert end.version == start.version + 3
+    assert end.modified_at >= start.modified_at
+    conn.close()
+
+
+def test_install_is_idempotent() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    install_version_tracking(conn, "items")
+    conn.execute("INSERT INTO items DEFAULT VALUES")
+    install_version_tracking(conn, "items")
+
+    assert read_version(conn, "items").version == 1
+    conn.close()
@@ -0,0 +1,100 @@
+import subprocess
+import sys
+import threading
+
+from flask import Flask, jsonify
+
+from app import install_warmup
+from app.core.warmup import Warmup, WarmupSettings
+from app.infrastructure.profiling.startup import (
+    package_totals,
+    parse_importtime,
+)
+from app.interface.api.health import health_bp
+
+
+def test_steps_run_in_order_and_failures_are_recorded() -> None:
+    calls = []
+    warmup = Warmup()
+    warmup.add("first", lambda: calls.append("first"))
+    warmup.add("broken", lambda: 1 / 0)
+    warmup.add("last", lambda: calls.append("last"))
+
+    warmup.run()
+
+    assert warmup.done
+    assert calls == ["first", "last"]
+    assert list(warmup.durations) == ["first", "broken", "last"]
+    assert warmup.errors == {"broken": "ZeroDivisionError: division by zero"}
+
+
+def test_background_warmup_holds_requests_until_done() -> None:
+    release = threading.Event()
+    app = Flask(__name__)
+    app.register_blueprint(health_bp)
+
+    @app.route("/work")
+    def work():
+        return jsonify({"warm": warmup.done})
+
+    warmup = Warmup()
+    warmup.add("slow", lambda: release.wait(5))
+    install_warmup(app, warmup, WarmupSettings(mode="background"))
+    client = app.test_client()
+
+    alive = client.get("/health")
+    starting = client.get("/health/ready")
+    release.set()
+    held = client.get("/work")
+    ready = client.get("/health/ready")
+
+    assert alive.status_code == 200
+    assert starting.status_code == 503
+    assert starting.get_json()["status"] == "starting"
+    assert held.get_json() == {"warm": True}
+    assert ready.status_code == 200
+
+
+def test_sync_warmup_leaves_the_spec_lazy() -> None:
+    from app import create_app
+
+    app = create_app()
+
+    durations = app.extensions["warmup"].durations
+    assert "users_db" in durations
+    assert "docs_spec" not in durations
+
+
+def test_importing_a_submodule_does_not_build_the_app() -> None:
+    code = (
+        "import sys, app.core.warmup; "
+        "assert app._app is None; "
+        "assert 'flask' not in sys.modules; "
+        "assert 'app.interface.api.v1.routes' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_parse_importtime_and_package_totals() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       150 |        150 |     jwt.exceptions",
+            "import time:      1000 |       1150 |   jwt",
+            "noise from the child",
+            "import time:      2500 |       2500 | flask",
+        ],
+    )
+
+    records = parse_importtime(stderr)
+
+    assert [record.module for record in records] == [
+        "jwt.exceptions",
+        "jwt",
+        "flask",
+    ]
+    assert records[1].cumulative_seconds == 0.00115
+    assert package_totals(records).most_common() == [
+        ("flask", 0.0025),
+        ("jwt", 0.00115),
+    ]